@@ -1,9 +1,18 @@
+import time
+rerun_started = time.perf_counter()
+
 import streamlit as st
-import yaml
 import json
 from pathlib import Path
 from datetime import datetime
 import showcase_manager as sm
+import atomic_io
+import autosave
+import instrumentation
+import storage
+import yaml_backend
+# Imported where used, on the rare actions that need them: doyoubuzz_converter
+# (export/import), showcase_search, skills_matrix (NumPy), showcase_rebase
 
 # Page config
 st.set_page_config(
@@ -12,48 +21,54 @@ st.set_page_config(
     layout="wide"
 )
 
+# Storage backend shared by all sessions (DC_STORAGE, YAML files by default)
+store = storage.default_store()
+
+# One listing per rerun (memoised on the directory mtime by the YAML backend)
+showcases = store.list()
+
 # Initialize current showcase in session state
 if 'current_showcase' not in st.session_state:
-    showcases = sm.list_showcases()
     st.session_state.current_showcase = showcases[0] if showcases else 'baseline'
 
-# Dynamic file paths based on current showcase
-YAML_FILE = sm.get_showcase_path(st.session_state.current_showcase)
-JSON_EXPORT = Path("showcase.json")
-
-# Load data
-def load_yaml(file_path):
-    """Load YAML file"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    except Exception as e:
-        st.error(f"Error loading YAML: {e}")
-        return None
-
-def save_yaml(data, file_path):
-    """Save data to YAML file"""
-    try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, allow_unicode=True, sort_keys=False, default_flow_style=False, width=float('inf'))
-        return True
-    except Exception as e:
-        st.error(f"Error saving YAML: {e}")
-        return False
-
-def export_json(data, file_path):
-    """Export data to JSON file"""
-    try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        return True
-    except Exception as e:
-        st.error(f"Error exporting JSON: {e}")
-        return False
+def open_showcase(name):
+    """Make ``name`` the edited showcase and track its saved state"""
+    st.session_state.current_showcase = name
+    st.session_state.data = store.load(name)
+    st.session_state.saver.track(name, st.session_state.data)
+
+@st.fragment(run_every=2)
+def save_status():
+    """Unsaved sections and autosave, refreshed on its own every couple of seconds"""
+    saver = st.session_state.saver
+    data = st.session_state.data
+    if data is None:
+        return
+    autosave_on = st.toggle("Autosave", key="autosave_enabled", help=f"Save {autosave.AUTOSAVE_DELAY:.0f}s after the last edit, in the background")
+    dirty = saver.dirty(data)
+    if dirty and autosave_on:
+        saver.schedule(data)
+    if saver.last_error:
+        st.error(saver.last_error)
+    if not dirty:
+        st.caption("✅ All changes saved")
+        return
+    labels = []
+    for key in dirty:
+        if key.startswith("experience/"):
+            idx = int(key.split("/")[1])
+            exp = data['experience'][idx] if idx < len(data.get('experience') or []) else None
+            labels.append(f"experience: {exp.get('title', 'Untitled')}" if exp else "experience (removed)")
+        else:
+            labels.append(key)
+    state = "autosaving…" if saver.pending else "unsaved"
+    st.caption(f"✏️ {len(dirty)} {state}: " + ", ".join(labels))
 
 # Initialize session state
+if 'saver' not in st.session_state:
+    st.session_state.saver = autosave.Autosaver(save=store.save)
 if 'data' not in st.session_state:
-    st.session_state.data = sm.load_showcase(st.session_state.current_showcase)
+    open_showcase(st.session_state.current_showcase)
 
 # Header
 st.title(f"📄 DoYouBuzz Showcase Editor")
@@ -64,7 +79,6 @@ st.markdown("---")
 with st.sidebar:
     # Showcase selector
     st.header("🎯 Showcase")
-    showcases = sm.list_showcases()
     
     if showcases:
         current_idx = showcases.index(st.session_state.current_showcase) if st.session_state.current_showcase in showcases else 0
@@ -76,18 +90,44 @@ with st.sidebar:
         )
         
         if selected != st.session_state.current_showcase:
-            st.session_state.current_showcase = selected
-            st.session_state.data = sm.load_showcase(selected)
+            open_showcase(selected)
             st.rerun()
-    
+
+        # Metadata comes from the sidecar index, no YAML parsing involved
+        info = store.info(st.session_state.current_showcase)
+        if info.get('created_from'):
+            st.caption(f"From **{info['created_from']}** · {info.get('description') or 'no description'} · {info['size_kb']:.0f} KB")
+
+    # Full-text search over every showcase (inverted index kept in memory, only
+    # re-checked when the store changed since the last rerun)
+    search_query = st.text_input("🔎 Search all showcases", placeholder="e.g. Iceberg")
+    if search_query:
+        import showcase_search
+        hits = showcase_search.search(search_query)
+        by_showcase = {}
+        for hit in hits:
+            by_showcase.setdefault(hit['showcase'], []).append(hit)
+        st.caption(f"{len(hits)} matches in {len(by_showcase)} showcases")
+        for name, places in list(by_showcase.items())[:10]:
+            where = ", ".join(
+                f"{p['label']} · {p['field']}" if p['label'] else p['field'] for p in places[:3]
+            )
+            more = f" (+{len(places) - 3})" if len(places) > 3 else ""
+            if st.button(f"📄 {name}", key=f"search_hit_{name}", help=where + more):
+                open_showcase(name)
+                st.rerun()
+            st.caption(where + more)
+
     # Create variant button
     with st.expander("➕ Create Variant"):
         variant_name = st.text_input("Variant name (e.g., 'frontend', 'backend')")
         variant_desc = st.text_input("Description (optional)")
+        variant_delta = st.checkbox("Store only changes (delta)", help="Keep just the edits against a shared snapshot of the source instead of a full copy")
         if st.button("Create") and variant_name:
-            if sm.create_variant(st.session_state.current_showcase, variant_name, variant_desc):
+            if store.create_variant(st.session_state.current_showcase, variant_name, variant_desc, delta=variant_delta):
                 st.success(f"✅ Created variant: {variant_name}")
-                st.session_state.current_showcase = variant_name
+                # Edit the variant itself (keeps its _variant_info / delta storage on save)
+                open_showcase(variant_name)
                 st.rerun()
             else:
                 st.error("❌ Failed to create variant (may already exist)")
@@ -96,49 +136,373 @@ with st.sidebar:
     if st.session_state.current_showcase != 'baseline':
         if st.button("🗑️ Delete This Showcase", type="secondary"):
             if st.checkbox("Confirm delete"):
-                if sm.delete_showcase(st.session_state.current_showcase):
+                # A pending autosave would recreate the file
+                st.session_state.saver.cancel()
+                if store.delete(st.session_state.current_showcase):
                     st.success("Deleted!")
-                    st.session_state.current_showcase = 'baseline'
+                    open_showcase('baseline')
                     st.rerun()
     
     st.markdown("---")
     st.header("Navigation")
     section = st.radio(
         "Choose section to edit:",
-        ["Personal Info", "Summary", "Skills", "Experience", "Certifications", "Languages", "Export/Import"]
+        ["Personal Info", "Summary", "Skills", "Experience", "Certifications", "Languages", "Changes", "Skills Matrix", "Export/Import"]
     )
     
     st.markdown("---")
     st.header("Actions")
     
     if st.button("💾 Save to YAML", type="primary"):
-        if sm.save_showcase(st.session_state.current_showcase, st.session_state.data):
+        # Only sections whose content hash changed count; nothing changed means no write
+        if not st.session_state.saver.dirty(st.session_state.data):
+            st.info("No changes to save")
+        elif st.session_state.saver.save(st.session_state.data):
             st.success(f"✅ Saved {st.session_state.current_showcase} successfully!")
-            st.info(f"File size: {YAML_FILE.stat().st_size} bytes")
+            st.info(f"Size: {store.info(st.session_state.current_showcase).get('size_kb', 0):.1f} KB")
         else:
             st.error("❌ Save failed!")
+    save_status()
     
     if st.button("📥 Export to DoYouBuzz JSON"):
-        # Use doyoubuzz_converter for proper format
-        import subprocess
-        yaml_path = str(sm.get_showcase_path(st.session_state.current_showcase))
+        # Convert the in-memory showcase with doyoubuzz_converter (same logic as the yaml2json CLI)
+        import doyoubuzz_converter as dyb
         export_name = f"{st.session_state.current_showcase}_export.json"
-        original_json = str(sm.get_showcase_path(st.session_state.current_showcase).with_suffix('.original.json'))
-        
-        result = subprocess.run([
-            'python', 'doyoubuzz_converter.py', 'yaml2json',
-            yaml_path, export_name, original_json
-        ], capture_output=True, text=True)
-        if result.returncode == 0:
-            st.success(f"✅ Exported to {export_name} (DoYouBuzz compatible)")
+        original_json = str(store.sidecar_path(f"{st.session_state.current_showcase}.original.json"))
+
+        # Served from the export cache when this content was already exported
+        result = dyb.export_showcase(st.session_state.data, original_json,
+                                     cache_dir=store.sidecar_path('.exports'), compress=True)
+        if result['ok']:
+            export_path = Path(export_name)
+            if not (export_path.exists() and export_path.read_bytes() == result['json']):
+                atomic_io.atomic_write(export_path, result['json'])
+            st.success(f"✅ Exported to {export_name} (DoYouBuzz compatible)"
+                       + (" · unchanged, served from cache" if result['cached'] else ""))
+            st.download_button(
+                label="📥 Download export",
+                data=result['json'],
+                file_name=export_name,
+                mime="application/json"
+            )
+            st.download_button(
+                label="📦 Download compressed (.gz)",
+                data=result['gzip'],
+                file_name=f"{export_name}.gz",
+                mime="application/gzip"
+            )
         else:
-            st.error(f"Export failed: {result.stderr}")
+            st.error(f"Export failed: {result['error']['type']}: {result['error']['message']}")
     
     if st.button("🔄 Reload from file"):
-        # Force reload by clearing any cache
-        st.session_state.data = sm.load_showcase(st.session_state.current_showcase)
+        # Re-read from disk (served from the parse cache if the file is unchanged)
+        open_showcase(st.session_state.current_showcase)
         st.success("✅ Reloaded from file!")
         st.rerun()
+    
+    # Last timed operations (parse, transform, serialise, file I/O) of this server
+    with st.expander("🩺 Diagnostics"):
+        records = instrumentation.recent(50)
+        if not instrumentation.ENABLED:
+            st.caption("Instrumentation is disabled (DC_INSTRUMENTATION=0)")
+        elif not records:
+            st.caption("No operations recorded yet")
+        else:
+            st.dataframe(
+                [{**r, 'at': datetime.fromtimestamp(r['at']).strftime('%H:%M:%S')} for r in records],
+                hide_index=True
+            )
+            if st.button("Clear", key="clear_diagnostics"):
+                instrumentation.clear()
+                st.rerun()
+
+# Long lists are rendered lazily: only one page of skill categories and
+# certifications, and only the experiences opened from the header list
+PAGE_SIZE = 10
+OPEN_EXPERIENCES_KEY = "open_experiences"
+
+def paginate(count, key, page_size=PAGE_SIZE):
+    """Indices of the current page of ``count`` items (adds a page picker when needed)"""
+    pages = max(1, -(-count // page_size))
+    page = 1
+    if pages > 1:
+        page_key = f"page_{key}"
+        # The list may have shrunk since the page was picked
+        if st.session_state.get(page_key, 1) > pages:
+            st.session_state[page_key] = pages
+        page = st.number_input(f"Page (1-{pages})", min_value=1, max_value=pages, value=1, step=1, key=page_key)
+        st.caption(f"{count} items · showing {(page - 1) * page_size + 1}-{min(page * page_size, count)}")
+    start = (page - 1) * page_size
+    return range(start, min(start + page_size, count))
+
+def experience_header(exp):
+    """One-line label of an experience"""
+    dates = " - ".join(d for d in (exp.get('start_date'), exp.get('end_date')) if d)
+    label = f"🏢 {exp.get('title', 'Untitled')} @ {exp.get('company', 'Unknown')}"
+    return f"{label} ({dates})" if dates else label
+
+def experience_matches(exp, query):
+    """Whether the search text appears in the experience header, context or entries"""
+    texts = [exp.get('title'), exp.get('company'), exp.get('location'), exp.get('context')]
+    for kind in ('missions', 'results', 'environments'):
+        for entry in exp.get(kind) or []:
+            texts.append(entry.get('description') if isinstance(entry, dict) else entry)
+    return any(query in str(t).lower() for t in texts if t)
+
+def show_changes(changes, limit=None):
+    """Render sm.diff_showcases output side by side (old | new)"""
+    icons = {'added': '➕', 'removed': '➖', 'changed': '✏️'}
+    for change in changes[:limit]:
+        label = f"{icons[change['op']]} {change['path']}"
+        if change['field']:
+            label += f" · {change['field']}"
+        st.markdown(f"**{label}**")
+        col1, col2 = st.columns(2)
+        with col1:
+            if change['old'] is not None:
+                st.code(str(change['old']), language=None)
+        with col2:
+            if change['new'] is not None:
+                st.code(str(change['new']), language=None)
+    if limit is not None and len(changes) > limit:
+        st.caption(f"... and {len(changes) - limit} more changes")
+
+# Section editors run as fragments: a widget interaction inside one only
+# reruns that fragment, not the whole editor. Deleting the record itself
+# changes the list, so that falls back to a full app rerun.
+
+@st.fragment
+def skill_category_editor(idx):
+    """Editor for one skill category (reruns on its own)"""
+    data = st.session_state.data
+    skill_cat = data['skills'][idx]
+    with st.expander(f"📦 {skill_cat['category']}", expanded=False):
+        skill_cat['category'] = st.text_input(f"Category name", skill_cat['category'], key=f"cat_{idx}")
+
+        # Items
+        st.markdown("**Skills in this category:**")
+        items = skill_cat.get('items', [])
+
+        # Edit existing items
+        for item_idx, item in enumerate(items):
+            # Handle both new dict format and old string format
+            if isinstance(item, dict):
+                skill_name = item.get('name', '')
+                skill_level = item.get('level', 0)
+            else:
+                # Old string format: "Skill (80%)" or just "Skill"
+                item_str = str(item)
+                if '(' in item_str and ')' in item_str:
+                    skill_name = item_str.split('(')[0].strip()
+                    level_str = item_str.split('(')[1].split(')')[0].replace('%', '').strip()
+                    skill_level = int(level_str) if level_str.isdigit() else 0
+                else:
+                    skill_name = item_str
+                    skill_level = 0
+
+            col1, col2, col3 = st.columns([3, 1, 1])
+            with col1:
+                new_name = st.text_input(f"Skill {item_idx + 1}", skill_name, key=f"skill_{idx}_{item_idx}", label_visibility="collapsed")
+            with col2:
+                new_level = st.number_input("Level %", value=skill_level, min_value=0, max_value=100, step=5, key=f"level_{idx}_{item_idx}", label_visibility="collapsed")
+            with col3:
+                if st.button("🗑️", key=f"del_{idx}_{item_idx}"):
+                    skill_cat['items'].pop(item_idx)
+                    st.rerun(scope="fragment")
+
+            # Update the item with new values, preserving metadata
+            if isinstance(item, dict):
+                skill_cat['items'][item_idx]['name'] = new_name
+                skill_cat['items'][item_idx]['level'] = new_level
+            else:
+                # Convert old format to new format
+                skill_cat['items'][item_idx] = {'name': new_name, 'level': new_level}
+
+        # Add new item
+        st.markdown("**Add new skill:**")
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            new_item_name = st.text_input("Skill name", key=f"new_skill_name_{idx}")
+        with col2:
+            new_item_level = st.number_input("Level %", value=0, min_value=0, max_value=100, step=5, key=f"new_skill_level_{idx}")
+
+        if st.button("Add Skill", key=f"add_skill_{idx}") and new_item_name:
+            skill_cat['items'].append({'name': new_item_name, 'level': new_item_level})
+            st.rerun(scope="fragment")
+
+        # Delete category
+        if st.button("🗑️ Delete Category", key=f"del_cat_{idx}"):
+            data['skills'].pop(idx)
+            st.rerun()
+
+
+@st.fragment
+def experience_editor(idx, expanded=False):
+    """Editor for one experience (reruns on its own)"""
+    data = st.session_state.data
+    exp = data['experience'][idx]
+    with st.expander(f"🏢 {exp.get('title', 'Untitled')} @ {exp.get('company', 'Unknown')}", expanded=expanded):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            exp['title'] = st.text_input("Job Title", exp.get('title', ''), key=f"exp_title_{idx}")
+            exp['company'] = st.text_input("Company", exp.get('company', ''), key=f"exp_company_{idx}")
+            exp['location'] = st.text_input("Location", exp.get('location', ''), key=f"exp_location_{idx}")
+
+        with col2:
+            exp['start_date'] = st.text_input("Start Date", exp.get('start_date', ''), key=f"exp_start_{idx}")
+            exp['end_date'] = st.text_input("End Date", exp.get('end_date', ''), key=f"exp_end_{idx}")
+
+        exp['context'] = st.text_area("Context / Description", exp.get('context', exp.get('description', '')), key=f"exp_ctx_{idx}", height=150)
+
+        # Missions
+        st.markdown("**Missions:**")
+        missions = exp.get('missions', exp.get('achievements', []))
+        if not isinstance(missions, list):
+            missions = []
+        new_missions = []
+
+        for mis_idx, mission in enumerate(missions):
+            # Handle both dict (with _dyb_id and any other metadata) and string formats
+            if isinstance(mission, dict):
+                mission_text = mission.get('description', '')
+                mission_meta = {k: v for k, v in mission.items() if k != 'description'}
+            else:
+                mission_text = str(mission)
+                mission_meta = {}
+
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                new_mis = st.text_area(f"Mission {mis_idx + 1}", mission_text, key=f"mis_{idx}_{mis_idx}", height=120, label_visibility="collapsed")
+                if new_mis:
+                    # Preserve metadata if it exists
+                    if mission_meta.get('_dyb_id'):
+                        new_missions.append({'description': new_mis, **mission_meta})
+                    else:
+                        new_missions.append(new_mis)
+            with col2:
+                st.markdown("<br>", unsafe_allow_html=True)  # Align delete button
+                if st.button("🗑️", key=f"del_mis_{idx}_{mis_idx}"):
+                    exp['missions'].pop(mis_idx)
+                    st.rerun(scope="fragment")
+
+        exp['missions'] = new_missions
+
+        # Add new mission
+        new_mis_input = st.text_area("Add new mission", key=f"new_mis_{idx}", height=120)
+        if st.button("Add Mission", key=f"add_mis_{idx}") and new_mis_input:
+            exp['missions'].append(new_mis_input)
+            st.rerun(scope="fragment")
+
+        # Results
+        st.markdown("**Results:**")
+        results = exp.get('results', [])
+        if not isinstance(results, list):
+            results = []
+        new_results = []
+
+        for res_idx, result in enumerate(results):
+            # Handle both dict (with _dyb_id and any other metadata) and string formats
+            if isinstance(result, dict):
+                result_text = result.get('description', '')
+                result_meta = {k: v for k, v in result.items() if k != 'description'}
+            else:
+                result_text = str(result)
+                result_meta = {}
+
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                new_res = st.text_area(f"Result {res_idx + 1}", result_text, key=f"res_{idx}_{res_idx}", height=100, label_visibility="collapsed")
+                if new_res:
+                    # Preserve metadata if it exists
+                    if result_meta.get('_dyb_id'):
+                        new_results.append({'description': new_res, **result_meta})
+                    else:
+                        new_results.append(new_res)
+            with col2:
+                st.markdown("<div style='margin-top: 8px;'></div>", unsafe_allow_html=True)
+                if st.button("🗑️", key=f"del_res_{idx}_{res_idx}"):
+                    exp['results'].pop(res_idx)
+                    st.rerun(scope="fragment")
+
+        exp['results'] = new_results
+
+        # Add new result
+        new_res_input = st.text_area("Add new result", key=f"new_res_{idx}", height=100)
+        if st.button("Add Result", key=f"add_res_{idx}") and new_res_input:
+            exp['results'].append(new_res_input)
+            st.rerun(scope="fragment")
+
+        # Environments
+        st.markdown("**Technical Environments:**")
+        environments = exp.get('environments', [])
+        if not isinstance(environments, list):
+            environments = []
+        new_envs = []
+
+        for env_idx, environment in enumerate(environments):
+            # Handle both dict (with _dyb_id and any other metadata) and string formats
+            if isinstance(environment, dict):
+                env_text = environment.get('description', '')
+                env_meta = {k: v for k, v in environment.items() if k != 'description'}
+            else:
+                env_text = str(environment)
+                env_meta = {}
+
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                new_env = st.text_area(f"Environment {env_idx + 1}", env_text, key=f"env_{idx}_{env_idx}", height=100, label_visibility="collapsed")
+                if new_env:
+                    # Preserve metadata if it exists
+                    if env_meta.get('_dyb_id'):
+                        new_envs.append({'description': new_env, **env_meta})
+                    else:
+                        new_envs.append(new_env)
+            with col2:
+                if st.button("🗑️", key=f"del_env_{idx}_{env_idx}"):
+                    exp['environments'].pop(env_idx)
+                    st.rerun(scope="fragment")
+
+        exp['environments'] = new_envs
+
+        # Add new environment
+        new_env_input = st.text_area("Add new environment", key=f"new_env_{idx}", height=100)
+        if st.button("Add Environment", key=f"add_env_{idx}") and new_env_input:
+            exp['environments'].append(new_env_input)
+            st.rerun(scope="fragment")
+
+        # Clean up old fields for backward compatibility
+        if 'achievements' in exp and 'missions' not in exp:
+            exp['missions'] = exp.pop('achievements')
+        if 'description' in exp and 'context' not in exp:
+            exp['context'] = exp.pop('description')
+
+        # Delete experience
+        if st.button("🗑️ Delete Experience", key=f"del_exp_{idx}"):
+            data['experience'].pop(idx)
+            # Opened experiences are tracked by index, which just shifted
+            st.session_state.pop(OPEN_EXPERIENCES_KEY, None)
+            st.rerun()
+
+
+@st.fragment
+def certification_editor(idx):
+    """Editor for one certification (reruns on its own)"""
+    data = st.session_state.data
+    cert = data['certifications'][idx]
+    with st.expander(f"🏆 {cert.get('name', 'Untitled')}"):
+        col1, col2 = st.columns(2)
+        with col1:
+            cert['name'] = st.text_input("Name", cert.get('name', ''), key=f"cert_name_{idx}")
+            cert['issuer'] = st.text_input("Issuer", cert.get('issuer', ''), key=f"cert_issuer_{idx}")
+        with col2:
+            cert['date'] = st.text_input("Date", cert.get('date', ''), key=f"cert_date_{idx}")
+            cert['credential_url'] = st.text_input("URL", cert.get('credential_url', ''), key=f"cert_url_{idx}")
+
+        if st.button("🗑️ Delete Certification", key=f"del_cert_{idx}"):
+            data['certifications'].pop(idx)
+            st.rerun()
+
 
 # Main content area
 if st.session_state.data is None:
@@ -184,67 +548,10 @@ else:
                 st.success(f"Added category: {new_category}")
                 st.rerun()
         
-        # Edit existing skills
-        for idx, skill_cat in enumerate(data['skills']):
-            with st.expander(f"📦 {skill_cat['category']}", expanded=False):
-                skill_cat['category'] = st.text_input(f"Category name", skill_cat['category'], key=f"cat_{idx}")
-                
-                # Items
-                st.markdown("**Skills in this category:**")
-                items = skill_cat.get('items', [])
-                
-                # Edit existing items
-                for item_idx, item in enumerate(items):
-                    # Handle both new dict format and old string format
-                    if isinstance(item, dict):
-                        skill_name = item.get('name', '')
-                        skill_level = item.get('level', 0)
-                    else:
-                        # Old string format: "Skill (80%)" or just "Skill"
-                        item_str = str(item)
-                        if '(' in item_str and ')' in item_str:
-                            skill_name = item_str.split('(')[0].strip()
-                            level_str = item_str.split('(')[1].split(')')[0].replace('%', '').strip()
-                            skill_level = int(level_str) if level_str.isdigit() else 0
-                        else:
-                            skill_name = item_str
-                            skill_level = 0
-                    
-                    col1, col2, col3 = st.columns([3, 1, 1])
-                    with col1:
-                        new_name = st.text_input(f"Skill {item_idx + 1}", skill_name, key=f"skill_{idx}_{item_idx}", label_visibility="collapsed")
-                    with col2:
-                        new_level = st.number_input("Level %", value=skill_level, min_value=0, max_value=100, step=5, key=f"level_{idx}_{item_idx}", label_visibility="collapsed")
-                    with col3:
-                        if st.button("🗑️", key=f"del_{idx}_{item_idx}"):
-                            skill_cat['items'].pop(item_idx)
-                            st.rerun()
-                    
-                    # Update the item with new values, preserving metadata
-                    if isinstance(item, dict):
-                        skill_cat['items'][item_idx]['name'] = new_name
-                        skill_cat['items'][item_idx]['level'] = new_level
-                    else:
-                        # Convert old format to new format
-                        skill_cat['items'][item_idx] = {'name': new_name, 'level': new_level}
-                
-                # Add new item
-                st.markdown("**Add new skill:**")
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    new_item_name = st.text_input("Skill name", key=f"new_skill_name_{idx}")
-                with col2:
-                    new_item_level = st.number_input("Level %", value=0, min_value=0, max_value=100, step=5, key=f"new_skill_level_{idx}")
-                
-                if st.button("Add Skill", key=f"add_skill_{idx}") and new_item_name:
-                    skill_cat['items'].append({'name': new_item_name, 'level': new_item_level})
-                    st.rerun()
-                
-                # Delete category
-                if st.button("🗑️ Delete Category", key=f"del_cat_{idx}"):
-                    data['skills'].pop(idx)
-                    st.rerun()
-    
+        # Edit existing skills (one page at a time)
+        for idx in paginate(len(data['skills']), 'skills'):
+            skill_category_editor(idx)
+
     # Experience Section
     elif section == "Experience":
         st.header("💼 Professional Experience")
@@ -268,152 +575,23 @@ else:
             
             if st.button("Add Experience") and new_exp['title'] and new_exp['company']:
                 data['experience'].insert(0, new_exp)
+                st.session_state[OPEN_EXPERIENCES_KEY] = [0]
                 st.success("Added new experience!")
                 st.rerun()
         
-        # Edit existing experiences
-        for idx, exp in enumerate(data['experience']):
-            with st.expander(f"🏢 {exp.get('title', 'Untitled')} @ {exp.get('company', 'Unknown')}", expanded=False):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    exp['title'] = st.text_input("Job Title", exp.get('title', ''), key=f"exp_title_{idx}")
-                    exp['company'] = st.text_input("Company", exp.get('company', ''), key=f"exp_company_{idx}")
-                    exp['location'] = st.text_input("Location", exp.get('location', ''), key=f"exp_location_{idx}")
-                
-                with col2:
-                    exp['start_date'] = st.text_input("Start Date", exp.get('start_date', ''), key=f"exp_start_{idx}")
-                    exp['end_date'] = st.text_input("End Date", exp.get('end_date', ''), key=f"exp_end_{idx}")
-                
-                exp['context'] = st.text_area("Context / Description", exp.get('context', exp.get('description', '')), key=f"exp_ctx_{idx}", height=150)
-                
-                # Missions
-                st.markdown("**Missions:**")
-                missions = exp.get('missions', exp.get('achievements', []))
-                if not isinstance(missions, list):
-                    missions = []
-                new_missions = []
-                
-                for mis_idx, mission in enumerate(missions):
-                    # Handle both dict (with _dyb_id) and string formats
-                    if isinstance(mission, dict):
-                        mission_text = mission.get('description', '')
-                        mission_meta = {'_dyb_id': mission.get('_dyb_id'), '_dyb_sort': mission.get('_dyb_sort', mis_idx)}
-                    else:
-                        mission_text = str(mission)
-                        mission_meta = {}
-                    
-                    col1, col2 = st.columns([4, 1])
-                    with col1:
-                        new_mis = st.text_area(f"Mission {mis_idx + 1}", mission_text, key=f"mis_{idx}_{mis_idx}", height=120, label_visibility="collapsed")
-                        if new_mis:
-                            # Preserve metadata if it exists
-                            if mission_meta.get('_dyb_id'):
-                                new_missions.append({'description': new_mis, **mission_meta})
-                            else:
-                                new_missions.append(new_mis)
-                    with col2:
-                        st.markdown("<br>", unsafe_allow_html=True)  # Align delete button
-                        if st.button("🗑️", key=f"del_mis_{idx}_{mis_idx}"):
-                            exp['missions'].pop(mis_idx)
-                            st.rerun()
-                
-                exp['missions'] = new_missions
-                
-                # Add new mission
-                new_mis_input = st.text_area("Add new mission", key=f"new_mis_{idx}", height=120)
-                if st.button("Add Mission", key=f"add_mis_{idx}") and new_mis_input:
-                    exp['missions'].append(new_mis_input)
-                    st.rerun()
-                
-                # Results
-                st.markdown("**Results:**")
-                results = exp.get('results', [])
-                if not isinstance(results, list):
-                    results = []
-                new_results = []
-                
-                for res_idx, result in enumerate(results):
-                    # Handle both dict (with _dyb_id) and string formats
-                    if isinstance(result, dict):
-                        result_text = result.get('description', '')
-                        result_meta = {'_dyb_id': result.get('_dyb_id'), '_dyb_sort': result.get('_dyb_sort', res_idx)}
-                    else:
-                        result_text = str(result)
-                        result_meta = {}
-                    
-                    col1, col2 = st.columns([4, 1])
-                    with col1:
-                        new_res = st.text_area(f"Result {res_idx + 1}", result_text, key=f"res_{idx}_{res_idx}", height=100, label_visibility="collapsed")
-                        if new_res:
-                            # Preserve metadata if it exists
-                            if result_meta.get('_dyb_id'):
-                                new_results.append({'description': new_res, **result_meta})
-                            else:
-                                new_results.append(new_res)
-                    with col2:
-                        st.markdown("<div style='margin-top: 8px;'></div>", unsafe_allow_html=True)
-                        if st.button("🗑️", key=f"del_res_{idx}_{res_idx}"):
-                            exp['results'].pop(res_idx)
-                            st.rerun()
-                
-                exp['results'] = new_results
-                
-                # Add new result
-                new_res_input = st.text_area("Add new result", key=f"new_res_{idx}", height=100)
-                if st.button("Add Result", key=f"add_res_{idx}") and new_res_input:
-                    exp['results'].append(new_res_input)
-                    st.rerun()
-                
-                # Environments
-                st.markdown("**Technical Environments:**")
-                environments = exp.get('environments', [])
-                if not isinstance(environments, list):
-                    environments = []
-                new_envs = []
-                
-                for env_idx, environment in enumerate(environments):
-                    # Handle both dict (with _dyb_id) and string formats
-                    if isinstance(environment, dict):
-                        env_text = environment.get('description', '')
-                        env_meta = {'_dyb_id': environment.get('_dyb_id'), '_dyb_sort': environment.get('_dyb_sort', env_idx)}
-                    else:
-                        env_text = str(environment)
-                        env_meta = {}
-                    
-                    col1, col2 = st.columns([4, 1])
-                    with col1:
-                        new_env = st.text_area(f"Environment {env_idx + 1}", env_text, key=f"env_{idx}_{env_idx}", height=100, label_visibility="collapsed")
-                        if new_env:
-                            # Preserve metadata if it exists
-                            if env_meta.get('_dyb_id'):
-                                new_envs.append({'description': new_env, **env_meta})
-                            else:
-                                new_envs.append(new_env)
-                    with col2:
-                        if st.button("🗑️", key=f"del_env_{idx}_{env_idx}"):
-                            exp['environments'].pop(env_idx)
-                            st.rerun()
-                
-                exp['environments'] = new_envs
-                
-                # Add new environment
-                new_env_input = st.text_area("Add new environment", key=f"new_env_{idx}", height=100)
-                if st.button("Add Environment", key=f"add_env_{idx}") and new_env_input:
-                    exp['environments'].append(new_env_input)
-                    st.rerun()
-                
-                # Clean up old fields for backward compatibility
-                if 'achievements' in exp and 'missions' not in exp:
-                    exp['missions'] = exp.pop('achievements')
-                if 'description' in exp and 'context' not in exp:
-                    exp['context'] = exp.pop('description')
-                
-                # Delete experience
-                if st.button("🗑️ Delete Experience", key=f"del_exp_{idx}"):
-                    data['experience'].pop(idx)
-                    st.rerun()
-    
+        # Edit existing experiences: only the ones opened from the header list get widgets
+        query = st.text_input("🔍 Search experiences", placeholder="Title, company, mission, technology...").strip().lower()
+        matching = [idx for idx, exp in enumerate(data['experience']) if not query or experience_matches(exp, query)]
+        st.session_state[OPEN_EXPERIENCES_KEY] = [idx for idx in st.session_state.get(OPEN_EXPERIENCES_KEY, []) if idx in matching]
+        opened = st.multiselect(
+            f"Open experiences ({len(matching)}/{len(data['experience'])} shown)",
+            matching,
+            format_func=lambda idx: experience_header(data['experience'][idx]),
+            key=OPEN_EXPERIENCES_KEY
+        )
+        for idx in sorted(opened):
+            experience_editor(idx, expanded=True)
+
     # Certifications Section
     elif section == "Certifications":
         st.header("🎓 Certifications")
@@ -442,20 +620,9 @@ else:
                 st.rerun()
         
         # Edit existing certifications
-        for idx, cert in enumerate(data['certifications']):
-            with st.expander(f"🏆 {cert.get('name', 'Untitled')}"):
-                col1, col2 = st.columns(2)
-                with col1:
-                    cert['name'] = st.text_input("Name", cert.get('name', ''), key=f"cert_name_{idx}")
-                    cert['issuer'] = st.text_input("Issuer", cert.get('issuer', ''), key=f"cert_issuer_{idx}")
-                with col2:
-                    cert['date'] = st.text_input("Date", cert.get('date', ''), key=f"cert_date_{idx}")
-                    cert['credential_url'] = st.text_input("URL", cert.get('credential_url', ''), key=f"cert_url_{idx}")
-                
-                if st.button("🗑️ Delete Certification", key=f"del_cert_{idx}"):
-                    data['certifications'].pop(idx)
-                    st.rerun()
-    
+        for idx in paginate(len(data['certifications']), 'certifications'):
+            certification_editor(idx)
+
     # Languages Section
     elif section == "Languages":
         st.header("🌐 Languages")
@@ -488,6 +655,78 @@ else:
                     data['languages'].pop(idx)
                     st.rerun()
     
+    # Skills Matrix Section: skill levels across every showcase
+    elif section == "Skills Matrix":
+        st.header("📊 Skills Matrix")
+        import altair as alt
+        import skills_matrix
+
+        matrix = skills_matrix.matrix()
+        if not matrix.skills:
+            st.info("No skills in any showcase yet.")
+        else:
+            top = skills_matrix.top_skills(len(matrix.skills))
+            st.caption(f"{len(matrix.names)} showcases · {len(matrix.skills)} distinct skills")
+
+            # Filter: showcases meeting every minimum level
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                required = st.multiselect("Showcases with skills", [t['skill'] for t in top])
+            with col2:
+                min_level = st.slider("Minimum level", 0, 100, 60, step=10)
+            if required:
+                found = skills_matrix.showcases_with({skill: min_level for skill in required}, update=False)
+                st.markdown(f"**{len(found)} showcases** with {', '.join(required)} ≥ {min_level}")
+                for name, levels in found:
+                    st.caption(f"📄 {name} · " + " · ".join(f"{skill} {level:.0f}" for skill, level in levels.items()))
+                for skill in required:
+                    stats = skills_matrix.skill_stats(skill, update=False)
+                    if stats['rated']:
+                        st.caption(f"{stats['skill']}: mean {stats['mean']} · median {stats['median']:.0f} "
+                                   f"over {stats['rated']} rated showcases ({stats['showcases']} list it)")
+
+            # Heatmap of the most widespread skills (or the filtered ones)
+            shown = required or [t['skill'] for t in top[:30]]
+            heatmap = alt.Chart(alt.Data(values=skills_matrix.records(shown, update=False))).mark_rect().encode(
+                x=alt.X('skill:N', sort=[matrix.labels[matrix.column(skill)] for skill in shown], title=None),
+                y=alt.Y('showcase:N', sort=matrix.names, title=None),
+                color=alt.Color('level:Q', scale=alt.Scale(scheme='blues', domain=[0, 100])),
+                tooltip=['showcase:N', 'skill:N', 'category:N', 'level:Q']
+            ).properties(height=max(200, 22 * len(matrix.names)))
+            st.altair_chart(heatmap, use_container_width=True)
+
+    # Changes Section: what this variant changed compared to its source
+    elif section == "Changes":
+        st.header("🔀 Changes")
+        
+        # Propagate this showcase's saved content to the variants made from it
+        import showcase_rebase
+        # (rebase works on the YAML files and their base snapshots)
+        children = showcase_rebase.children_of(st.session_state.current_showcase) if isinstance(store, storage.YamlStore) else []
+        if children:
+            st.caption(f"{len(children)} variants created from this showcase: {', '.join(children)}")
+            if st.button("🔁 Rebase variants onto the saved version"):
+                # In-process: forking the threaded Streamlit server for a pool is unsafe
+                summary = showcase_rebase.rebase_children(st.session_state.current_showcase, workers=1)
+                st.success(f"Rebased {summary['total']} variants in {summary['seconds']}s "
+                           f"({summary['changed']} changed, {summary['conflicts']} conflicts, {summary['failed']} failed)")
+                for report in summary['variants']:
+                    if not report['ok']:
+                        st.error(f"{report['name']}: {report['error']['message']}")
+                    for conflict in report['conflicts']:
+                        st.warning(f"{report['name']}: conflict at {conflict['path']} (kept the variant's value)")
+            st.markdown("---")
+        
+        info = data.get('_variant_info') or {}
+        source = store.variant_source(data)
+        if source is None:
+            st.info("This showcase was not created from another one: nothing to compare.")
+        else:
+            # Compare the in-memory data, so unsaved edits show up too
+            changes = sm.diff_showcases(source, data)
+            st.caption(f"**{st.session_state.current_showcase}** vs **{info['created_from']}**: {len(changes)} changes")
+            show_changes(changes)
+    
     # Export/Import Section
     elif section == "Export/Import":
         st.header("📤 Export / Import")
@@ -501,7 +740,7 @@ else:
             
             with col1:
                 st.markdown("**YAML Format**")
-                yaml_str = yaml.dump(data, allow_unicode=True, sort_keys=False, default_flow_style=False)
+                yaml_str = yaml_backend.dump(data)
                 st.download_button(
                     label="📥 Download YAML",
                     data=yaml_str,
@@ -524,24 +763,54 @@ else:
                     st.code(json_str, language='json')
         
         with tab2:
+            import doyoubuzz_converter as dyb
             st.subheader("Import data from JSON")
+            st.caption(f"A DoYouBuzz export (converted like json2yaml) or a showcase exported as JSON, "
+                       f"up to {dyb.IMPORT_MAX_BYTES // (1024 * 1024)} MB")
             
             uploaded_file = st.file_uploader("Upload JSON file", type=['json'])
             
             if uploaded_file is not None:
-                try:
-                    imported_data = json.load(uploaded_file)
-                    
-                    st.json(imported_data)
+                # Convert once per upload, not on every rerun (file_id is new for every upload,
+                # even of an edited file with the same name and size)
+                upload_key = (uploaded_file.file_id, st.session_state.current_showcase)
+                if st.session_state.get('import_key') != upload_key:
+                    uploaded_file.seek(0)
+                    st.session_state.import_result = dyb.import_upload(uploaded_file)
+                    st.session_state.import_key = upload_key
+                result = st.session_state.import_result
+                
+                if not result['ok']:
+                    st.error(f"Cannot import: {result['error']['type']}: {result['error']['message']}")
+                else:
+                    imported = result['showcase']
+                    # Keep the lineage of a variant (and its delta storage)
+                    if data.get('_variant_info'):
+                        imported['_variant_info'] = data['_variant_info']
+                    changes = sm.diff_showcases(data, imported)
+                    kind = "DoYouBuzz export" if result['source'] == 'doyoubuzz' else "showcase"
+                    st.markdown(f"**{kind}**, {result['bytes'] / 1024:.0f} KB · "
+                                f"{len(imported.get('experience') or [])} experiences · "
+                                f"{len(changes)} changes against **{st.session_state.current_showcase}**")
+                    with st.expander("Preview changes", expanded=len(changes) <= 20):
+                        show_changes(changes, limit=50)
                     
-                    if st.button("⚠️ Replace current data with imported data"):
-                        st.session_state.data = imported_data
-                        if save_yaml(imported_data, YAML_FILE):
+                    if st.button("⚠️ Replace current data with imported data", disabled=not changes):
+                        # A pending autosave of the old content must not land after the import
+                        st.session_state.saver.cancel()
+                        if store.save(st.session_state.current_showcase, imported):
+                            st.session_state.data = imported
+                            st.session_state.saver.track(st.session_state.current_showcase, imported)
+                            for key in ('import_key', 'import_result'):
+                                st.session_state.pop(key, None)
                             st.success("✅ Data imported and saved successfully!")
                             st.rerun()
-                except Exception as e:
-                    st.error(f"Error importing JSON: {e}")
+                        else:
+                            st.error("❌ Save failed!")
 
 # Footer
 st.markdown("---")
 st.markdown("*DoYouBuzz Showcase Editor - Built with Streamlit*")
+
+# Whole-script time of this rerun (shown in the Diagnostics panel from the next one)
+instrumentation.record('app', 'rerun', (time.perf_counter() - rerun_started) * 1000, section=section)
@@ -0,0 +1,122 @@
+"""
+Atomic I/O - Crash-safe file replacement and per-file locking
+
+Writers serialise into a temp file next to the target, fsync it and
+os.replace it over the target, so readers (other Streamlit sessions, the
+CLI) only ever see the old or the new complete file. Locks are advisory,
+one lock file per target, so writers of different files never block
+each other.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, IO, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+PathLike = Union[str, Path]
+
+# Read once at import: os.umask can only be queried by setting it, which is not thread-safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_open(path: PathLike, mode: str = 'w', encoding: str = 'utf-8', fsync: bool = True) -> Iterator[IO]:
+    """Open a temp file for writing that replaces ``path`` only if the block succeeds"""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, encoding=None if 'b' in mode else encoding) as f:
+            yield f
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.chmod(tmp, _target_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    if fsync:
+        _fsync_dir(path.parent)
+
+
+def atomic_write(path: PathLike, data: Union[bytes, str], fsync: bool = True) -> None:
+    """Atomically replace ``path`` with ``data``"""
+    mode = 'wb' if isinstance(data, bytes) else 'w'
+    with atomic_open(path, mode, fsync=fsync) as f:
+        f.write(data)
+
+
+@contextmanager
+def locked(path: PathLike, remove: bool = False) -> Iterator[None]:
+    """Hold an exclusive advisory lock dedicated to ``path`` (no-op where unsupported)
+    
+    With ``remove`` the lock file is deleted before the lock is released,
+    if the block succeeded (``path`` was deleted or renamed away); writers
+    that were waiting on it then start over with a fresh lock file.
+    """
+    path = Path(path)
+    lock_path = path.with_name(f".{path.name}.lock")
+    while True:
+        lock_file = open(lock_path, 'a+b')
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            if not _is_current(lock_file, lock_path):
+                lock_file.close()  # removed by the previous holder
+                continue
+        elif msvcrt is not None:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        break
+    with lock_file:
+        try:
+            yield
+            if remove and fcntl is not None:
+                # Windows cannot delete a file that is still open
+                lock_path.unlink()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _is_current(lock_file: IO, lock_path: Path) -> bool:
+    """True if ``lock_file`` is still the file at ``lock_path`` (not deleted meanwhile)"""
+    try:
+        return os.fstat(lock_file.fileno()).st_ino == os.stat(lock_path).st_ino
+    except FileNotFoundError:
+        return False
+
+
+def _target_mode(path: Path) -> int:
+    """Permissions for the new file: keep the existing ones, else honour the umask"""
+    try:
+        return path.stat().st_mode & 0o777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist the rename itself (POSIX only)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,102 @@
+"""
+Autosave - Dirty tracking and debounced background saves of a showcase
+
+The editor keeps one Autosaver per session. It remembers the section
+hashes of what is on disk (showcase_manager.section_hashes), so it can
+tell which sections are unsaved, skip saves that would not change
+anything, and save in a background thread once edits have settled for
+``delay`` seconds, without the UI waiting on the YAML dump.
+"""
+
+import copy
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import showcase_manager as sm
+
+AUTOSAVE_DELAY = 3.0  # seconds without edits before an autosave
+
+
+class Autosaver:
+    """Tracks the saved state of the edited showcase and saves it on demand or in the background"""
+
+    def __init__(self, delay: float = AUTOSAVE_DELAY, save: Optional[Callable[[str, Dict], bool]] = None):
+        self.delay = delay
+        self._write = save or sm.save_showcase
+        self.name: Optional[str] = None
+        self.last_saved_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._saved_hashes: Dict[str, str] = {}
+        self._scheduled_hashes: Optional[Dict[str, str]] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def track(self, name: str, data: Optional[Dict]) -> None:
+        """Start tracking ``data`` as the saved state of showcase ``name`` (after a load)"""
+        with self._lock:
+            self._cancel()
+            self.name = name
+            self._saved_hashes = sm.section_hashes(data)
+            self.last_error = None
+
+    def dirty(self, data: Optional[Dict]) -> List[str]:
+        """Sections of ``data`` not saved yet"""
+        with self._lock:
+            saved = self._saved_hashes
+        return sm.dirty_sections(data, saved)
+
+    @property
+    def pending(self) -> bool:
+        """True while a background save is scheduled or running"""
+        return self._timer is not None
+
+    def save(self, data: Dict) -> bool:
+        """Save now if anything changed (returns False only when the save failed)"""
+        with self._lock:
+            self._cancel()
+            name = self.name
+        if not self.dirty(data):
+            return True
+        return self._save(name, data)
+
+    def schedule(self, data: Dict) -> None:
+        """(Re)start the debounce timer if ``data`` changed since the last save or schedule"""
+        hashes = sm.section_hashes(data)
+        with self._lock:
+            if hashes == self._saved_hashes or hashes == self._scheduled_hashes:
+                return
+            self._cancel()
+            # Snapshot now: the UI keeps mutating ``data`` while the timer runs
+            self._scheduled_hashes = hashes
+            self._timer = threading.Timer(self.delay, self._save, (self.name, copy.deepcopy(data)))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self) -> None:
+        """Drop any pending background save (e.g. before deleting the showcase)"""
+        with self._lock:
+            self._cancel()
+
+    def _cancel(self) -> None:
+        """Stop the debounce timer (caller holds _lock)"""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._scheduled_hashes = None
+
+    def _save(self, name: str, data: Dict) -> bool:
+        """Write ``data`` and record it as the saved state if still tracking ``name``"""
+        ok = self._write(name, data)
+        with self._lock:
+            if threading.current_thread() is self._timer:
+                self._timer = None
+                self._scheduled_hashes = None
+            if name == self.name:
+                if ok:
+                    self._saved_hashes = sm.section_hashes(data)
+                    self.last_saved_at = time.time()
+                    self.last_error = None
+                else:
+                    self.last_error = f"Could not save {name}"
+        return ok
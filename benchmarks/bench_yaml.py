@@ -0,0 +1,56 @@
+"""
+YAML backend benchmark: libyaml C loader/dumper vs pure-Python PyYAML
+
+Usage: python -m benchmarks.bench_yaml [showcase.yaml] [repeat]
+"""
+
+import sys
+import time
+import yaml
+from pathlib import Path
+
+import yaml_backend
+
+DEFAULT_SHOWCASE = Path("showcases") / "baseline.yaml"
+
+
+def best_of(func, repeat: int) -> float:
+    """Best wall time of ``repeat`` runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run(path: Path, repeat: int = 5) -> dict:
+    """Time load and dump with both backends and check the output is byte-identical"""
+    text = path.read_text(encoding='utf-8')
+    data = yaml.safe_load(text)
+    dump_options = dict(allow_unicode=True, sort_keys=False, default_flow_style=False)
+    
+    results = {
+        'file': str(path),
+        'size_kb': round(len(text.encode('utf-8')) / 1024, 1),
+        'libyaml': yaml_backend.HAS_LIBYAML,
+        'python_load': best_of(lambda: yaml.load(text, Loader=yaml.SafeLoader), repeat),
+        'python_dump': best_of(lambda: yaml.dump(data, Dumper=yaml.SafeDumper, width=float('inf'), **dump_options), repeat),
+        'backend_load': best_of(lambda: yaml_backend.load(text), repeat),
+        'backend_dump': best_of(lambda: yaml_backend.dump(data), repeat),
+    }
+    results['identical_dump'] = yaml.dump(data, width=float('inf'), **dump_options) == yaml_backend.dump(data)
+    results['identical_load'] = yaml_backend.load(text) == data
+    return results
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SHOWCASE
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    r = run(path, repeat)
+    
+    print(f"File: {r['file']} ({r['size_kb']} KB), libyaml available: {r['libyaml']}")
+    for op in ('load', 'dump'):
+        python_t, backend_t = r[f'python_{op}'], r[f'backend_{op}']
+        print(f"  {op}: python {python_t * 1000:8.1f} ms | backend {backend_t * 1000:8.1f} ms | x{python_t / backend_t:.1f}")
+    print(f"  byte-identical dump: {r['identical_dump']}, identical load: {r['identical_load']}")
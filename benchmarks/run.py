@@ -0,0 +1,152 @@
+"""
+Converter and storage benchmark across synthetic CV sizes
+
+For each size factor (1 = the real baseline), a synthetic DoYouBuzz export
+is generated and every path is timed in a scratch directory: json_to_yaml,
+yaml_to_json (full rebuild, then served from the export cache), load_showcase (cold and cached), save_showcase and
+create_variant (full copy and delta). Peak Python memory is measured with
+tracemalloc on a separate, untimed run.
+
+Usage: python -m benchmarks.run [factors] [repeat] [results.json]
+       e.g. python -m benchmarks.run 1,10,100 3 bench_results.json
+"""
+
+import contextlib
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import doyoubuzz_converter as dyb
+import showcase_manager as sm
+import yaml_backend
+from benchmarks import synthetic
+
+DEFAULT_FACTORS = (1, 2, 5, 10, 20, 50, 100)
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Peak traced Python allocation of one call, in bytes"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(func: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    """Best wall time over ``repeat`` runs plus peak memory of one more run"""
+    def run_once():
+        if setup:
+            setup()
+        started = time.perf_counter()
+        func()
+        return time.perf_counter() - started
+
+    seconds = min(run_once() for _ in range(repeat))
+    if setup:
+        setup()
+    return {'seconds': round(seconds, 6), 'peak_kb': round(peak_memory(func) / 1024, 1)}
+
+
+@contextlib.contextmanager
+def scratch_showcases(directory: Path):
+    """Point showcase_manager at ``directory`` with empty caches"""
+    previous = sm.SHOWCASES_DIR
+    sm.SHOWCASES_DIR = directory
+    sm.invalidate_cache()
+    sm._index_memo = None
+    try:
+        yield
+    finally:
+        sm.SHOWCASES_DIR = previous
+        sm.invalidate_cache()
+        sm._index_memo = None
+
+
+@contextlib.contextmanager
+def export_cache(directory: Optional[Path]):
+    """Point the CLI export cache at ``directory`` (None turns it off)"""
+    previous = dyb.EXPORT_CACHE_DIR
+    dyb.EXPORT_CACHE_DIR = directory
+    try:
+        yield
+    finally:
+        dyb.EXPORT_CACHE_DIR = previous
+
+
+def bench_size(factor: float, repeat: int, template: Dict[str, Any]) -> Dict[str, Any]:
+    """Time every path for one synthetic size"""
+    counts = synthetic.scaled_counts(factor, template)
+    data = synthetic.generate(**counts, template=template)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        json_path, yaml_path, out_path = tmp / "cv.json", tmp / "showcases" / "bench.yaml", tmp / "out.json"
+        yaml_path.parent.mkdir()
+        with open(json_path, 'w', encoding='utf-8') as f:
+            dyb.write_dyb(data, f)
+
+        timings = {}
+        timings['json_to_yaml'] = measure(lambda: dyb.json_to_yaml(str(json_path), str(yaml_path)), repeat)
+        with export_cache(None):
+            timings['yaml_to_json'] = measure(lambda: dyb.yaml_to_json(str(yaml_path), str(out_path)), repeat)
+        with export_cache(tmp / "exports"):
+            timings['yaml_to_json_cached'] = measure(lambda: dyb.yaml_to_json(str(yaml_path), str(out_path)), repeat)
+
+        with scratch_showcases(yaml_path.parent):
+            showcase = sm.load_showcase('bench')
+            timings['load_showcase_cold'] = measure(lambda: sm.load_showcase('bench'), repeat, setup=sm.invalidate_cache)
+            timings['load_showcase_cached'] = measure(lambda: sm.load_showcase('bench'), repeat)
+
+            def touch():
+                # A one-character edit so the save is never skipped as unchanged
+                showcase['summary'] = f"{showcase.get('summary', '')}."
+            timings['save_showcase'] = measure(lambda: sm.save_showcase('bench', showcase), repeat, setup=touch)
+
+            for label, delta in (('create_variant_full', False), ('create_variant_delta', True)):
+                def drop_variant():
+                    if sm.showcase_exists('variant'):
+                        sm.delete_showcase('variant')
+                timings[label] = measure(lambda: sm.create_variant('bench', 'variant', delta=delta), repeat, setup=drop_variant)
+
+        return {
+            'factor': factor,
+            'counts': counts,
+            'json_kb': round(json_path.stat().st_size / 1024, 1),
+            'yaml_kb': round(yaml_path.stat().st_size / 1024, 1),
+            'timings': timings
+        }
+
+
+def run(factors: List[float], repeat: int = 3) -> Dict[str, Any]:
+    """Benchmark every size factor"""
+    template = synthetic.load_template()
+    return {
+        'python': platform.python_version(),
+        'libyaml': yaml_backend.HAS_LIBYAML,
+        'repeat': repeat,
+        'sizes': [bench_size(factor, repeat, template) for factor in factors]
+    }
+
+
+if __name__ == "__main__":
+    factors = [float(f) for f in sys.argv[1].split(',')] if len(sys.argv) > 1 else list(DEFAULT_FACTORS)
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    results = run(factors, repeat)
+
+    for size in results['sizes']:
+        print(f"x{size['factor']:g}: {size['counts']['experiences']} experiences, "
+              f"JSON {size['json_kb']} KB, YAML {size['yaml_kb']} KB")
+        for name, t in size['timings'].items():
+            print(f"  {name:22} {t['seconds'] * 1000:10.1f} ms   peak {t['peak_kb']:10.1f} KB")
+
+    if len(sys.argv) > 3:
+        with open(sys.argv[3], 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"[OK] Results written to {sys.argv[3]}")
@@ -0,0 +1,122 @@
+"""
+App startup and per-rerun overhead
+
+Cold start: import time of the modules app.py loads on every start and of
+the ones it only imports for rare actions, each in a fresh interpreter
+(``python -X importtime``). Per rerun: the showcase listing and metadata
+lookups the app does on every interaction, against a scratch directory of
+N showcases, with and without the directory-mtime memo of list_showcases.
+Streamlit itself is not measured.
+
+Usage: python -m benchmarks.startup [showcase_counts] [repeat] [results.json]
+       e.g. python -m benchmarks.startup 10,100,500 20 startup_results.json
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import showcase_manager as sm
+import storage
+from benchmarks.run import scratch_showcases
+
+STARTUP_MODULES = ('showcase_manager', 'atomic_io', 'autosave', 'instrumentation', 'storage', 'yaml_backend')
+LAZY_MODULES = ('doyoubuzz_converter', 'showcase_search', 'skills_matrix', 'showcase_rebase')
+
+
+def import_ms(modules, repeat: int = 3) -> float:
+    """Best cumulative import time of ``modules`` in a fresh interpreter, in ms"""
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {', '.join(modules)}"],
+                                capture_output=True, text=True, cwd=Path(__file__).resolve().parent.parent)
+        if result.returncode != 0:
+            return float('nan')
+        # "import time: self [us] | cumulative | imported package": the cumulative time of
+        # each requested module includes whatever it imported first
+        total = 0
+        for line in result.stderr.splitlines():
+            parts = line.split('|')
+            if len(parts) == 3 and parts[2].strip() in modules and not parts[2].startswith('  '):
+                total += int(parts[1])
+        best = total if best is None else min(best, total)
+    return round(best / 1000, 1)
+
+
+def best_ms(func, repeat: int) -> float:
+    """Best wall time of ``func`` over ``repeat`` calls, in ms"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return round(min(times) * 1000, 3)
+
+
+def bench_rerun(count: int, repeat: int) -> Dict[str, Any]:
+    """Listing and metadata costs of one rerun with ``count`` showcases"""
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "showcases"
+        directory.mkdir()
+        shutil.copy(sm.SHOWCASES_DIR / f"{sm.BASELINE_NAME}.yaml", directory)
+        for i in range(count - 1):
+            os.link(directory / f"{sm.BASELINE_NAME}.yaml", directory / f"variant{i:04}.yaml")
+
+        with scratch_showcases(directory):
+            store = storage.YamlStore()
+            store.list()
+            store.info(sm.BASELINE_NAME)  # builds the metadata index once
+
+            def uncached():
+                sm._invalidate_listing()
+                sm.list_showcases()
+
+            def rerun():
+                # What app.py does before drawing: one listing and the current showcase's metadata
+                store.list()
+                store.info(sm.BASELINE_NAME)
+
+            return {
+                'showcases': count,
+                'list_uncached_ms': best_ms(uncached, repeat),
+                'list_memoised_ms': best_ms(sm.list_showcases, repeat),
+                'info_ms': best_ms(lambda: store.info(sm.BASELINE_NAME), repeat),
+                'rerun_ms': best_ms(rerun, repeat)
+            }
+
+
+def run(counts: List[int], repeat: int = 20) -> Dict[str, Any]:
+    return {
+        'python': sys.version.split()[0],
+        'startup': {
+            'eager_ms': import_ms(STARTUP_MODULES),
+            'lazy_ms': {module: import_ms((module,)) for module in LAZY_MODULES},
+            'all_ms': import_ms(STARTUP_MODULES + LAZY_MODULES)
+        },
+        'reruns': [bench_rerun(count, repeat) for count in counts]
+    }
+
+
+if __name__ == "__main__":
+    counts = [int(c) for c in sys.argv[1].split(',')] if len(sys.argv) > 1 else [10, 100, 500]
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    results = run(counts, repeat)
+
+    startup = results['startup']
+    print(f"Imports at startup: {startup['eager_ms']} ms (everything eagerly: {startup['all_ms']} ms)")
+    for module, ms in startup['lazy_ms'].items():
+        print(f"  deferred {module:22} {ms:8.1f} ms")
+    for r in results['reruns']:
+        print(f"{r['showcases']:5} showcases: list {r['list_uncached_ms']:.3f} ms -> {r['list_memoised_ms']:.3f} ms memoised, "
+              f"info {r['info_ms']:.3f} ms, per rerun {r['rerun_ms']:.3f} ms")
+
+    if len(sys.argv) > 3:
+        with open(sys.argv[3], 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"[OK] Results written to {sys.argv[3]}")
@@ -0,0 +1,132 @@
+"""
+Synthetic DoYouBuzz exports of controlled size
+
+The real baseline, converted back to DoYouBuzz JSON, is the template: its
+global fields are kept and its first experience, skill, certificate and
+language are cloned with fresh ids and generated text, so the output goes
+through exactly the same converter paths as a real export.
+
+Usage: python -m benchmarks.synthetic <factor> [output.json]
+"""
+
+import copy
+import json
+import math
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import doyoubuzz_converter as dyb
+import yaml_backend
+
+TEMPLATE_SHOWCASE = Path("showcases") / "baseline.yaml"
+FIRST_ID = 900000000
+
+WORDS = (
+    "plateforme données production incident supervision automatisation cluster "
+    "migration sécurité performance pipeline déploiement équipe client analyse "
+    "stabilité disponibilité optimisation architecture service réseau stockage "
+    "Hadoop Spark Kafka Python Ansible Kubernetes Linux Grafana Prometheus"
+).split()
+
+
+def load_template(path: Path = TEMPLATE_SHOWCASE) -> Dict[str, Any]:
+    """DoYouBuzz JSON of the template showcase"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return dyb.showcase_to_dyb(yaml_backend.load(f))
+
+
+def count_items(dyb_data: Dict[str, Any]) -> Dict[str, int]:
+    """Sizes of a DoYouBuzz export (per-experience and per-category counts are rounded-up averages)"""
+    experiences = dyb_data.get('experiences', [])
+    skills = dyb_data.get('skills', [])
+
+    def per(items, key):
+        return math.ceil(sum(len(i.get(key) or []) for i in items) / len(items)) if items else 0
+
+    return {
+        'experiences': len(experiences),
+        'missions': per(experiences, 'missions'),
+        'results': per(experiences, 'results'),
+        'environments': per(experiences, 'environments'),
+        'skill_categories': len(skills),
+        'skills': per(skills, 'children'),
+        'certificates': len(dyb_data.get('certificates', [])),
+        'languages': len((dyb_data.get('languageSkills') or {}).get('elements', []))
+    }
+
+
+def scaled_counts(factor: float, template: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+    """Template sizes with every list scaled by ``factor`` (per-item counts stay realistic)"""
+    counts = count_items(template or load_template())
+    for key in ('experiences', 'skill_categories', 'certificates', 'languages'):
+        counts[key] = max(1, round(counts[key] * factor))
+    return counts
+
+
+def generate(experiences: int = 16, missions: int = 3, results: int = 2, environments: int = 1,
+             skill_categories: int = 18, skills: int = 3, certificates: int = 8, languages: int = 1,
+             seed: int = 0, template: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build a DoYouBuzz export with the given numbers of items (deterministic for a seed)"""
+    template = template or load_template()
+    rng = random.Random(seed)
+    ids = iter(range(FIRST_ID, FIRST_ID + 10**8))
+
+    def sentence(words: int) -> str:
+        text = " ".join(rng.choice(WORDS) for _ in range(words))
+        return text[0].upper() + text[1:]
+
+    def entries(model: Dict[str, Any], count: int, words: int) -> list:
+        return [dict(model, id=next(ids), sort=sort, description=sentence(words)) for sort in range(count)]
+
+    data = {k: v for k, v in template.items() if k not in ('experiences', 'skills', 'certificates', 'languageSkills')}
+
+    exp_model = template['experiences'][0]
+    data['experiences'] = []
+    for sort in range(experiences):
+        exp = copy.deepcopy(exp_model)
+        company = f"{rng.choice(WORDS).capitalize()} {sort}"
+        exp.update(id=next(ids), sort=sort, title=sentence(3), company=company, slug=f"company-{sort}")
+        exp['contexts'] = entries(exp_model['contexts'][0], 1, 60)
+        exp['missions'] = entries(exp_model['missions'][0], missions, 12)
+        exp['results'] = entries(exp_model['results'][0], results, 10)
+        exp['environments'] = entries(exp_model['environments'][0], environments, 15)
+        data['experiences'].append(exp)
+
+    skill_model = template['skills'][0]
+    data['skills'] = []
+    for sort in range(skill_categories):
+        skill = dict(skill_model, id=next(ids), sort=sort, description=sentence(2))
+        # Levels start at 5: a 0 level is not exported back, which would break the round trip
+        skill['children'] = [
+            dict(skill_model['children'][0], id=next(ids), sort=child, description=rng.choice(WORDS),
+                 level=rng.randrange(5, 101, 5))
+            for child in range(skills)
+        ]
+        data['skills'].append(skill)
+
+    cert_model = template['certificates'][0]
+    data['certificates'] = [dict(cert_model, id=next(ids), sort=sort, name=f"{sentence(3)} - {rng.choice(WORDS)}")
+                            for sort in range(certificates)]
+
+    lang_model = template['languageSkills']['elements'][0]
+    data['languageSkills'] = {'elements': [dict(lang_model, id=next(ids), sort=sort, culture=f"l{sort}")
+                                           for sort in range(languages)]}
+    return data
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m benchmarks.synthetic <factor> [output.json]")
+        sys.exit(1)
+
+    template = load_template()
+    counts = scaled_counts(float(sys.argv[1]), template)
+    data = generate(**counts, template=template)
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], 'w', encoding='utf-8') as f:
+            dyb.write_dyb(data, f)
+        print(f"[OK] Wrote {sys.argv[2]}: {counts}")
+    else:
+        json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
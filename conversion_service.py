@@ -0,0 +1,304 @@
+"""
+Conversion Service - Long-running HTTP API over doyoubuzz_converter
+
+Endpoints (request body = document to convert):
+- POST /json2yaml   DoYouBuzz JSON -> showcase YAML (``?format=json`` for a JSON showcase)
+- POST /yaml2json   showcase YAML or JSON -> DoYouBuzz JSON
+- GET  /metrics     request counts, latencies, queue depth
+- GET  /health
+
+Requests are handled by an asyncio server (stdlib only, HTTP/1.1 with
+keep-alive). Conversions run in a process pool whose workers are started
+and warmed up (imports, YAML emitter) before the first request. At most
+``queue_limit`` conversions are in flight or waiting: beyond that the
+service answers 503 with Retry-After instead of queueing without bound.
+
+Usage: python doyoubuzz_converter.py serve [host:port] [workers]
+"""
+
+import asyncio
+import io
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import yaml
+
+import doyoubuzz_converter as dyb
+import yaml_backend
+from instrumentation import timed
+
+log = logging.getLogger('dc.service')
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 32 * 1024 * 1024
+QUEUE_PER_WORKER = 4  # waiting + running conversions allowed per worker
+IDLE_TIMEOUT = 30.0
+STARTUP_TIMEOUT = 60.0  # seconds for every worker to start
+LATENCY_WINDOW = 1000  # recent latencies kept for percentiles
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 422: 'Unprocessable Entity', 500: 'Internal Server Error',
+           503: 'Service Unavailable'}
+
+
+class RequestError(Exception):
+    """An HTTP error answer (status + message)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# --- Worker side (runs in the pool processes) ----------------------------------
+
+_start_barrier = None
+
+
+def _warm_up(barrier=None) -> None:
+    """Pay the import and first-use costs once per worker"""
+    global _start_barrier
+    _start_barrier = barrier
+    yaml_backend.dump({'warm': [1]})
+    yaml_backend.load("warm: [1]")
+
+
+def _ping() -> int:
+    """Block until every worker holds a ping, so the pool has to start (and warm up) all of them"""
+    if _start_barrier is not None:
+        _start_barrier.wait(timeout=STARTUP_TIMEOUT)
+    return os.getpid()
+
+
+def convert_json_to_showcase(body: bytes, as_json: bool = False) -> Tuple[bytes, str]:
+    """DoYouBuzz JSON bytes -> showcase (YAML, or JSON with ``as_json``) and its content type"""
+    showcase = dyb.dyb_to_showcase(json.loads(body))
+    if as_json:
+        return json.dumps(showcase, ensure_ascii=False).encode('utf-8'), 'application/json'
+    out = io.StringIO()
+    dyb.write_showcase(showcase, out)
+    return out.getvalue().encode('utf-8'), 'application/yaml'
+
+
+def convert_showcase_to_json(body: bytes) -> Tuple[bytes, str]:
+    """Showcase YAML (or JSON, which YAML parses too) bytes -> DoYouBuzz JSON (never cached: the service writes no files)"""
+    showcase = yaml_backend.load(body)
+    if not isinstance(showcase, dict):
+        raise dyb.ConversionError("Expected a showcase mapping")
+    _, payload, _ = dyb.export_json(showcase)
+    return payload, 'application/json'
+
+
+# --- Metrics -------------------------------------------------------------------
+
+class Metrics:
+    """Per-endpoint request counters and latencies"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.in_flight = 0
+        self.rejected = 0
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+        self._latencies: Dict[str, deque] = {}
+
+    def record(self, endpoint: str, status: int, seconds: float, bytes_in: int, bytes_out: int) -> None:
+        stats = self.endpoints.setdefault(endpoint, {'requests': 0, 'errors': 0, 'bytes_in': 0, 'bytes_out': 0,
+                                                     'total_ms': 0.0, 'max_ms': 0.0, 'status': {}})
+        ms = seconds * 1000
+        stats['requests'] += 1
+        stats['errors'] += status >= 400
+        stats['bytes_in'] += bytes_in
+        stats['bytes_out'] += bytes_out
+        stats['total_ms'] += ms
+        stats['max_ms'] = max(stats['max_ms'], ms)
+        stats['status'][str(status)] = stats['status'].get(str(status), 0) + 1
+        self._latencies.setdefault(endpoint, deque(maxlen=LATENCY_WINDOW)).append(ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        endpoints = {}
+        for endpoint, stats in self.endpoints.items():
+            recent = sorted(self._latencies[endpoint])
+            endpoints[endpoint] = {
+                **stats,
+                'total_ms': round(stats['total_ms'], 3),
+                'max_ms': round(stats['max_ms'], 3),
+                'mean_ms': round(stats['total_ms'] / stats['requests'], 3),
+                'p50_ms': round(recent[len(recent) // 2], 3),
+                'p95_ms': round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 3)
+            }
+        return {'uptime_s': round(time.time() - self.started, 1), 'in_flight': self.in_flight,
+                'rejected': self.rejected, 'endpoints': endpoints}
+
+
+# --- Server --------------------------------------------------------------------
+
+class ConversionService:
+    """asyncio HTTP front end dispatching conversions to a warm process pool"""
+
+    ROUTES = {'/json2yaml': 'json2yaml', '/yaml2json': 'yaml2json'}
+
+    def __init__(self, workers: Optional[int] = None, queue_limit: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_limit = queue_limit or self.workers * QUEUE_PER_WORKER
+        self.metrics = Metrics()
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        """Start and warm up the workers, then listen"""
+        context = multiprocessing.get_context()
+        barrier = context.Barrier(self.workers)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                            initializer=_warm_up, initargs=(barrier,))
+        loop = asyncio.get_running_loop()
+        # The pool spawns workers lazily and reuses idle ones: pings that wait for each
+        # other on the barrier keep every worker busy, so all of them get started now
+        pids = await asyncio.gather(*(loop.run_in_executor(self.executor, _ping) for _ in range(self.workers)))
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        address = self.server.sockets[0].getsockname()
+        log.info(f"[OK] Conversion service on http://{address[0]}:{address[1]} "
+                 f"({len(set(pids))} workers, queue limit {self.queue_limit})")
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        await self.start(host, port)
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it or asks to"""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), IDLE_TIMEOUT)
+                except RequestError as e:
+                    await self._respond(writer, e.status, _error_body(e), 'application/json', keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, target, headers, body, keep_alive = request
+                started = time.perf_counter()
+                endpoint = urlsplit(target).path
+                status, payload, content_type, extra = await self._dispatch(method, target, body)
+                await self._respond(writer, status, payload, content_type, keep_alive, extra)
+                self.metrics.record(endpoint if endpoint in self.ROUTES or endpoint in ('/metrics', '/health')
+                                    else 'other', status, time.perf_counter() - started, len(body), len(payload))
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """(method, target, headers, body, keep_alive), or None at end of stream"""
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode('latin-1').split()
+        except ValueError:
+            raise RequestError(400, "Malformed request line")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise RequestError(400, "Invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise RequestError(413, f"Body larger than {MAX_BODY_BYTES} bytes")
+        body = await reader.readexactly(length) if length else b''
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+        return method, target, headers, body, keep_alive
+
+    async def _dispatch(self, method: str, target: str, body: bytes):
+        """(status, body, content type, extra headers) of one request"""
+        url = urlsplit(target)
+        if url.path == '/health':
+            return 200, b'{"ok": true}', 'application/json', {}
+        if url.path == '/metrics':
+            return 200, json.dumps(self.metrics.snapshot()).encode('utf-8'), 'application/json', {}
+        route = self.ROUTES.get(url.path)
+        if route is None:
+            return 404, _error_body(RequestError(404, f"Unknown endpoint {url.path}")), 'application/json', {}
+        if method != 'POST':
+            return 405, _error_body(RequestError(405, "Use POST")), 'application/json', {'Allow': 'POST'}
+
+        # Backpressure: shed load instead of letting the queue grow
+        if self.metrics.in_flight >= self.queue_limit:
+            self.metrics.rejected += 1
+            return 503, _error_body(RequestError(503, "Too many conversions in progress")), 'application/json', \
+                {'Retry-After': '1'}
+
+        self.metrics.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            with timed('service', route, bytes_in=len(body)) as t:
+                if route == 'json2yaml':
+                    as_json = parse_qs(url.query).get('format') == ['json']
+                    payload, content_type = await loop.run_in_executor(
+                        self.executor, convert_json_to_showcase, body, as_json)
+                else:
+                    payload, content_type = await loop.run_in_executor(self.executor, convert_showcase_to_json, body)
+                t.add(bytes_out=len(payload))
+            return 200, payload, content_type, {}
+        except (ValueError, TypeError, KeyError, AttributeError, yaml.YAMLError, dyb.ConversionError) as e:
+            # Malformed input documents (JSON syntax errors are ValueErrors)
+            return 422, _error_body(e), 'application/json', {}
+        except Exception as e:
+            log.exception(f"Error in {route}: {e}")
+            return 500, _error_body(e), 'application/json', {}
+        finally:
+            self.metrics.in_flight -= 1
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, body: bytes, content_type: str,
+                       keep_alive: bool, extra: Optional[Dict[str, str]] = None) -> None:
+        headers = [f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+                   f"Content-Type: {content_type}; charset=utf-8",
+                   f"Content-Length: {len(body)}",
+                   f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        headers += [f"{name}: {value}" for name, value in (extra or {}).items()]
+        writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+
+def _error_body(error: Exception) -> bytes:
+    return json.dumps({'ok': False, 'error': {'type': type(error).__name__, 'message': str(error)}},
+                      ensure_ascii=False).encode('utf-8')
+
+
+def serve(address: Optional[str] = None, workers: Optional[int] = None) -> None:
+    """Run the service until interrupted (``address`` is ``host:port`` or ``port``)"""
+    host, port = DEFAULT_HOST, DEFAULT_PORT
+    if address:
+        host, _, port_text = address.rpartition(':')
+        host, port = host or DEFAULT_HOST, int(port_text)
+    try:
+        asyncio.run(ConversionService(workers).serve_forever(host, port))
+    except KeyboardInterrupt:
+        log.info("[OK] Conversion service stopped")
@@ -1,25 +1,383 @@
 """
 DoYouBuzz JSON <-> Simplified YAML Converter
 Maintains full compatibility with DoYouBuzz import/export
+
+Layers:
+- dyb_to_showcase / showcase_to_dyb: pure dict -> dict transforms
+- read_* / write_*: streaming I/O over text streams
+- json_to_yaml / yaml_to_json: file-based CLI wrappers (outputs replaced atomically)
+- batch_convert: whole directories across a process pool
+- import_upload: validated in-app import of uploaded exports
+- export_showcase: in-memory exports, optionally from a content-addressed cache
+- serve: HTTP conversion service (see conversion_service)
+- verify_corpus: parallel round-trip check with classified losses
+
+Progress goes to the ``dc.converter`` logger and each stage (parse,
+transform, serialise) is timed through instrumentation.
 """
 
+import contextlib
+import copy
+import functools
+import glob
+import gzip
+import hashlib
 import json
-import yaml
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any
+from typing import BinaryIO, Dict, Any, List, Optional, TextIO, Tuple
 
+import atomic_io
+import yaml_backend
+from instrumentation import timed
 
-def json_to_yaml(json_path: str, yaml_path: str) -> None:
-    """Convert DoYouBuzz JSON to simplified YAML for editing"""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        dyb_data = json.load(f)
+log = logging.getLogger('dc.converter')
+
+
+class ConversionError(Exception):
+    """Raised when a showcase cannot be converted to DoYouBuzz JSON"""
+
+
+# Round-trip metadata table: editable showcase items only carry their _dyb_id,
+# and _doyoubuzz_metadata['objects'][kind][id] holds whatever else the
+# original DoYouBuzz object had that the builders below would not reproduce
+# on their own (usually nothing). Rebuilding JSON is a join against it.
+# Showcases written before the table existed keep their inline _dyb_* fields,
+# which the builders still read.
+OBJECTS_KEY = 'objects'
+ABSENT_KEY = '_absent'  # keys the builder adds that the original object lacked
+
+# Fields of the top-level DoYouBuzz objects that personal_info/summary own
+OWNER_EDITABLE = ('firstname', 'lastname', 'login', 'url')
+TITLE_EDITABLE = ('value',)
+PRESENTATION_EDITABLE = ('text',)
+
+META_FIELDS = (
+    'id', 'url', 'color', 'completion', 'culture', 'language', 'description',
+    'createdAt', 'updatedAt', 'published', 'uploaded', 'referenced', 'hidden',
+    'main', 'mainCvGroup', 'protected', 'passwordProtected', 'renderingMode',
+    'yearsExperience', 'availability', 'options', 'download', 'positions',
+    'professionalPosition', 'tags', 'educations', 'events', 'interests', 'portfolios'
+)
+
+LANG_MAP = {'en': 'Anglais', 'fr': 'Français', 'es': 'Espagnol', 'de': 'Allemand'}
+
+
+def _extras(raw: Dict[str, Any], built: Dict[str, Any], editable: tuple = (), keep: tuple = ()) -> Dict[str, Any]:
+    """Fields of ``raw`` that the rebuild (``built``) would not reproduce"""
+    extras = {
+        k: v for k, v in raw.items()
+        if k not in editable and (k in keep or k not in built or built[k] != v)
+    }
+    absent = [k for k in built if k not in raw and k not in editable]
+    if absent:
+        extras[ABSENT_KEY] = absent
+    return extras
+
+
+def _join(obj: Dict[str, Any], objects: Dict[str, Any], kind: str, item: Any) -> Dict[str, Any]:
+    """Overlay the stored extras of ``item`` (looked up by _dyb_id) onto a rebuilt object"""
+    if not isinstance(item, dict) or not objects:
+        return obj
+    table = objects.get(kind, {})
+    extras = table.get(item.get('_dyb_id'))
+    if extras is None and item.get('_dyb_id') is not None:
+        # Showcases sent as JSON have string keys in the metadata table
+        extras = table.get(str(item['_dyb_id']))
+    if extras:
+        for key, value in extras.items():
+            if key == ABSENT_KEY:
+                for absent in value:
+                    obj.pop(absent, None)
+            else:
+                obj[key] = value
+    return obj
+
+
+def _without(obj: Optional[Dict[str, Any]], keys: tuple) -> Optional[Dict[str, Any]]:
+    """Shallow copy of a dict minus some keys"""
+    if not isinstance(obj, dict):
+        return obj
+    return {k: v for k, v in obj.items() if k not in keys}
+
+
+def _format_date(point: Dict[str, Any]) -> str:
+    """'YYYY-MM' (or 'YYYY') from a DoYouBuzz range point"""
+    return f"{point.get('year', '')}-{point.get('month', '').zfill(2) if point.get('month') else ''}".rstrip('-')
+
+
+def _range_from_dates(exp: Dict[str, Any]) -> Dict[str, Any]:
+    """DoYouBuzz range object from the simplified start/end dates"""
+    start_parts = (exp.get('start_date') or '').split('-')
+    end_parts = (exp.get('end_date') or '').split('-')
+    return {
+        "start": {
+            "year": start_parts[0] if len(start_parts) > 0 else "",
+            "month": start_parts[1] if len(start_parts) > 1 else ""
+        },
+        "end": {
+            "year": end_parts[0] if len(end_parts) > 0 else "",
+            "month": end_parts[1] if len(end_parts) > 1 else ""
+        }
+    }
+
+
+def _split_certificate_name(full_name: str) -> tuple:
+    """(name, issuer) from a DoYouBuzz certificate name 'Name - Issuer'"""
+    parts = full_name.split(' - ')
+    name = parts[0] if len(parts) > 0 else full_name
+    issuer = parts[1] if len(parts) > 1 else ''
+    return name, issuer
+
+
+# --- Builders: one simplified item -> one DoYouBuzz object --------------------
+
+def _build_skill(skill_cat: Dict[str, Any], idx: int, objects: Dict[str, Any]) -> Dict[str, Any]:
+    """DoYouBuzz skill (category) with its children"""
+    dyb_skill = {
+        "$views": skill_cat.get('_dyb_views', []),
+        "skillTerm": skill_cat.get('_dyb_skillTerm'),
+        "id": skill_cat.get('_dyb_id', 63000000 + idx),
+        "home": skill_cat.get('_dyb_home', True),
+        "sort": skill_cat.get('_dyb_sort', idx),
+        "description": skill_cat.get('category', ''),
+        "children": []
+    }
+    _join(dyb_skill, objects, 'skill', skill_cat)
+    
+    for child_idx, item in enumerate(skill_cat.get('items', [])):
+        dyb_skill['children'].append(_build_skill_child(item, idx, child_idx, objects))
+    return dyb_skill
+
+
+def _build_skill_child(item: Any, idx: int, child_idx: int, objects: Dict[str, Any]) -> Dict[str, Any]:
+    """DoYouBuzz skill child from a skill item"""
+    # Handle both dict (with metadata) and string formats
+    if isinstance(item, dict):
+        skill_name = item.get('name', '')
+        skill_level = item.get('level', 0)
+        child_id = item.get('_dyb_id', 63000000 + idx * 1000 + child_idx)
+        child_skillTerm = item.get('_dyb_skillTerm')
+        child_views = item.get('_dyb_views', [])
+        child_home = item.get('_dyb_home', True)
+        child_sort = item.get('_dyb_sort', child_idx)
+    else:
+        # Old string format: "Skill Name (80%)" or just "Skill Name"
+        item_str = str(item)
+        if '(' in item_str and ')' in item_str:
+            skill_name = item_str.split('(')[0].strip()
+            level_str = item_str.split('(')[1].split(')')[0].replace('%', '').strip()
+            skill_level = int(level_str) if level_str.isdigit() else 0
+        else:
+            skill_name = item_str
+            skill_level = 0
+        child_id = 63000000 + idx * 1000 + child_idx
+        child_skillTerm = None
+        child_views = []
+        child_home = True
+        child_sort = child_idx
+    
+    dyb_child = {
+        "$views": child_views,
+        "skillTerm": child_skillTerm,
+        "id": child_id,
+        "home": child_home,
+        "sort": child_sort,
+        "description": skill_name,
+        "children": []
+    }
+    
+    # Add level only if not zero
+    if skill_level > 0:
+        dyb_child["level"] = skill_level
+    
+    return _join(dyb_child, objects, 'skill_item', item)
+
+
+def _build_entry(entry: Any, kind: str, default_id: int, default_sort: int, objects: Dict[str, Any]) -> Dict[str, Any]:
+    """DoYouBuzz mission/result/environment from a simplified entry"""
+    # Handle both dict (with _dyb_id) and string formats
+    if isinstance(entry, dict):
+        desc = entry.get('description', '')
+        entry_id = entry.get('_dyb_id', default_id)
+        entry_sort = entry.get('_dyb_sort', default_sort)
+    else:
+        desc = str(entry)
+        entry_id = default_id
+        entry_sort = default_sort
+    
+    dyb_entry = {
+        "toDel": False,
+        "id": entry_id,
+        "sort": entry_sort,
+        "description": desc,
+        "type": kind
+    }
+    return _join(dyb_entry, objects, kind, entry)
+
+
+def _build_context(exp: Dict[str, Any], idx: int, objects: Dict[str, Any]) -> Dict[str, Any]:
+    """DoYouBuzz context of an experience"""
+    dyb_context = {
+        "toDel": False,
+        "id": exp.get('_dyb_context_id', 100000000 + idx * 100),
+        "sort": 0,
+        "description": exp['context'],
+        "type": "context"
+    }
+    if objects and exp.get('_dyb_context_id') is not None:
+        _join(dyb_context, objects, 'context', {'_dyb_id': exp['_dyb_context_id']})
+    return dyb_context
+
+
+def _build_experience(exp: Dict[str, Any], idx: int, objects: Dict[str, Any]) -> Dict[str, Any]:
+    """DoYouBuzz experience with its missions, results, context and environments"""
+    # Parse dates (use preserved range if available, otherwise parse from simplified fields)
+    if exp.get('_dyb_range_full'):
+        range_obj = exp['_dyb_range_full']
+    else:
+        range_obj = _range_from_dates(exp)
+    
+    dyb_exp = {
+        "$views": exp.get('_dyb_views', []),
+        "range": range_obj,
+        "id": exp.get('_dyb_id', 19000000 + idx),
+        "company": exp.get('company', ''),
+        "city": exp.get('location', ''),
+        "home": exp.get('_dyb_home', True),
+        "sort": exp.get('_dyb_sort', idx),
+        "title": exp.get('title', ''),
+        "slug": exp.get('_dyb_slug', exp.get('company', '').lower().replace(' ', '-')),
+        "missions": [],  # ONLY missions (type=mission)
+        "results": [],  # ONLY results (type=result) - separate array
+        "contexts": [],
+        "environments": []
+    }
+    
+    # Preserve additional metadata fields if present
+    if exp.get('_dyb_start'):
+        dyb_exp['start'] = exp['_dyb_start']
+    if exp.get('_dyb_end'):
+        dyb_exp['end'] = exp['_dyb_end']
+    if exp.get('_dyb_logo'):
+        dyb_exp['logo'] = exp['_dyb_logo']
+    if exp.get('_dyb_logos'):
+        dyb_exp['logos'] = exp['_dyb_logos']
     
-    # Store original JSON for reference
-    original_json_path = Path(yaml_path).with_suffix('.original.json')
-    with open(original_json_path, 'w', encoding='utf-8') as f:
-        json.dump(dyb_data, f, ensure_ascii=False, indent=2)
+    _join(dyb_exp, objects, 'experience', exp)
+    # A stored range only stands while the dates shown for editing still match it
+    stored_range = dyb_exp['range']
+    if stored_range is not range_obj and (
+            _format_date(stored_range.get('start', {})) != (exp.get('start_date') or '')
+            or _format_date(stored_range.get('end', {})) != (exp.get('end_date') or '')):
+        dyb_exp['range'] = _range_from_dates(exp)
+    
+    # Add missions (ONLY type=mission goes here)
+    for mis_idx, mission in enumerate(exp.get('missions', [])):
+        dyb_exp['missions'].append(
+            _build_entry(mission, 'mission', 100000000 + idx * 100 + mis_idx, mis_idx, objects))
+    
+    # Add results (in SEPARATE results[] array)
+    for res_idx, result in enumerate(exp.get('results', [])):
+        dyb_result = _build_entry(result, 'result', 100000000 + idx * 100 + res_idx + 20, res_idx, objects)
+        if dyb_result['description']:  # Only add non-empty results
+            dyb_exp['results'].append(dyb_result)
+    
+    # Objectives not used by DoYouBuzz import - removed
+    
+    # Add context
+    if exp.get('context'):
+        dyb_exp['contexts'].append(_build_context(exp, idx, objects))
+    
+    # Add environments
+    for env_idx, environment in enumerate(exp.get('environments', [])):
+        dyb_exp['environments'].append(
+            _build_entry(environment, 'environment', 100000000 + idx * 100 + env_idx + 50, env_idx, objects))
+    
+    return dyb_exp
+
+
+def _build_certificate(cert: Dict[str, Any], idx: int, objects: Dict[str, Any]) -> Dict[str, Any]:
+    """DoYouBuzz certificate from a simplified certification"""
+    # If we have the full preserved object, use it as-is (name/issuer not editable)
+    if cert.get('_dyb_full'):
+        cert_obj = cert['_dyb_full'].copy()
+        # Only update the date field (editable)
+        cert_obj['obtainedAt'] = cert.get('date', '')
+        return cert_obj
+    
+    # Create new certificate
+    name = cert.get('name', '')
+    issuer = cert.get('issuer', '')
+    if issuer and issuer not in name:
+        name = f"{name} - {issuer}"
+    
+    dyb_cert = {
+        "$views": cert.get('_dyb_views', []),
+        "id": cert.get('_dyb_id', 1000000 + idx),
+        "name": name,
+        "obtainedAt": cert.get('date', ''),
+        "sort": cert.get('_dyb_sort', idx)
+    }
+    _join(dyb_cert, objects, 'certificate', cert)
+    # A stored name (one the name/issuer split cannot rebuild) only stands while unedited
+    if dyb_cert['name'] != name and _split_certificate_name(dyb_cert['name']) != (cert.get('name', ''), issuer):
+        dyb_cert['name'] = name
+    return dyb_cert
+
+
+def _build_language(lang: Dict[str, Any], idx: int, objects: Dict[str, Any]) -> Dict[str, Any]:
+    """DoYouBuzz language skill from a simplified language"""
+    # If we have the full preserved object, use it
+    if lang.get('_dyb_full'):
+        return lang['_dyb_full']
+    
+    # Create new language entry
+    dyb_lang = {
+        "id": lang.get('_dyb_id', 2000000 + idx),
+        "culture": lang.get('_dyb_culture', 'en'),
+        "level": lang.get('_dyb_level', 95),
+        "details": lang.get('_dyb_details', ''),
+        "sort": lang.get('_dyb_sort', idx)
+    }
+    return _join(dyb_lang, objects, 'language', lang)
+
+
+# --- Pure transforms ---------------------------------------------------------
+
+@timed('dyb_to_showcase', 'transform')
+def dyb_to_showcase(dyb_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the simplified showcase dict from DoYouBuzz JSON (no I/O)
+    
+    Editable items keep only their _dyb_id; the rest of each DoYouBuzz
+    object goes to the _doyoubuzz_metadata objects table, and only where
+    it differs from what showcase_to_dyb rebuilds by itself. Nested
+    metadata objects are shared with ``dyb_data``, not copied.
+    """
+    objects: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+    
+    def remember(kind: str, obj_id: Any, extras: Dict[str, Any]) -> None:
+        if extras and obj_id is not None:
+            objects.setdefault(kind, {})[obj_id] = extras
+    
+    contacts = dyb_data.get('contacts')
+    if isinstance(contacts, dict) and isinstance(contacts.get('address'), dict):
+        contacts = dict(contacts, address=_without(contacts['address'], ('country',)))
     
     # Build simplified structure with full metadata preservation
+    meta = {field: dyb_data.get(field) for field in META_FIELDS}
+    meta.update({
+        # Owner/contacts/presentation/title minus the fields the showcase edits
+        'owner_full': _without(dyb_data.get('owner'), OWNER_EDITABLE),
+        'contacts_full': contacts,
+        'presentation_full': _without(dyb_data.get('presentation'), PRESENTATION_EDITABLE),
+        'title_full': _without(dyb_data.get('title'), TITLE_EDITABLE),
+        OBJECTS_KEY: objects
+    })
     showcase = {
         'personal_info': {
             'name': f"{dyb_data['owner']['firstname']} {dyb_data['owner']['lastname']}",
@@ -37,79 +395,27 @@ def json_to_yaml(json_path: str, yaml_path: str) -> None:
         'certifications': [],
         'languages': [],
         # Preserve ALL DoYouBuzz metadata for perfect round-trip
-        '_doyoubuzz_metadata': {
-            'id': dyb_data.get('id'),
-            'url': dyb_data.get('url'),
-            'color': dyb_data.get('color'),
-            'completion': dyb_data.get('completion'),
-            'culture': dyb_data.get('culture'),
-            'language': dyb_data.get('language'),
-            'description': dyb_data.get('description'),
-            'createdAt': dyb_data.get('createdAt'),
-            'updatedAt': dyb_data.get('updatedAt'),
-            'published': dyb_data.get('published'),
-            'uploaded': dyb_data.get('uploaded'),
-            'referenced': dyb_data.get('referenced'),
-            'hidden': dyb_data.get('hidden'),
-            'main': dyb_data.get('main'),
-            'mainCvGroup': dyb_data.get('mainCvGroup'),
-            'protected': dyb_data.get('protected'),
-            'passwordProtected': dyb_data.get('passwordProtected'),
-            'renderingMode': dyb_data.get('renderingMode'),
-            'yearsExperience': dyb_data.get('yearsExperience'),
-            'availability': dyb_data.get('availability'),
-            'options': dyb_data.get('options'),
-            'download': dyb_data.get('download'),
-            'positions': dyb_data.get('positions'),
-            'professionalPosition': dyb_data.get('professionalPosition'),
-            'tags': dyb_data.get('tags'),
-            'educations': dyb_data.get('educations'),
-            'events': dyb_data.get('events'),
-            'interests': dyb_data.get('interests'),
-            'portfolios': dyb_data.get('portfolios'),
-            # Preserve full owner and contacts objects (not just extracted fields)
-            'owner_full': dyb_data.get('owner'),
-            'contacts_full': dyb_data.get('contacts'),
-            'presentation_full': dyb_data.get('presentation'),
-            'title_full': dyb_data.get('title')
-        }
+        '_doyoubuzz_metadata': meta
     }
     
     # Convert skills - preserve IDs for editing
     for skill in dyb_data.get('skills', []):
-        skill_category = {
-            'category': skill['description'],
-            'items': [],
-            # Preserve parent skill metadata
-            '_dyb_id': skill.get('id'),
-            '_dyb_sort': skill.get('sort', 0),
-            '_dyb_skillTerm': skill.get('skillTerm'),
-            '_dyb_views': skill.get('$views'),
-            '_dyb_home': skill.get('home')
-        }
+        idx = len(showcase['skills'])
+        skill_category = {'category': skill['description'], 'items': [], '_dyb_id': skill.get('id')}
         for child in skill.get('children', []):
-            # Extract skill name and level
-            skill_name = child['description']
-            skill_level = child.get('level', 0)
-            
-            # Create item with metadata
-            item = {
-                'name': skill_name,
-                'level': skill_level,
-                # Preserve child metadata
-                '_dyb_id': child.get('id'),
-                '_dyb_sort': child.get('sort', 0),
-                '_dyb_skillTerm': child.get('skillTerm'),
-                '_dyb_views': child.get('$views'),
-                '_dyb_home': child.get('home')
-            }
+            item = {'name': child['description'], 'level': child.get('level', 0), '_dyb_id': child.get('id')}
+            built = _build_skill_child(item, idx, len(skill_category['items']), {})
+            remember('skill_item', child.get('id'), _extras(child, built, ('description', 'level')))
             skill_category['items'].append(item)
         
         if skill_category['items']:
+            built = _build_skill(skill_category, idx, {})
+            remember('skill', skill.get('id'), _extras(skill, built, ('description', 'children')))
             showcase['skills'].append(skill_category)
     
     # Convert experiences - store with DoYouBuzz IDs for round-trip
     for exp in dyb_data.get('experiences', []):
+        idx = len(showcase['experience'])
         # DoYouBuzz can store items in two ways:
         # 1. All in missions[] array with type field (mission/result/objective)
         # 2. Separate arrays: missions[], results[], objectives[]
@@ -118,156 +424,102 @@ def json_to_yaml(json_path: str, yaml_path: str) -> None:
         missions = []
         results = []
         
+        def add_entry(raw: Dict[str, Any], kind: str, default_id: int, target: list) -> None:
+            entry = {'description': raw['description'], '_dyb_id': raw.get('id')}
+            built = _build_entry(entry, kind, default_id, len(target), {})
+            remember(kind, raw.get('id'), _extras(raw, built, ('description',)))
+            target.append(entry)
+        
         # Extract from missions array (filter by type)
         for m in exp.get('missions', []):
             item_type = m.get('type', 'mission')
-            item_data = {
-                'description': m['description'],
-                '_dyb_id': m.get('id'),
-                '_dyb_sort': m.get('sort', 0)
-            }
-            
             if item_type == 'mission':
-                missions.append(item_data)
+                add_entry(m, 'mission', 100000000 + idx * 100 + len(missions), missions)
             elif item_type == 'result':
-                results.append(item_data)
+                add_entry(m, 'result', 100000000 + idx * 100 + len(results) + 20, results)
             # objectives ignored - not used by DoYouBuzz import
         
         # Also extract from separate results[] array (if present)
         for r in exp.get('results', []):
-            results.append({
-                'description': r['description'],
-                '_dyb_id': r.get('id'),
-                '_dyb_sort': r.get('sort', 0)
-            })
-        
-        # Extract context
-        context = ''
-        context_id = None
-        if exp.get('contexts'):
-            context = exp['contexts'][0].get('description', '')
-            context_id = exp['contexts'][0].get('id')
+            add_entry(r, 'result', 100000000 + idx * 100 + len(results) + 20, results)
         
         # Extract environments
         environments = []
         for env in exp.get('environments', []):
-            environments.append({
-                'description': env['description'],
-                '_dyb_id': env.get('id'),
-                '_dyb_sort': env.get('sort', 0)
-            })
+            add_entry(env, 'environment', 100000000 + idx * 100 + len(environments) + 50, environments)
         
         experience_entry = {
             'title': exp.get('title', ''),
             'company': exp.get('company', ''),
             'location': exp.get('city', ''),
-            'start_date': f"{exp['range']['start'].get('year', '')}-{exp['range']['start'].get('month', '').zfill(2) if exp['range']['start'].get('month') else ''}".rstrip('-'),
-            'end_date': f"{exp['range']['end'].get('year', '')}-{exp['range']['end'].get('month', '').zfill(2) if exp['range']['end'].get('month') else ''}".rstrip('-'),
-            'context': context,
+            'start_date': _format_date(exp['range']['start']),
+            'end_date': _format_date(exp['range']['end']),
+            'context': '',
             'missions': missions,
             'results': results,
             'environments': environments,
-            # Preserve ALL DoYouBuzz metadata for perfect round-trip
-            '_dyb_id': exp.get('id'),
-            '_dyb_context_id': context_id,
-            '_dyb_sort': exp.get('sort', 0),
-            '_dyb_views': exp.get('$views'),
-            '_dyb_home': exp.get('home'),
-            '_dyb_slug': exp.get('slug'),
-            '_dyb_start': exp.get('start'),
-            '_dyb_end': exp.get('end'),
-            '_dyb_logo': exp.get('logo'),
-            '_dyb_logos': exp.get('logos'),
-            '_dyb_range_full': exp.get('range')  # Preserve full range object
+            '_dyb_id': exp.get('id')
         }
         
+        # Extract context
+        if exp.get('contexts'):
+            context = exp['contexts'][0]
+            experience_entry['context'] = context.get('description', '')
+            experience_entry['_dyb_context_id'] = context.get('id')
+            if experience_entry['context']:
+                built = _build_context(experience_entry, idx, {})
+                remember('context', context.get('id'), _extras(context, built, ('description',)))
+        
+        built = _build_experience(dict(experience_entry, missions=[], results=[], environments=[], context=''), idx, {})
+        remember('experience', exp.get('id'), _extras(
+            exp, built, ('title', 'company', 'city', 'missions', 'results', 'contexts', 'environments'), keep=('slug',)))
         showcase['experience'].append(experience_entry)
     
     # Convert certifications
     for cert in dyb_data.get('certificates', []):
-        parts = cert['name'].split(' - ')
-        name = parts[0] if len(parts) > 0 else cert['name']
-        issuer = parts[1] if len(parts) > 1 else ''
-        
+        name, issuer = _split_certificate_name(cert['name'])
         cert_entry = {
             'name': name,
             'issuer': issuer,
             'date': cert.get('obtainedAt', ''),
             'credential_url': '',
-            # Preserve ALL metadata
-            '_dyb_id': cert.get('id'),
-            '_dyb_sort': cert.get('sort', 0),
-            '_dyb_views': cert.get('$views'),
-            '_dyb_full': cert  # Preserve entire object
+            '_dyb_id': cert.get('id')
         }
+        built = _build_certificate(cert_entry, len(showcase['certifications']), {})
+        remember('certificate', cert.get('id'), _extras(cert, built, ('obtainedAt',)))
         showcase['certifications'].append(cert_entry)
     
     # Convert languages
     for lang in dyb_data.get('languageSkills', {}).get('elements', []):
-        lang_map = {'en': 'Anglais', 'fr': 'Français', 'es': 'Espagnol', 'de': 'Allemand'}
         lang_code = lang.get('culture', '').split('_')[0]
-        lang_name = lang_map.get(lang_code, lang_code.upper())
-        
         lang_entry = {
-            'language': lang_name,
+            'language': LANG_MAP.get(lang_code, lang_code.upper()),
             'proficiency': f"{lang.get('details', '')} ({lang.get('level', '')}%)".strip(),
-            # Preserve ALL metadata
-            '_dyb_id': lang.get('id'),
-            '_dyb_culture': lang.get('culture'),
-            '_dyb_level': lang.get('level'),
-            '_dyb_details': lang.get('details'),
-            '_dyb_sort': lang.get('sort'),
-            '_dyb_full': lang  # Preserve entire object
+            '_dyb_id': lang.get('id')
         }
+        built = _build_language(lang_entry, len(showcase['languages']), {})
+        remember('language', lang.get('id'), _extras(lang, built))
         showcase['languages'].append(lang_entry)
     
-    # Save to YAML
-    with open(yaml_path, 'w', encoding='utf-8') as f:
-        yaml.dump(showcase, f, allow_unicode=True, sort_keys=False, default_flow_style=False, width=1000)
-    
-    print(f"[OK] Converted {json_path} to {yaml_path}")
-    print(f"[INFO] Original JSON saved to {original_json_path} for reference")
+    return showcase
 
 
-def yaml_to_json(yaml_path: str, json_path: str, original_json_path: str = None) -> None:
-    """Convert simplified YAML back to DoYouBuzz JSON format"""
-    with open(yaml_path, 'r', encoding='utf-8') as f:
-        showcase = yaml.safe_load(f)
+@timed('showcase_to_dyb', 'transform')
+def showcase_to_dyb(showcase: Dict[str, Any], original: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build DoYouBuzz JSON from a showcase dict (original JSON is used as template if no metadata)"""
+    if not isinstance(showcase, dict):
+        raise ConversionError(f"Showcase must be a mapping, got {type(showcase).__name__}")
     
-    # Start with metadata if available, otherwise load original or create minimal
+    objects = {}
+    # Start with metadata if available, otherwise use original or create minimal
     if '_doyoubuzz_metadata' in showcase:
-        # Use preserved metadata as base
-        meta = showcase['_doyoubuzz_metadata']
-        dyb_data = {
-            'id': meta.get('id'),
-            'url': meta.get('url'),
-            'color': meta.get('color'),
-            'completion': meta.get('completion'),
-            'culture': meta.get('culture'),
-            'language': meta.get('language'),
-            'description': meta.get('description'),
-            'createdAt': meta.get('createdAt'),
-            'updatedAt': meta.get('updatedAt'),
-            'published': meta.get('published'),
-            'uploaded': meta.get('uploaded'),
-            'referenced': meta.get('referenced'),
-            'hidden': meta.get('hidden'),
-            'main': meta.get('main'),
-            'mainCvGroup': meta.get('mainCvGroup'),
-            'protected': meta.get('protected'),
-            'passwordProtected': meta.get('passwordProtected'),
-            'renderingMode': meta.get('renderingMode'),
-            'yearsExperience': meta.get('yearsExperience'),
-            'availability': meta.get('availability'),
-            'options': meta.get('options'),
-            'download': meta.get('download'),
-            'positions': meta.get('positions'),
-            'professionalPosition': meta.get('professionalPosition'),
-            'tags': meta.get('tags'),
-            'educations': meta.get('educations', []),
-            'events': meta.get('events', []),
-            'interests': meta.get('interests', []),
-            'portfolios': meta.get('portfolios', []),
+        # Use preserved metadata as base (copied: owner/contacts/title are updated in place below)
+        meta = copy.deepcopy(showcase['_doyoubuzz_metadata'])
+        objects = meta.get(OBJECTS_KEY) or {}
+        dyb_data = {field: meta.get(field) for field in META_FIELDS}
+        for field in ('educations', 'events', 'interests', 'portfolios'):
+            dyb_data[field] = meta.get(field, [])
+        dyb_data.update({
             'owner': meta.get('owner_full', {}),
             'contacts': meta.get('contacts_full', {}),
             'presentation': meta.get('presentation_full', {}),
@@ -276,11 +528,10 @@ def yaml_to_json(yaml_path: str, json_path: str, original_json_path: str = None)
             'skills': [],
             'certificates': [],
             'languageSkills': {"elements": []}
-        }
-    elif original_json_path and Path(original_json_path).exists():
-        # Load original JSON as template
-        with open(original_json_path, 'r', encoding='utf-8') as f:
-            dyb_data = json.load(f)
+        })
+    elif original is not None:
+        # Use original JSON as template
+        dyb_data = copy.deepcopy(original)
     else:
         # Create minimal structure
         dyb_data = {
@@ -321,246 +572,649 @@ def yaml_to_json(yaml_path: str, json_path: str, original_json_path: str = None)
     dyb_data['presentation']['text'] = showcase.get('summary', '')
     
     # Update experiences
-    dyb_experiences = []
-    for idx, exp in enumerate(showcase.get('experience', [])):
-        # Parse dates (use preserved range if available, otherwise parse from simplified fields)
-        if exp.get('_dyb_range_full'):
-            range_obj = exp['_dyb_range_full']
-        else:
-            start_parts = exp.get('start_date', '').split('-')
-            end_parts = exp.get('end_date', '').split('-')
-            range_obj = {
-                "start": {
-                    "year": start_parts[0] if len(start_parts) > 0 else "",
-                    "month": start_parts[1] if len(start_parts) > 1 else ""
-                },
-                "end": {
-                    "year": end_parts[0] if len(end_parts) > 0 else "",
-                    "month": end_parts[1] if len(end_parts) > 1 else ""
-                }
-            }
-        
-        dyb_exp = {
-            "$views": exp.get('_dyb_views', []),
-            "range": range_obj,
-            "id": exp.get('_dyb_id', 19000000 + idx),
-            "company": exp.get('company', ''),
-            "city": exp.get('location', ''),
-            "home": exp.get('_dyb_home', True),
-            "sort": exp.get('_dyb_sort', idx),
-            "title": exp.get('title', ''),
-            "slug": exp.get('_dyb_slug', exp.get('company', '').lower().replace(' ', '-')),
-            "missions": [],  # ONLY missions (type=mission)
-            "results": [],  # ONLY results (type=result) - separate array
-            "contexts": [],
-            "environments": []
-        }
-        
-        # Preserve additional metadata fields if present
-        if exp.get('_dyb_start'):
-            dyb_exp['start'] = exp['_dyb_start']
-        if exp.get('_dyb_end'):
-            dyb_exp['end'] = exp['_dyb_end']
-        if exp.get('_dyb_logo'):
-            dyb_exp['logo'] = exp['_dyb_logo']
-        if exp.get('_dyb_logos'):
-            dyb_exp['logos'] = exp['_dyb_logos']
-        
-        # Add missions (ONLY type=mission goes here)
-        for mis_idx, mission in enumerate(exp.get('missions', [])):
-            if isinstance(mission, dict):
-                desc = mission.get('description', '')
-                mis_id = mission.get('_dyb_id', 100000000 + idx * 100 + mis_idx)
-                mis_sort = mission.get('_dyb_sort', mis_idx)
-            else:
-                desc = str(mission)
-                mis_id = 100000000 + idx * 100 + mis_idx
-                mis_sort = mis_idx
-            
-            dyb_exp['missions'].append({
-                "toDel": False,
-                "id": mis_id,
-                "sort": mis_sort,
-                "description": desc,
-                "type": "mission"
-            })
-        
-        # Add results (in SEPARATE results[] array)
-        for res_idx, result in enumerate(exp.get('results', [])):
-            if isinstance(result, dict):
-                desc = result.get('description', '')
-                res_id = result.get('_dyb_id', 100000000 + idx * 100 + res_idx + 20)
-                res_sort = result.get('_dyb_sort', res_idx)
-            else:
-                desc = str(result)
-                res_id = 100000000 + idx * 100 + res_idx + 20
-                res_sort = res_idx
-            
-            if desc:  # Only add non-empty results
-                dyb_exp['results'].append({
-                    "toDel": False,
-                    "id": res_id,
-                    "sort": res_sort,
-                    "description": desc,
-                    "type": "result"
-                })
-        
-        # Objectives not used by DoYouBuzz import - removed
-        
-        # Add context
-        if exp.get('context'):
-            dyb_exp['contexts'].append({
-                "toDel": False,
-                "id": exp.get('_dyb_context_id', 100000000 + idx * 100),
-                "sort": 0,
-                "description": exp['context'],
-                "type": "context"
-            })
-        
-        # Add environments
-        for env_idx, environment in enumerate(exp.get('environments', [])):
-            if isinstance(environment, dict):
-                desc = environment.get('description', '')
-                env_id = environment.get('_dyb_id', 100000000 + idx * 100 + env_idx + 50)
-                env_sort = environment.get('_dyb_sort', env_idx)
-            else:
-                desc = str(environment)
-                env_id = 100000000 + idx * 100 + env_idx + 50
-                env_sort = env_idx
-            
-            dyb_exp['environments'].append({
-                "toDel": False,
-                "id": env_id,
-                "sort": env_sort,
-                "description": desc,
-                "type": "environment"
-            })
-        
-        dyb_experiences.append(dyb_exp)
-    
-    dyb_data['experiences'] = dyb_experiences
+    dyb_data['experiences'] = [
+        _build_experience(exp, idx, objects)
+        for idx, exp in enumerate(showcase.get('experience', []))
+    ]
     
     # Update certifications - preserve all metadata
-    dyb_certs = []
-    for idx, cert in enumerate(showcase.get('certifications', [])):
-        # If we have the full preserved object, use it as-is (name/issuer not editable)
-        if cert.get('_dyb_full'):
-            cert_obj = cert['_dyb_full'].copy()
-            # Only update the date field (editable)
-            cert_obj['obtainedAt'] = cert.get('date', '')
-            dyb_certs.append(cert_obj)
-        else:
-            # Create new certificate
-            name = cert.get('name', '')
-            issuer = cert.get('issuer', '')
-            if issuer and issuer not in name:
-                name = f"{name} - {issuer}"
-            
-            dyb_certs.append({
-                "$views": cert.get('_dyb_views', []),
-                "id": cert.get('_dyb_id', 1000000 + idx),
-                "name": name,
-                "obtainedAt": cert.get('date', ''),
-                "sort": cert.get('_dyb_sort', idx)
-            })
-    
-    dyb_data['certificates'] = dyb_certs
+    dyb_data['certificates'] = [
+        _build_certificate(cert, idx, objects)
+        for idx, cert in enumerate(showcase.get('certifications', []))
+    ]
     
     # Update languages - preserve all metadata
-    dyb_langs = []
-    for idx, lang in enumerate(showcase.get('languages', [])):
-        # If we have the full preserved object, use it
-        if lang.get('_dyb_full'):
-            dyb_langs.append(lang['_dyb_full'])
-        else:
-            # Create new language entry
-            dyb_langs.append({
-                "id": lang.get('_dyb_id', 2000000 + idx),
-                "culture": lang.get('_dyb_culture', 'en'),
-                "level": lang.get('_dyb_level', 95),
-                "details": lang.get('_dyb_details', ''),
-                "sort": lang.get('_dyb_sort', idx)
-            })
-    
+    dyb_langs = [
+        _build_language(lang, idx, objects)
+        for idx, lang in enumerate(showcase.get('languages', []))
+    ]
     if dyb_langs:
         if 'languageSkills' not in dyb_data:
             dyb_data['languageSkills'] = {}
         dyb_data['languageSkills']['elements'] = dyb_langs
     
     # Rebuild skills from edited YAML structure
-    dyb_skills = []
-    for idx, skill_cat in enumerate(showcase.get('skills', [])):
-        dyb_skill = {
-            "$views": skill_cat.get('_dyb_views', []),
-            "skillTerm": skill_cat.get('_dyb_skillTerm'),
-            "id": skill_cat.get('_dyb_id', 63000000 + idx),
-            "home": skill_cat.get('_dyb_home', True),
-            "sort": skill_cat.get('_dyb_sort', idx),
-            "description": skill_cat.get('category', ''),
-            "children": []
-        }
+    dyb_data['skills'] = [
+        _build_skill(skill_cat, idx, objects)
+        for idx, skill_cat in enumerate(showcase.get('skills', []))
+    ]
+    
+    return dyb_data
+
+
+def compact_showcase(showcase: Dict[str, Any]) -> Dict[str, Any]:
+    """Rewrite a showcase with inline _dyb_* metadata into the objects-table form
+    
+    Fields DoYouBuzz does not store (phone, LinkedIn, GitHub, credential
+    URLs, _variant_info) are carried over unchanged.
+    """
+    compacted = dyb_to_showcase(showcase_to_dyb(showcase))
+    
+    for field in ('phone', 'linkedin', 'github'):
+        compacted['personal_info'][field] = showcase.get('personal_info', {}).get(field, '')
+    for cert, compact_cert in zip(showcase.get('certifications', []), compacted['certifications']):
+        compact_cert['credential_url'] = cert.get('credential_url', '')
+    if '_variant_info' in showcase:
+        compacted['_variant_info'] = showcase['_variant_info']
+    return compacted
+
+
+# --- Streaming I/O layer -----------------------------------------------------
+# Readers take any text stream; writers emit output chunk by chunk into any
+# text stream (file, StringIO, socket wrapper), so callers never need an
+# intermediate file or a fully materialised output string.
+
+@timed('read_dyb', 'parse')
+def read_dyb(stream: TextIO) -> Dict[str, Any]:
+    """Read DoYouBuzz JSON from a text stream"""
+    return json.load(stream)
+
+
+@timed('read_showcase', 'parse')
+def read_showcase(stream: TextIO) -> Dict[str, Any]:
+    """Read a showcase YAML document from a text stream"""
+    return yaml_backend.load(stream)
+
+
+@timed('write_dyb', 'serialise')
+def write_dyb(dyb_data: Dict[str, Any], stream: TextIO) -> None:
+    """Write DoYouBuzz JSON to a text stream, chunk by chunk"""
+    json.dump(dyb_data, stream, ensure_ascii=False, indent=2)
+
+
+@timed('write_showcase', 'serialise')
+def write_showcase(showcase: Dict[str, Any], stream: TextIO) -> None:
+    """Write a showcase as YAML to a text stream, event by event"""
+    yaml_backend.dump(showcase, stream, width=1000)
+
+
+def load_original_json(original_json_path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Load the original DoYouBuzz JSON kept next to a showcase, if any"""
+    if not original_json_path or not Path(original_json_path).exists():
+        return None
+    with open(original_json_path, 'r', encoding='utf-8') as f:
+        return read_dyb(f)
+
+
+def _template_for(showcase: Dict[str, Any], original_json_path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Original JSON template, only needed when the showcase carries no metadata"""
+    if isinstance(showcase, dict) and '_doyoubuzz_metadata' in showcase:
+        return None
+    return load_original_json(original_json_path)
+
+
+# --- Import -------------------------------------------------------------------
+
+IMPORT_MAX_BYTES = 20 * 1024 * 1024
+
+# Keys the editor indexes directly: required, with the type they must have
+SHOWCASE_SHAPE = {
+    'personal_info': dict,
+    'skills': list,
+    'experience': list,
+    'certifications': list,
+    'languages': list,
+}
+# Keys every mapping of a section must have (the editor reads them with [])
+REQUIRED_FIELDS = {
+    'personal_info': ('name', 'title', 'email', 'phone', 'location', 'website', 'linkedin', 'github'),
+    'skills': ('category', 'items'),
+}
+# Fields shown in text inputs: text (or null) when present
+TEXT_FIELDS = {
+    'personal_info': REQUIRED_FIELDS['personal_info'],
+    'skills': ('category',),
+    'experience': ('title', 'company', 'location', 'start_date', 'end_date', 'context'),
+    'certifications': ('name', 'issuer', 'date', 'credential_url'),
+    'languages': ('language', 'proficiency'),
+}
+# Sub-lists of section items: lists when present
+ITEM_LISTS = {'skills': ('items',), 'experience': ('missions', 'results', 'environments')}
+
+
+def _check_mapping(section: str, path: str, value: Dict[str, Any], problems: List[str]) -> None:
+    """Problems of one personal_info/skill/experience... mapping"""
+    for field in REQUIRED_FIELDS.get(section, ()):
+        if field not in value:
+            problems.append(f"{path}: missing {field}")
+    for field in TEXT_FIELDS.get(section, ()):
+        if value.get(field) is not None and not isinstance(value[field], str):
+            problems.append(f"{path}.{field}: expected text, got {type(value[field]).__name__}")
+    for field in ITEM_LISTS.get(section, ()):
+        if value.get(field) is not None and not isinstance(value[field], list):
+            problems.append(f"{path}.{field}: expected list, got {type(value[field]).__name__}")
+
+
+def validate_showcase(showcase: Any) -> List[str]:
+    """Problems that would break the editor (empty when ``showcase`` is usable)"""
+    if not isinstance(showcase, dict):
+        return [f"Expected a showcase mapping, got {type(showcase).__name__}"]
+    problems = []
+    if showcase.get('summary') is not None and not isinstance(showcase['summary'], str):
+        problems.append(f"summary: expected text, got {type(showcase['summary']).__name__}")
+    for key, expected in SHOWCASE_SHAPE.items():
+        value = showcase.get(key)
+        if key not in showcase:
+            problems.append(f"missing {key}")
+        elif not isinstance(value, expected):
+            problems.append(f"{key}: expected {expected.__name__}, got {type(value).__name__}")
+        elif expected is dict:
+            _check_mapping(key, key, value, problems)
+        else:
+            for idx, item in enumerate(value):
+                if isinstance(item, dict):
+                    _check_mapping(key, f"{key}[{idx}]", item, problems)
+                else:
+                    problems.append(f"{key}[{idx}]: expected a mapping, got {type(item).__name__}")
+    return problems
+
+
+def _is_showcase(data: Any) -> bool:
+    """True for a showcase (e.g. exported from this app as JSON), False for a DoYouBuzz export"""
+    return isinstance(data, dict) and ('_doyoubuzz_metadata' in data or 'experience' in data or 'personal_info' in data)
+
+
+def import_upload(stream: BinaryIO, max_bytes: Optional[int] = None) -> Dict[str, Any]:
+    """Read an uploaded DoYouBuzz export (or showcase JSON) and convert it to a validated showcase
+    
+    At most ``max_bytes`` are read, so an oversized upload is rejected
+    before anything is decoded; the raw bytes are released before the
+    conversion. Returns ``{'ok': True, 'showcase', 'source': 'doyoubuzz'|'showcase', 'bytes'}``
+    or ``{'ok': False, 'error': {'type', 'message'}}``.
+    """
+    max_bytes = IMPORT_MAX_BYTES if max_bytes is None else max_bytes
+    try:
+        with timed('import_upload', 'parse') as t:
+            raw = stream.read(max_bytes + 1)
+            size = len(raw)
+            if size > max_bytes:
+                raise ConversionError(f"Upload larger than {max_bytes / (1024 * 1024):.1f} MB")
+            data = json.loads(raw)
+            del raw
+            t.add(bytes=size)
+        if not isinstance(data, dict):
+            raise ConversionError(f"Expected a JSON object, got {type(data).__name__}")
+        if _is_showcase(data):
+            showcase, source = data, 'showcase'
+        else:
+            try:
+                showcase, source = dyb_to_showcase(data), 'doyoubuzz'
+            except (KeyError, IndexError, TypeError, AttributeError) as e:
+                # A field the DoYouBuzz mapping reads is missing or of the wrong type
+                detail = f"missing field {e}" if isinstance(e, KeyError) else str(e)
+                raise ConversionError(f"Not a DoYouBuzz export ({detail})") from None
+        del data
+        problems = validate_showcase(showcase)
+        if problems:
+            raise ConversionError("; ".join(problems[:5]) + (f" (+{len(problems) - 5} more)" if len(problems) > 5 else ""))
+    except Exception as e:
+        return {'ok': False, 'error': {'type': type(e).__name__, 'message': str(e)}}
+    return {'ok': True, 'showcase': showcase, 'source': source, 'bytes': size}
+
+
+# --- Export cache -------------------------------------------------------------
+#
+# Exported DoYouBuzz JSON is stored under a key hashing the canonical
+# showcase content (sorted keys) and the converter source, so an unchanged
+# showcase is never rebuilt and any converter change invalidates everything.
+# Entries are plain files; a hit refreshes the mtime and the least recently
+# used ones are evicted past EXPORT_CACHE_MAX_BYTES.
+#
+# Callers pass the cache directory (the app keeps it next to the showcases);
+# the yaml2json and batch CLI commands only cache when DC_EXPORT_CACHE_DIR is set.
+
+EXPORT_CACHE_DIR = Path(os.environ['DC_EXPORT_CACHE_DIR']) if os.environ.get('DC_EXPORT_CACHE_DIR') else None
+EXPORT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def converter_version() -> str:
+    """Hash of this module's source code"""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def export_key(showcase: Dict[str, Any], original_json_path: Optional[str] = None) -> str:
+    """Cache key of the export of ``showcase``"""
+    digest = hashlib.sha256(converter_version().encode('utf-8'))
+    digest.update(json.dumps(showcase, sort_keys=True, ensure_ascii=False, separators=(',', ':'),
+                             default=str).encode('utf-8'))
+    if original_json_path and not (isinstance(showcase, dict) and '_doyoubuzz_metadata' in showcase):
+        # Legacy showcases are rebuilt from the original JSON: key on its stamp too
+        with contextlib.suppress(OSError):
+            stat = os.stat(original_json_path)
+            digest.update(f"{os.path.abspath(original_json_path)}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _cache_read(path: Path) -> Optional[bytes]:
+    """Cached bytes, marked as recently used; None on a miss"""
+    try:
+        data = path.read_bytes()
+        os.utime(path)
+        return data
+    except OSError:
+        return None
+
+
+def _cache_write(path: Path, data: bytes) -> None:
+    """Store an entry (best effort: a failed write only costs a rebuild next time)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_io.atomic_write(path, data, fsync=False)
+        prune_export_cache(path.parent)
+    except OSError as e:
+        log.warning(f"Error writing export cache: {e}")
+
+
+def prune_export_cache(cache_dir: Path, max_bytes: Optional[int] = None) -> int:
+    """Evict least recently used entries until the cache fits in ``max_bytes``; returns how many were removed"""
+    max_bytes = EXPORT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    with contextlib.suppress(FileNotFoundError):
+        for entry in os.scandir(cache_dir):
+            if entry.is_file() and not entry.name.startswith('.'):
+                with contextlib.suppress(FileNotFoundError):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+            removed += 1
+        total -= size
+    return removed
+
+
+def export_json(showcase: Dict[str, Any], original_json_path: Optional[str] = None,
+                cache_dir: Optional[Path] = None) -> Tuple[str, bytes, bool]:
+    """(cache key, DoYouBuzz JSON bytes, cache hit) of ``showcase``; conversion errors propagate
+    
+    Without ``cache_dir`` nothing is cached (the key is empty) and no file
+    is written.
+    """
+    key = ''
+    if cache_dir is not None:
+        with timed('export_cache', 'lookup') as t:
+            key = export_key(showcase, original_json_path)
+            payload = _cache_read(Path(cache_dir) / f"{key}.json")
+            t.add(hit=payload is not None)
+        if payload is not None:
+            return key, payload, True
+    dyb_data = showcase_to_dyb(showcase, _template_for(showcase, original_json_path))
+    with timed('export_showcase', 'serialise') as t:
+        payload = json.dumps(dyb_data, ensure_ascii=False, indent=2).encode('utf-8')
+        t.add(bytes=len(payload))
+    if key:
+        _cache_write(Path(cache_dir) / f"{key}.json", payload)
+    return key, payload, False
+
+
+def export_showcase(showcase: Dict[str, Any], original_json_path: Optional[str] = None,
+                    cache_dir: Optional[Path] = None, compress: bool = False) -> Dict[str, Any]:
+    """Convert an in-memory showcase to DoYouBuzz JSON without touching the showcase file
+    
+    Returns ``{'ok': True, 'key', 'cached': bool, 'json': bytes}`` (plus
+    ``'gzip': bytes`` with ``compress``) on success, ``{'ok': False,
+    'error': {'type': ..., 'message': ...}}`` on failure. With ``cache_dir``
+    an unchanged showcase is served from the export cache.
+    """
+    try:
+        key, payload, hit = export_json(showcase, original_json_path, cache_dir)
+    except Exception as e:
+        return {'ok': False, 'error': {'type': type(e).__name__, 'message': str(e)}}
+    result = {'ok': True, 'key': key, 'cached': hit, 'json': payload}
+    if compress:
+        gz_path = Path(cache_dir) / f"{key}.json.gz" if key else None
+        packed = _cache_read(gz_path) if gz_path else None
+        if packed is None:
+            packed = gzip.compress(payload, mtime=0)
+            if gz_path:
+                _cache_write(gz_path, packed)
+        result['gzip'] = packed
+    return result
+
+
+def json_to_yaml(json_path: str, yaml_path: str) -> None:
+    """Convert DoYouBuzz JSON to simplified YAML for editing"""
+    with timed('json_to_yaml', 'total', source=str(json_path)) as t:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            dyb_data = read_dyb(f)
+        
+        # Store original JSON for reference
+        original_json_path = Path(yaml_path).with_suffix('.original.json')
+        with atomic_io.atomic_open(original_json_path) as f:
+            write_dyb(dyb_data, f)
+        
+        with atomic_io.atomic_open(yaml_path) as f:
+            write_showcase(dyb_to_showcase(dyb_data), f)
+        t.add(bytes_in=os.path.getsize(json_path), bytes_out=os.path.getsize(yaml_path))
+    
+    log.info(f"[OK] Converted {json_path} to {yaml_path}")
+    log.info(f"[INFO] Original JSON saved to {original_json_path} for reference")
+
+
+def yaml_to_json(yaml_path: str, json_path: str, original_json_path: str = None) -> None:
+    """Convert simplified YAML back to DoYouBuzz JSON format"""
+    with timed('yaml_to_json', 'total', source=str(yaml_path)) as t:
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            showcase = read_showcase(f)
         
-        for child_idx, item in enumerate(skill_cat.get('items', [])):
-            # Handle both dict (with metadata) and string formats
-            if isinstance(item, dict):
-                skill_name = item.get('name', '')
-                skill_level = item.get('level', 0)
-                child_id = item.get('_dyb_id', 63000000 + idx * 1000 + child_idx)
-                child_skillTerm = item.get('_dyb_skillTerm')
-                child_views = item.get('_dyb_views', [])
-                child_home = item.get('_dyb_home', True)
-                child_sort = item.get('_dyb_sort', child_idx)
+        _, payload, hit = export_json(showcase, original_json_path, EXPORT_CACHE_DIR)
+        atomic_io.atomic_write(json_path, payload)
+        t.add(cached=hit, bytes_in=os.path.getsize(yaml_path), bytes_out=os.path.getsize(json_path))
+    
+    log.info(f"[OK] Converted {yaml_path} to {json_path}")
+    log.info(f"[READY] Ready to import back to DoYouBuzz!")
+
+
+# --- Batch conversion ---------------------------------------------------------
+
+BATCH_MANIFEST = 'batch_manifest.json'
+
+
+def collect_batch_inputs(source: str) -> List[Path]:
+    """Resolve a directory or glob pattern to the JSON/YAML files to convert"""
+    source_path = Path(source)
+    if source_path.is_dir():
+        candidates = [p for pattern in ('*.json', '*.yaml', '*.yml') for p in source_path.glob(pattern)]
+    else:
+        candidates = [Path(p) for p in glob.glob(source, recursive=True)]
+    return sorted(
+        p for p in candidates
+        if p.is_file() and p.suffix in ('.json', '.yaml', '.yml')
+        and not p.name.endswith('.original.json')
+    )
+
+
+def _output_path(src_path: Path, out_dir: str) -> Path:
+    """Where convert_file writes the conversion of ``src_path``"""
+    return Path(out_dir) / f"{src_path.stem}.{'yaml' if src_path.suffix == '.json' else 'json'}"
+
+
+def convert_file(src: str, out_dir: str) -> Dict[str, Any]:
+    """Convert one file according to its extension (JSON -> YAML, YAML -> JSON)
+    
+    Runs in batch worker processes, so it never raises: failures are
+    returned in the result entry. Unlike json_to_yaml, no .original.json
+    copy is written (the showcase already carries the DoYouBuzz metadata).
+    """
+    started = time.perf_counter()
+    src_path = Path(src)
+    entry = {'source': str(src_path), 'output': None, 'ok': False, 'error': None}
+    try:
+        out_path = _output_path(src_path, out_dir)
+        if src_path.suffix == '.json':
+            with open(src_path, 'r', encoding='utf-8') as f:
+                showcase = dyb_to_showcase(read_dyb(f))
+            with atomic_io.atomic_open(out_path) as f:
+                write_showcase(showcase, f)
+        else:
+            with open(src_path, 'r', encoding='utf-8') as f:
+                showcase = read_showcase(f)
+            _, payload, _ = export_json(showcase, str(src_path.with_suffix('.original.json')), EXPORT_CACHE_DIR)
+            atomic_io.atomic_write(out_path, payload)
+        entry.update(ok=True, output=str(out_path), bytes=out_path.stat().st_size)
+    except Exception as e:
+        entry['error'] = {'type': type(e).__name__, 'message': str(e)}
+    entry['seconds'] = round(time.perf_counter() - started, 4)
+    return entry
+
+
+def batch_convert(source: str, out_dir: str, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Convert every JSON/YAML file matched by ``source`` across a process pool
+    
+    Progress and per-file failures are reported as files complete; a failed
+    file never stops the batch. A summary manifest is written to
+    ``out_dir/batch_manifest.json`` and returned. Files that would write
+    the same output (``a.yaml`` and ``a.yml``, or same-named files of
+    different directories) all fail rather than overwrite each other.
+    """
+    files = collect_batch_inputs(source)
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    entries = []
+    
+    by_output: Dict[Path, List[Path]] = {}
+    for p in files:
+        by_output.setdefault(_output_path(p, out_dir), []).append(p)
+    for out_path, sources in by_output.items():
+        if len(sources) > 1:
+            for p in sources:
+                others = ', '.join(str(other) for other in sources if other != p)
+                entries.append({'source': str(p), 'output': None, 'ok': False, 'seconds': 0.0, 'error': {
+                    'type': 'ConversionError', 'message': f"Output {out_path} would also be written from {others}"}})
+                log.warning(f"FAIL {p}: {entries[-1]['error']['message']}")
+    files = [sources[0] for sources in by_output.values() if len(sources) == 1]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(convert_file, str(p), out_dir) for p in files]
+        for done, future in enumerate(as_completed(futures), 1):
+            entry = future.result()
+            entries.append(entry)
+            if entry['ok']:
+                log.info(f"[{done}/{len(files)}] OK {entry['source']} -> {entry['output']}")
+            else:
+                log.warning(f"[{done}/{len(files)}] FAIL {entry['source']}: {entry['error']['type']}: {entry['error']['message']}")
+    
+    entries.sort(key=lambda e: e['source'])
+    failed = [e for e in entries if not e['ok']]
+    manifest = {
+        'source': source,
+        'output_dir': str(out_dir),
+        'workers': workers,
+        'total': len(entries),
+        'converted': len(entries) - len(failed),
+        'failed': len(failed),
+        'seconds': round(time.perf_counter() - started, 3),
+        'files': entries
+    }
+    with atomic_io.atomic_open(Path(out_dir) / BATCH_MANIFEST) as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    
+    log.info(f"[OK] Converted {manifest['converted']}/{manifest['total']} files in {manifest['seconds']}s "
+          f"with {workers} workers ({manifest['failed']} failed)")
+    log.info(f"[INFO] Manifest written to {Path(out_dir) / BATCH_MANIFEST}")
+    return manifest
+
+
+# --- Round-trip verification -------------------------------------------------
+#
+# verify_corpus runs each DoYouBuzz export through the same path as the CLI
+# (JSON -> showcase -> YAML text -> showcase -> JSON) and structurally
+# compares the result with the original. List items with an ``id`` are
+# matched by id, other lists by position; key order is ignored. Each loss
+# is classified by its kind and its path with indices and ids wildcarded.
+
+VERIFY_REPORT = 'verify_report.json'
+VERIFY_EXAMPLES = 3  # examples kept per loss class in the report
+_INDEX_RE = re.compile(r'\[[^\]]*\]')
+
+
+def _id_list(items: list) -> bool:
+    return bool(items) and all(isinstance(item, dict) and 'id' in item for item in items)
+
+
+def structural_diff(original: Any, rebuilt: Any, path: str = '') -> List[Dict[str, Any]]:
+    """Differences between two JSON documents: ``{'kind', 'path', 'original', 'rebuilt'}``
+    
+    Kinds: ``missing`` (dropped by the round trip), ``added``, ``changed``,
+    ``type`` (e.g. string vs dict) and ``reordered`` (same ids, other order).
+    """
+    if isinstance(original, dict) and isinstance(rebuilt, dict):
+        diffs = []
+        for key, value in original.items():
+            if key not in rebuilt:
+                diffs.append({'kind': 'missing', 'path': f"{path}.{key}", 'original': value, 'rebuilt': None})
             else:
-                # Old string format: "Skill Name (80%)" or just "Skill Name"
-                item_str = str(item)
-                if '(' in item_str and ')' in item_str:
-                    skill_name = item_str.split('(')[0].strip()
-                    level_str = item_str.split('(')[1].split(')')[0].replace('%', '').strip()
-                    skill_level = int(level_str) if level_str.isdigit() else 0
+                diffs.extend(structural_diff(value, rebuilt[key], f"{path}.{key}"))
+        diffs.extend({'kind': 'added', 'path': f"{path}.{key}", 'original': None, 'rebuilt': value}
+                     for key, value in rebuilt.items() if key not in original)
+        return diffs
+    if isinstance(original, list) and isinstance(rebuilt, list):
+        if _id_list(original) and _id_list(rebuilt):
+            before = {item['id']: item for item in original}
+            after = {item['id']: item for item in rebuilt}
+            diffs = []
+            for item_id, item in before.items():
+                item_path = f"{path}[id={item_id}]"
+                if item_id not in after:
+                    diffs.append({'kind': 'missing', 'path': item_path, 'original': item, 'rebuilt': None})
                 else:
-                    skill_name = item_str
-                    skill_level = 0
-                child_id = 63000000 + idx * 1000 + child_idx
-                child_skillTerm = None
-                child_views = []
-                child_home = True
-                child_sort = child_idx
-            
-            dyb_child = {
-                "$views": child_views,
-                "skillTerm": child_skillTerm,
-                "id": child_id,
-                "home": child_home,
-                "sort": child_sort,
-                "description": skill_name,
-                "children": []
-            }
-            
-            # Add level only if not zero
-            if skill_level > 0:
-                dyb_child["level"] = skill_level
-            
-            dyb_skill['children'].append(dyb_child)
-        
-        dyb_skills.append(dyb_skill)
+                    diffs.extend(structural_diff(item, after[item_id], item_path))
+            diffs.extend({'kind': 'added', 'path': f"{path}[id={item_id}]", 'original': None, 'rebuilt': item}
+                         for item_id, item in after.items() if item_id not in before)
+            common = [item_id for item_id in before if item_id in after]
+            if common != [item_id for item_id in after if item_id in before]:
+                diffs.append({'kind': 'reordered', 'path': path, 'original': list(before), 'rebuilt': list(after)})
+            return diffs
+        diffs = []
+        for idx, (a, b) in enumerate(zip(original, rebuilt)):
+            diffs.extend(structural_diff(a, b, f"{path}[{idx}]"))
+        diffs.extend({'kind': 'missing', 'path': f"{path}[{idx}]", 'original': item, 'rebuilt': None}
+                     for idx, item in enumerate(original[len(rebuilt):], len(rebuilt)))
+        diffs.extend({'kind': 'added', 'path': f"{path}[{idx}]", 'original': None, 'rebuilt': item}
+                     for idx, item in enumerate(rebuilt[len(original):], len(original)))
+        return diffs
+    if type(original) is not type(rebuilt):
+        return [{'kind': 'type', 'path': path, 'original': original, 'rebuilt': rebuilt}]
+    if original != rebuilt:
+        return [{'kind': 'changed', 'path': path, 'original': original, 'rebuilt': rebuilt}]
+    return []
+
+
+def loss_class(diff: Dict[str, Any]) -> str:
+    """Class of a difference: its kind and wildcarded path, e.g. ``missing .skills[*].children[*].level``"""
+    return f"{diff['kind']} {_INDEX_RE.sub('[*]', diff['path']) or '.'}"
+
+
+def round_trip(dyb_data: Dict[str, Any], yaml_text: bool = True) -> Dict[str, Any]:
+    """DoYouBuzz JSON after json2yaml then yaml2json (neither transform mutates its input)
     
-    dyb_data['skills'] = dyb_skills
+    The showcase goes through serialised YAML unless ``yaml_text`` is False,
+    which skips the slowest step when only the transforms changed.
+    """
+    showcase = dyb_to_showcase(dyb_data)
+    if yaml_text:
+        showcase = yaml_backend.load(yaml_backend.dump(showcase, width=1000))
+    return json.loads(json.dumps(showcase_to_dyb(showcase), ensure_ascii=False))
+
+
+def verify_file(src: str, yaml_text: bool = True) -> Dict[str, Any]:
+    """Round-trip one export and classify its losses; never raises (runs in batch workers)"""
+    started = time.perf_counter()
+    entry = {'source': str(src), 'ok': False, 'losses': 0, 'classes': {}, 'examples': {}, 'error': None}
+    try:
+        with open(src, 'r', encoding='utf-8') as f:
+            original = read_dyb(f)
+        diffs = structural_diff(original, round_trip(original, yaml_text))
+        for diff in diffs:
+            name = loss_class(diff)
+            entry['classes'][name] = entry['classes'].get(name, 0) + 1
+            if name not in entry['examples']:
+                entry['examples'][name] = {key: diff[key] for key in ('path', 'original', 'rebuilt')}
+        entry.update(ok=True, losses=len(diffs))
+    except Exception as e:
+        entry['error'] = {'type': type(e).__name__, 'message': str(e)}
+    entry['seconds'] = round(time.perf_counter() - started, 4)
+    return entry
+
+
+def verify_corpus(source: str, report_path: Optional[str] = None, workers: Optional[int] = None,
+                  yaml_text: bool = True) -> Dict[str, Any]:
+    """Round-trip every DoYouBuzz export matched by ``source`` across a process pool
+    
+    Returns (and writes to ``report_path`` if given) a report with per-file
+    loss counts and the loss classes of the corpus, most widespread first.
+    """
+    files = [p for p in collect_batch_inputs(source) if p.suffix == '.json']
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    
+    # Thousands of small tasks: hand them out in chunks to keep IPC overhead low
+    chunksize = max(1, len(files) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        entries = list(executor.map(verify_file, [str(p) for p in files], [yaml_text] * len(files), chunksize=chunksize))
     
-    # Save to JSON
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(dyb_data, f, ensure_ascii=False, indent=2)
+    classes: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        if not entry['ok']:
+            log.warning(f"FAIL {entry['source']}: {entry['error']['type']}: {entry['error']['message']}")
+            continue
+        for name, count in entry['classes'].items():
+            cls = classes.setdefault(name, {'class': name, 'files': 0, 'count': 0, 'examples': []})
+            cls['files'] += 1
+            cls['count'] += count
+            if len(cls['examples']) < VERIFY_EXAMPLES:
+                cls['examples'].append({'source': entry['source'], **entry['examples'][name]})
+        entry.pop('examples')
     
-    print(f"[OK] Converted {yaml_path} to {json_path}")
-    print(f"[READY] Ready to import back to DoYouBuzz!")
+    failed = sum(1 for e in entries if not e['ok'])
+    lossy = sum(1 for e in entries if e['ok'] and e['losses'])
+    report = {
+        'source': source,
+        'converter': converter_version(),
+        'yaml_text': yaml_text,
+        'workers': workers,
+        'total': len(entries),
+        'lossless': len(entries) - lossy - failed,
+        'lossy': lossy,
+        'failed': failed,
+        'seconds': round(time.perf_counter() - started, 3),
+        'classes': sorted(classes.values(), key=lambda c: (-c['files'], -c['count'], c['class'])),
+        'files': entries
+    }
+    if report_path:
+        with atomic_io.atomic_open(report_path) as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+    
+    log.info(f"[OK] Verified {report['total']} exports in {report['seconds']}s with {workers} workers: "
+             f"{report['lossless']} lossless, {report['lossy']} lossy, {report['failed']} failed")
+    for cls in report['classes']:
+        log.info(f"     {cls['files']:>5} files  {cls['count']:>6}x  {cls['class']}")
+    if report_path:
+        log.info(f"[INFO] Report written to {report_path}")
+    return report
 
 
 if __name__ == "__main__":
     import sys
+    from instrumentation import configure_logging
+    
+    configure_logging()
     
-    if len(sys.argv) < 3:
+    if len(sys.argv) < 3 and sys.argv[1:] != ['serve']:
         print("Usage:")
         print("  Convert JSON to YAML: python doyoubuzz_converter.py json2yaml <input.json> <output.yaml>")
         print("  Convert YAML to JSON: python doyoubuzz_converter.py yaml2json <input.yaml> <output.json> [original.json]")
+        print("  Convert many files:   python doyoubuzz_converter.py batch <directory|glob> <output_dir> [workers]")
+        print("  Compact metadata:     python doyoubuzz_converter.py compact <input.yaml> [output.yaml]")
+        print("  Conversion service:   python doyoubuzz_converter.py serve [host:port] [workers]")
+        print("  Round-trip check:     python doyoubuzz_converter.py verify <directory|glob> [report.json] [workers] [--no-yaml]")
         sys.exit(1)
     
     mode = sys.argv[1]
@@ -570,6 +1224,32 @@ if __name__ == "__main__":
     elif mode == "yaml2json":
         original = sys.argv[4] if len(sys.argv) > 4 else None
         yaml_to_json(sys.argv[2], sys.argv[3], original)
+    elif mode == "compact":
+        with open(sys.argv[2], 'r', encoding='utf-8') as f:
+            showcase = read_showcase(f)
+        output = sys.argv[3] if len(sys.argv) > 3 else sys.argv[2]
+        with atomic_io.atomic_open(output) as f:
+            write_showcase(compact_showcase(showcase), f)
+        log.info(f"[OK] Compacted {sys.argv[2]} to {output}")
+    elif mode == "batch":
+        if len(sys.argv) < 4:
+            print("Usage: python doyoubuzz_converter.py batch <directory|glob> <output_dir> [workers]")
+            sys.exit(1)
+        workers = int(sys.argv[4]) if len(sys.argv) > 4 else None
+        manifest = batch_convert(sys.argv[2], sys.argv[3], workers)
+        sys.exit(1 if manifest['failed'] else 0)
+    elif mode == "verify":
+        args = [a for a in sys.argv[2:] if not a.startswith('--')]
+        if not args:
+            print("Usage: python doyoubuzz_converter.py verify <directory|glob> [report.json] [workers] [--no-yaml]")
+            sys.exit(1)
+        workers = int(args[2]) if len(args) > 2 else None
+        report = verify_corpus(args[0], args[1] if len(args) > 1 else None, workers, '--no-yaml' not in sys.argv)
+        sys.exit(1 if report['lossy'] or report['failed'] else 0)
+    elif mode == "serve":
+        import conversion_service
+        workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        conversion_service.serve(sys.argv[2] if len(sys.argv) > 2 else None, workers)
     else:
         print(f"Unknown mode: {mode}")
         sys.exit(1)
@@ -0,0 +1,123 @@
+"""
+Instrumentation - Stage timers, structured logging and recent operations
+
+``timed(op, stage, **fields)`` is both a context manager and a decorator.
+Each timed block yields one record (operation, stage, duration, byte
+counts, outcome) that is kept in a bounded in-memory history (shown by the
+app's diagnostics panel) and logged at DEBUG level on the ``dc.timing``
+logger. Set DC_INSTRUMENTATION=0 (or ``ENABLED = False``) to turn it off;
+a disabled timer only costs an attribute check.
+"""
+
+import functools
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+ENABLED = os.environ.get('DC_INSTRUMENTATION', '1') != '0'
+RECENT_MAX = 500
+
+log = logging.getLogger('dc.timing')
+_recent: deque = deque(maxlen=RECENT_MAX)
+
+
+class timed:
+    """Time one stage of an operation (``with timed(...) as t`` or ``@timed(...)``)
+
+    Extra fields such as byte counts can be given upfront or added inside
+    the block with ``t.add(bytes=...)``.
+    """
+    __slots__ = ('op', 'stage', 'fields', 'started')
+
+    def __init__(self, op: str, stage: str, **fields: Any):
+        self.op = op
+        self.stage = stage
+        self.fields = fields
+        self.started = None
+
+    def add(self, **fields: Any) -> None:
+        """Attach fields (e.g. ``bytes``) to the record"""
+        self.fields.update(fields)
+
+    def __enter__(self) -> 'timed':
+        if ENABLED:
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self.started is not None:
+            fields = dict(self.fields, error=exc_type.__name__) if exc_type is not None else self.fields
+            record(self.op, self.stage, (time.perf_counter() - self.started) * 1000, exc_type is None, **fields)
+        return False
+
+    def __call__(self, func):
+        op, stage, fields = self.op, self.stage, self.fields
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            with timed(op, stage, **fields):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def record(op: str, stage: str, ms: float, ok: bool = True, **fields: Any) -> None:
+    """Record a stage timed by the caller (for spans no ``with`` block can wrap)"""
+    if not ENABLED:
+        return
+    entry = {'at': time.time(), 'op': op, 'stage': stage, 'ms': round(ms, 3), 'ok': ok, **fields}
+    _recent.append(entry)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("%s %s %.1f ms", op, stage, entry['ms'], extra={'timing': entry})
+
+
+def recent(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Most recent timing records, newest first"""
+    records = list(_recent)[::-1]
+    return records[:limit] if limit else records
+
+
+def clear() -> None:
+    """Forget the recorded operations"""
+    _recent.clear()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per log line, including the timing record if any"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        timing = getattr(record, 'timing', None)
+        if timing:
+            entry.update(timing)
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(level: Optional[str] = None, json_lines: Optional[bool] = None, stream=None) -> None:
+    """Send the ``dc.*`` loggers to ``stream`` (stdout by default)
+
+    Defaults come from DC_LOG_LEVEL (INFO) and DC_LOG_JSON (``1`` for JSON
+    lines); at INFO the output is the plain progress messages of the CLI,
+    DEBUG adds the per-stage timings.
+    """
+    level = level or os.environ.get('DC_LOG_LEVEL', 'INFO')
+    if json_lines is None:
+        json_lines = os.environ.get('DC_LOG_JSON') == '1'
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if json_lines else logging.Formatter('%(message)s'))
+    logger = logging.getLogger('dc')
+    logger.handlers[:] = [handler]
+    logger.setLevel(level.upper())
+    logger.propagate = False
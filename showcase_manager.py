@@ -2,26 +2,97 @@
 Showcase Manager - Handle multiple showcase variants
 """
 
-import yaml
-import shutil
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
-SHOWCASES_DIR = Path("showcases")
+import atomic_io
+import yaml_backend
+from instrumentation import timed
+
+log = logging.getLogger('dc.showcases')
+
+SHOWCASES_DIR = Path(os.environ.get("DC_SHOWCASES_DIR", "showcases"))
 BASELINE_NAME = "baseline"
 
+# Serialise concurrent saves of the same showcase across processes
+# (each showcase has its own lock file, so different variants never wait)
+FILE_LOCKING = True
+
+# Parsed-showcase cache, shared by all sessions of the process.
+# Entries are keyed by path and validated against (mtime_ns, size); values
+# are pickled so every caller gets its own copy to mutate.
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+_cache: "OrderedDict[Path, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+_cache_bytes = 0
+_cache_lock = threading.Lock()
+
+# Sidecar metadata index (showcases/.index.json): one entry per showcase with
+# its _variant_info, size, mtime and content hash, so listings never parse YAML.
+INDEX_NAME = ".index.json"
+INDEX_VERSION = 1
+_index_lock = threading.Lock()
+_index_memo: Optional[Tuple[Optional[Tuple[int, int]], Dict[str, Dict]]] = None
+
+# Delta variants store only a structural patch against an immutable,
+# content-addressed snapshot of their source in showcases/.bases/<sha256>.yaml
+BASES_DIRNAME = ".bases"
+DELTA_KEY = "_delta"
+BASE_PRUNE_GRACE = 60.0  # seconds a new snapshot is kept before anything refers to it
+# Snapshot digest of each source showcase, by path, as of its (mtime_ns, size):
+# making another variant of an unchanged source skips dumping it again
+_base_digests: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+# Structural diff: list items are matched by _dyb_id, then by their label
+# (DIFF_LABELS) for items without a matching id; DIFF_CHILDREN are diffed
+# recursively inside matched items
+DIFF_LABELS = {
+    'skills': 'category', 'items': 'name',
+    'missions': 'description', 'results': 'description', 'environments': 'description',
+    'certifications': 'name', 'languages': 'language'
+}
+DIFF_CHILDREN = {'skills': ('items',), 'experience': ('missions', 'results', 'environments')}
+
+# Showcase names, memoised on the directory's mtime (creating, deleting or
+# renaming a file bumps it); this module's own mutations also drop the memo,
+# in case the filesystem's mtime resolution is too coarse to tell
+_listing_memo: Optional[Tuple[Tuple[Path, int], List[str]]] = None
+
 def ensure_showcases_dir():
     """Ensure showcases directory exists"""
     SHOWCASES_DIR.mkdir(exist_ok=True)
 
 def list_showcases() -> List[str]:
     """List all available showcase names (without .yaml extension)"""
-    ensure_showcases_dir()
+    global _listing_memo
+    try:
+        key = (SHOWCASES_DIR, SHOWCASES_DIR.stat().st_mtime_ns)
+    except FileNotFoundError:
+        ensure_showcases_dir()
+        key = (SHOWCASES_DIR, SHOWCASES_DIR.stat().st_mtime_ns)
+    memo = _listing_memo
+    if memo is not None and memo[0] == key:
+        return list(memo[1])
     showcases = []
     for file in SHOWCASES_DIR.glob("*.yaml"):
         showcases.append(file.stem)
-    return sorted(showcases, key=lambda x: (x != BASELINE_NAME, x))  # baseline first
+    showcases.sort(key=lambda x: (x != BASELINE_NAME, x))  # baseline first
+    _listing_memo = (key, showcases)
+    return list(showcases)
+
+def _invalidate_listing() -> None:
+    """Drop the listing memo; every writer that creates, deletes or renames a showcase file must call it"""
+    global _listing_memo
+    _listing_memo = None
 
 def get_showcase_path(name: str) -> Path:
     """Get full path to showcase file"""
@@ -31,35 +102,183 @@ def showcase_exists(name: str) -> bool:
     """Check if showcase exists"""
     return get_showcase_path(name).exists()
 
+def file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _cache_get(path: Path, stamp: Tuple[int, int]) -> Optional[Dict]:
+    """Return a fresh copy of the cached showcase if the file is unchanged"""
+    with _cache_lock:
+        entry = _cache.get(path)
+        if entry is None or entry[0] != stamp:
+            return None
+        _cache.move_to_end(path)
+        blob = entry[1]
+    return pickle.loads(blob)
+
+def _cache_put(path: Path, stamp: Tuple[int, int], data: Dict) -> None:
+    """Store a parsed showcase, evicting least recently used entries over the cap"""
+    global _cache_bytes
+    blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    with _cache_lock:
+        _cache_drop(path)
+        if len(blob) > CACHE_MAX_BYTES:
+            return
+        _cache[path] = (stamp, blob)
+        _cache_bytes += len(blob)
+        while _cache_bytes > CACHE_MAX_BYTES:
+            _, (_, evicted) = _cache.popitem(last=False)
+            _cache_bytes -= len(evicted)
+
+def _cache_drop(path: Path) -> None:
+    """Remove one entry (caller holds the lock)"""
+    global _cache_bytes
+    entry = _cache.pop(path, None)
+    if entry is not None:
+        _cache_bytes -= len(entry[1])
+
+def invalidate_cache(name: Optional[str] = None) -> None:
+    """Forget one cached showcase, or all of them"""
+    global _cache_bytes
+    with _cache_lock:
+        if name is None:
+            _cache.clear()
+            _cache_bytes = 0
+            _invalidate_listing()
+        else:
+            _cache_drop(get_showcase_path(name))
+
 def load_showcase(name: str) -> Optional[Dict]:
-    """Load a showcase by name"""
+    """Load a showcase by name (served from cache while the file is unchanged)
+    
+    Delta variants are materialised against their base snapshot; since
+    snapshots never change, the materialised result is what gets cached.
+    """
     path = get_showcase_path(name)
-    if not path.exists():
+    stamp = file_stamp(path)
+    if stamp is None:
         return None
     
+    cached = _cache_get(path, stamp)
+    if cached is not None:
+        return cached
+    
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        with timed('load_showcase', 'parse', name=name, bytes=stamp[1]):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = yaml_backend.load(f)
+        if isinstance(data, dict) and DELTA_KEY in data:
+            with timed('load_showcase', 'materialise', name=name):
+                data = _materialise(data)
     except Exception as e:
-        print(f"Error loading showcase {name}: {e}")
+        log.exception(f"Error loading showcase {name}: {e}")
         return None
+    
+    if data is not None:
+        _cache_put(path, stamp, data)
+    return data
 
 def save_showcase(name: str, data: Dict) -> bool:
-    """Save showcase data"""
+    """Save showcase data
+    
+    The document is serialised in memory first, then atomically replaces
+    the file (temp file + fsync + os.replace): concurrent readers see either
+    the previous or the new showcase, never a truncated one. Content that
+    is byte-identical to the file on disk is not rewritten.
+    """
+    try:
+        document = data
+        if _is_delta_variant(data):
+            # Only the patch against the base snapshot is written
+            base = load_base(data['_variant_info']['base'])
+            content_only = {k: v for k, v in data.items() if k != '_variant_info'}
+            document = {'_variant_info': data['_variant_info'], DELTA_KEY: _make_delta(base, content_only)}
+    except Exception as e:
+        log.exception(f"Error saving showcase {name}: {e}")
+        return False
+    return _write_showcase(name, data, document)
+
+def _write_showcase(name: str, data: Dict, document: Dict) -> bool:
+    """Write ``document`` (what goes on disk for ``data``), then prime the cache and index"""
     ensure_showcases_dir()
     path = get_showcase_path(name)
-    
+    invalidate_cache(name)
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, allow_unicode=True, sort_keys=False, 
-                     default_flow_style=False, width=float('inf'))
-        return True
+        with timed('save_showcase', 'serialise', name=name) as t:
+            content = yaml_backend.dump(document).encode('utf-8')
+            t.add(bytes=len(content))
+        with _showcase_lock(path), timed('save_showcase', 'write', name=name) as t:
+            written = not _unchanged_on_disk(name, path, content)
+            if written:
+                atomic_io.atomic_write(path, content)
+                _invalidate_listing()
+            stamp = file_stamp(path)
+            t.add(bytes=len(content) if written else 0)
     except Exception as e:
-        print(f"Error saving showcase {name}: {e}")
+        log.exception(f"Error saving showcase {name}: {e}")
         return False
+    
+    # Prime the cache so the next load of this showcase skips parsing
+    if stamp is not None:
+        _cache_put(path, stamp, data)
+        if written:
+            variant_info = data.get('_variant_info') if isinstance(data, dict) else None
+            _update_index(lambda entries: entries.__setitem__(name, _index_entry(name, stamp, content, variant_info)))
+    return True
+
+def _unchanged_on_disk(name: str, path: Path, content: bytes) -> bool:
+    """True if the indexed, still current file already holds ``content``"""
+    entry = _load_index().get(name)
+    return _entry_is_fresh(entry, file_stamp(path)) and entry['sha256'] == hashlib.sha256(content).hexdigest()
+
+def section_hashes(data: Optional[Dict]) -> Dict[str, str]:
+    """Content hash of each showcase section, used for dirty tracking
+    
+    Top-level keys are hashed as a whole, except experiences which are
+    hashed one by one (``experience/<index>``) so a single edit only
+    flags that experience.
+    """
+    hashes = {}
+    for key, value in (data or {}).items():
+        if key == 'experience' and isinstance(value, list):
+            for idx, exp in enumerate(value):
+                hashes[f"experience/{idx}"] = content_hash(exp)
+        else:
+            hashes[key] = content_hash(value)
+    return hashes
+
+def dirty_sections(data: Optional[Dict], saved_hashes: Dict[str, str]) -> List[str]:
+    """Sections of ``data`` that differ from the saved hashes (including removed ones)"""
+    current = section_hashes(data)
+    keys = list(current) + [k for k in saved_hashes if k not in current]
+    return [k for k in keys if current.get(k) != saved_hashes.get(k)]
+
+def content_hash(value) -> str:
+    """Stable hash of a YAML-compatible value"""
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
-def create_variant(source_name: str, variant_name: str, description: str = "") -> bool:
-    """Create a new showcase variant from an existing one"""
+def _showcase_lock(path: Path, remove: bool = False):
+    """Per-file lock context for writers (a no-op when FILE_LOCKING is off)
+    
+    ``remove`` deletes the lock file on success, for a file deleted or renamed away.
+    """
+    return atomic_io.locked(path, remove) if FILE_LOCKING else contextlib.nullcontext()
+
+@timed('create_variant', 'total')
+def create_variant(source_name: str, variant_name: str, description: str = "", delta: bool = False) -> bool:
+    """Create a new showcase variant from an existing one
+    
+    With ``delta=True`` the variant is stored copy-on-write: a snapshot of
+    the source (shared by every variant made from the same content) plus a
+    patch holding only the variant's own edits. Full copies record the
+    same snapshot as their ``base`` too, as the common ancestor used when
+    the variant is later rebased onto its updated source.
+    """
     # Validate names
     if not source_name or not variant_name:
         return False
@@ -75,22 +294,39 @@ def create_variant(source_name: str, variant_name: str, description: str = "") -
         return False
     
     try:
-        # Copy the showcase
-        shutil.copy2(source_path, variant_path)
+        # Stamped before loading: a save in between only makes the digest memo miss
+        origin = (source_path, file_stamp(source_path))
+        if delta:
+            source = load_showcase(source_name)
+            if not source:
+                return False
+            source.pop('_variant_info', None)
+            variant_info = {
+                'created_from': source_name,
+                'created_at': datetime.now().isoformat(),
+                'description': description,
+                'storage': 'delta',
+                'base': store_base(source, origin)
+            }
+            # A fresh variant is its base as is: the patch is empty, no need to diff
+            return _write_showcase(variant_name, {'_variant_info': variant_info, **source},
+                                   {'_variant_info': variant_info, DELTA_KEY: []})
         
-        # Add metadata about variant creation
-        data = load_showcase(variant_name)
-        if data:
-            if '_variant_info' not in data:
-                data['_variant_info'] = {}
-            data['_variant_info']['created_from'] = source_name
-            data['_variant_info']['created_at'] = datetime.now().isoformat()
-            data['_variant_info']['description'] = description
-            save_showcase(variant_name, data)
-        
-        return True
+        # Copy the showcase (written atomically by save_showcase)
+        data = load_showcase(source_name)
+        if not data:
+            return False
+        if '_variant_info' not in data:
+            data['_variant_info'] = {}
+        data['_variant_info']['created_from'] = source_name
+        data['_variant_info']['created_at'] = datetime.now().isoformat()
+        data['_variant_info']['description'] = description
+        # A full copy of a delta variant is itself a full showcase
+        data['_variant_info'].pop('storage', None)
+        data['_variant_info']['base'] = store_base({k: v for k, v in data.items() if k != '_variant_info'}, origin)
+        return save_showcase(variant_name, data)
     except Exception as e:
-        print(f"Error creating variant: {e}")
+        log.exception(f"Error creating variant: {e}")
         return False
 
 def delete_showcase(name: str) -> bool:
@@ -102,36 +338,160 @@ def delete_showcase(name: str) -> bool:
     if not path.exists():
         return False
     
+    invalidate_cache(name)
     try:
-        path.unlink()
+        with _showcase_lock(path, remove=True):
+            path.unlink()
+        _invalidate_listing()
+        _update_index(lambda entries: entries.pop(name, None))
+        prune_bases()
         return True
     except Exception as e:
-        print(f"Error deleting showcase {name}: {e}")
+        log.exception(f"Error deleting showcase {name}: {e}")
         return False
 
 def get_showcase_info(name: str) -> Dict:
     """Get metadata about a showcase"""
-    path = get_showcase_path(name)
-    if not path.exists():
+    stamp = file_stamp(get_showcase_path(name))
+    if stamp is None:
         return {}
     
-    data = load_showcase(name)
-    if not data:
-        return {}
+    entry = _load_index().get(name)
+    if not _entry_is_fresh(entry, stamp):
+        entry = _scan_showcase(name)
+        if entry is None:
+            return {}
+        _update_index(lambda entries: entries.__setitem__(name, entry))
     
-    info = {
+    return _info_from_entry(entry)
+
+def list_showcase_infos() -> List[Dict]:
+    """Metadata of every showcase, served from the index (only stale entries are re-read)"""
+    entries = _load_index()
+    refreshed = {}
+    infos = []
+    for name in list_showcases():
+        entry = entries.get(name)
+        if not _entry_is_fresh(entry, file_stamp(get_showcase_path(name))):
+            entry = _scan_showcase(name)
+            if entry is None:
+                continue
+            refreshed[name] = entry
+        infos.append(_info_from_entry(entry))
+    
+    stale = set(entries) - set(info['name'] for info in infos)
+    if refreshed or stale:
+        def apply(current):
+            current.update(refreshed)
+            for name in stale:
+                current.pop(name, None)
+        _update_index(apply)
+    return infos
+
+def rebuild_index() -> Dict[str, Dict]:
+    """Rebuild the metadata index from scratch by reading every showcase file"""
+    entries = {}
+    for name in list_showcases():
+        entry = _scan_showcase(name)
+        if entry is not None:
+            entries[name] = entry
+    with _index_lock, _showcase_lock(_index_path()):
+        _store_index(entries)
+    return entries
+
+def _index_path() -> Path:
+    """Path of the sidecar metadata index"""
+    return SHOWCASES_DIR / INDEX_NAME
+
+def _index_entry(name: str, stamp: Tuple[int, int], content: bytes, variant_info: Optional[Dict]) -> Dict:
+    """Build one index entry from a showcase's bytes"""
+    mtime_ns, size = stamp
+    return {
         'name': name,
-        'is_baseline': name == BASELINE_NAME,
-        'size_kb': path.stat().st_size / 1024,
-        'modified': datetime.fromtimestamp(path.stat().st_mtime).isoformat()
+        'variant_info': variant_info,
+        'size': size,
+        'mtime_ns': mtime_ns,
+        'sha256': hashlib.sha256(content).hexdigest()
+    }
+
+def _entry_is_fresh(entry: Optional[Dict], stamp: Optional[Tuple[int, int]]) -> bool:
+    """True if an index entry still describes the file on disk"""
+    return entry is not None and stamp is not None and (entry['mtime_ns'], entry['size']) == stamp
+
+def _info_from_entry(entry: Dict) -> Dict:
+    """Turn an index entry into the dict returned by get_showcase_info"""
+    info = {
+        'name': entry['name'],
+        'is_baseline': entry['name'] == BASELINE_NAME,
+        'size_kb': entry['size'] / 1024,
+        'modified': datetime.fromtimestamp(entry['mtime_ns'] / 1e9).isoformat(),
+        'sha256': entry['sha256']
     }
     
     # Add variant-specific info if present
-    if '_variant_info' in data:
-        info.update(data['_variant_info'])
+    if entry.get('variant_info'):
+        info.update(entry['variant_info'])
     
     return info
 
+def _scan_showcase(name: str) -> Optional[Dict]:
+    """Read and parse one showcase file to build its index entry"""
+    path = get_showcase_path(name)
+    try:
+        content = path.read_bytes()
+        stamp = file_stamp(path)
+        data = yaml_backend.load(content)
+    except Exception as e:
+        log.exception(f"Error indexing showcase {name}: {e}")
+        return None
+    if not data or stamp is None:
+        return None
+    return _index_entry(name, stamp, content, data.get('_variant_info'))
+
+def _load_index() -> Dict[str, Dict]:
+    """Read the index file (memoised until it changes on disk)"""
+    global _index_memo
+    path = _index_path()
+    stamp = file_stamp(path)
+    if _index_memo is not None and stamp is not None and _index_memo[0] == stamp:
+        return _index_memo[1]
+    
+    entries = {}
+    if stamp is not None:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                doc = json.load(f)
+            if doc.get('version') == INDEX_VERSION:
+                entries = doc.get('showcases', {})
+        except (OSError, ValueError) as e:
+            log.warning(f"Error reading showcase index: {e}")
+    _index_memo = (stamp, entries)
+    return entries
+
+def _store_index(entries: Dict[str, Dict]) -> None:
+    """Atomically replace the index file (caller holds _index_lock)"""
+    global _index_memo
+    ensure_showcases_dir()
+    path = _index_path()
+    atomic_io.atomic_write(path, json.dumps({'version': INDEX_VERSION, 'showcases': entries}, ensure_ascii=False))
+    _index_memo = (file_stamp(path), entries)
+
+def _update_index(change) -> None:
+    """Apply ``change(entries)`` to a copy of the index and store it
+    
+    The read-modify-write runs under the index lock file too, so other
+    processes updating the index cannot drop this change.
+    """
+    with _index_lock:
+        try:
+            ensure_showcases_dir()
+            with _showcase_lock(_index_path()):
+                entries = dict(_load_index())
+                change(entries)
+                _store_index(entries)
+        except Exception as e:
+            log.exception(f"Error updating showcase index: {e}")
+
 def rename_showcase(old_name: str, new_name: str) -> bool:
     """Rename a showcase (cannot rename baseline)"""
     if old_name == BASELINE_NAME:
@@ -143,9 +503,297 @@ def rename_showcase(old_name: str, new_name: str) -> bool:
     if not old_path.exists() or new_path.exists():
         return False
     
+    invalidate_cache(old_name)
+    invalidate_cache(new_name)
     try:
-        old_path.rename(new_path)
+        # Both locks, in a fixed order so that two opposite renames cannot deadlock
+        locks = {old_path: _showcase_lock(old_path, remove=True), new_path: _showcase_lock(new_path)}
+        with contextlib.ExitStack() as stack:
+            for lock_path in sorted(locks):
+                stack.enter_context(locks[lock_path])
+            if new_path.exists():
+                return False
+            old_path.rename(new_path)
+        _invalidate_listing()
+        
+        def move(entries):
+            entry = entries.pop(old_name, None)
+            if entry is not None:
+                entries[new_name] = dict(entry, name=new_name)
+        _update_index(move)
         return True
     except Exception as e:
-        print(f"Error renaming showcase: {e}")
+        log.exception(f"Error renaming showcase: {e}")
         return False
+
+def _is_delta_variant(data: Dict) -> bool:
+    """True if a (materialised) showcase is stored as a delta variant"""
+    info = data.get('_variant_info') if isinstance(data, dict) else None
+    return bool(info) and info.get('storage') == 'delta' and bool(info.get('base'))
+
+def _bases_dir() -> Path:
+    """Directory holding the content-addressed base snapshots"""
+    return SHOWCASES_DIR / BASES_DIRNAME
+
+def store_base(data: Dict, origin: Optional[Tuple[Path, Optional[Tuple[int, int]]]] = None,
+                write: bool = True) -> str:
+    """Write a base snapshot (once per distinct content) and return its hash
+    
+    The snapshot goes into the parse cache too: the variant saved next
+    reads it back. ``origin`` is the showcase file ``data`` was loaded
+    from and its stamp taken before loading; while that file is unchanged
+    and its snapshot still stored, the snapshot is reused without dumping.
+    With ``write=False`` (dry runs) only the hash is computed.
+    """
+    if origin is not None and origin[1] is not None:
+        known = _base_digests.get(origin[0])
+        if known is not None and known[0] == origin[1]:
+            if not write:
+                return known[1]
+            try:
+                os.utime(_bases_dir() / f"{known[1]}.yaml")
+                return known[1]
+            except FileNotFoundError:
+                pass  # pruned since: store it again
+    content = yaml_backend.dump(data).encode('utf-8')
+    digest = hashlib.sha256(content).hexdigest()
+    if not write:
+        return digest
+    path = _bases_dir() / f"{digest}.yaml"
+    try:
+        # Reused snapshot: refresh its mtime so a concurrent prune_bases keeps it
+        os.utime(path)
+    except FileNotFoundError:
+        _bases_dir().mkdir(parents=True, exist_ok=True)
+        atomic_io.atomic_write(path, content)
+    stamp = file_stamp(path)
+    if stamp is not None:
+        _cache_put(path, stamp, data)
+    if origin is not None and origin[1] is not None:
+        _base_digests[origin[0]] = (origin[1], digest)
+    return digest
+
+def load_base(digest: str) -> Dict:
+    """Load a base snapshot (a fresh copy, through the parse cache)"""
+    path = _bases_dir() / f"{digest}.yaml"
+    stamp = file_stamp(path)
+    if stamp is None:
+        raise FileNotFoundError(f"Missing base snapshot {digest}")
+    cached = _cache_get(path, stamp)
+    if cached is not None:
+        return cached
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml_backend.load(f)
+    _cache_put(path, stamp, data)
+    return data
+
+def _materialise(document: Dict) -> Dict:
+    """Rebuild a delta variant from its base snapshot and patch"""
+    data = load_base(document['_variant_info']['base'])
+    _apply_delta(data, document.get(DELTA_KEY) or [])
+    return {'_variant_info': document['_variant_info'], **data}
+
+def _bases_in_use() -> Optional[set]:
+    """Base snapshots referenced by the showcase files on disk, or None if one could not be read
+    
+    The index is only a cache: entries that no longer match their file
+    (or are missing) are re-read from the file and refreshed.
+    """
+    entries = _load_index()
+    refreshed = {}
+    in_use = set()
+    for name in list_showcases():
+        entry = entries.get(name)
+        stamp = file_stamp(get_showcase_path(name))
+        if stamp is None:
+            continue  # deleted meanwhile
+        if not _entry_is_fresh(entry, stamp):
+            entry = _scan_showcase(name)
+            if entry is None:
+                return None
+            refreshed[name] = entry
+        in_use.add((entry.get('variant_info') or {}).get('base'))
+    if refreshed:
+        _update_index(lambda current: current.update(refreshed))
+    return in_use
+
+def prune_bases() -> int:
+    """Delete base snapshots no showcase file refers to; returns how many were removed
+    
+    Nothing is removed if a showcase cannot be read, nor snapshots written
+    in the last BASE_PRUNE_GRACE seconds (a variant being created in another
+    process may not be on disk yet).
+    """
+    if not _bases_dir().exists():
+        return 0
+    in_use = _bases_in_use()
+    if in_use is None:
+        log.warning("Not pruning base snapshots: a showcase could not be read")
+        return 0
+    cutoff = time.time() - BASE_PRUNE_GRACE
+    removed = 0
+    for path in _bases_dir().glob("*.yaml"):
+        stamp = file_stamp(path)
+        if path.stem in in_use or stamp is None or stamp[0] / 1e9 > cutoff:
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+def _make_delta(old, new, path: Optional[list] = None) -> List[Dict]:
+    """Structural patch turning ``old`` into ``new``
+    
+    Dicts are diffed key by key and equal-length lists index by index, so an
+    edited mission yields one small op. Lists that grew or shrank get one
+    splice op covering only the region between their common prefix and suffix.
+    """
+    path = path or []
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'del', 'path': path + [key]})
+        for key, value in new.items():
+            if key in old:
+                ops.extend(_make_delta(old[key], value, path + [key]))
+            else:
+                ops.append({'op': 'set', 'path': path + [key], 'value': value})
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        if len(old) == len(new):
+            ops = []
+            for idx, (a, b) in enumerate(zip(old, new)):
+                ops.extend(_make_delta(a, b, path + [idx]))
+            return ops
+        prefix = 0
+        while prefix < min(len(old), len(new)) and old[prefix] == new[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < min(len(old), len(new)) - prefix
+               and old[len(old) - 1 - suffix] == new[len(new) - 1 - suffix]):
+            suffix += 1
+        return [{
+            'op': 'splice', 'path': path, 'start': prefix,
+            'delete': len(old) - prefix - suffix,
+            'insert': new[prefix:len(new) - suffix]
+        }]
+    return [{'op': 'set', 'path': path, 'value': new}]
+
+def _apply_delta(data: Dict, ops: List[Dict]) -> None:
+    """Apply a patch produced by _make_delta in place"""
+    for op in ops:
+        target = data
+        for key in op['path'][:-1]:
+            target = target[key]
+        last = op['path'][-1]
+        if op['op'] == 'splice':
+            target[last][op['start']:op['start'] + op['delete']] = op['insert']
+        elif op['op'] == 'set':
+            target[last] = op['value']
+        elif op['op'] == 'del':
+            del target[last]
+        else:
+            raise ValueError(f"Unknown delta op: {op['op']}")
+
+def diff_showcases(old: Dict, new: Dict) -> List[Dict]:
+    """Compact list of changes from ``old`` to ``new`` (linear in their size)
+    
+    Each change is ``{'op': 'added' | 'removed' | 'changed', 'path': str,
+    'field': Optional[str], 'old': value, 'new': value}``. Metadata keys
+    (starting with ``_``) are ignored, and so is a pure change of order.
+    """
+    changes: List[Dict] = []
+    old, new = old or {}, new or {}
+    for key in list(old) + [k for k in new if k not in old]:
+        if key.startswith('_'):
+            continue
+        before, after = old.get(key), new.get(key)
+        if before == after:
+            continue
+        if isinstance(before, list) or isinstance(after, list):
+            _diff_items(key, before or [], after or [], key, changes)
+        elif isinstance(before, dict) and isinstance(after, dict):
+            _diff_fields(before, after, key, changes)
+        else:
+            changes.append({'op': 'changed', 'path': key, 'field': None, 'old': before, 'new': after})
+    return changes
+
+def variant_source(data: Optional[Dict]) -> Optional[Dict]:
+    """The showcase a variant was created from (or its delta base snapshot if the source is gone)"""
+    info = (data or {}).get('_variant_info') or {}
+    source = load_showcase(info['created_from']) if info.get('created_from') else None
+    if source is None and _is_delta_variant(data):
+        source = load_base(info['base'])
+    return source
+
+def diff_variant(name: str) -> Optional[List[Dict]]:
+    """Changes of a variant against its source; None for showcases without lineage"""
+    data = load_showcase(name)
+    source = variant_source(data)
+    return diff_showcases(source, data) if source is not None else None
+
+def diff_label(kind: str, item) -> str:
+    """Human label of a list item, also used for content matching"""
+    if not isinstance(item, dict):
+        return str(item)
+    if kind == 'experience':
+        return f"{item.get('title', '')} @ {item.get('company', '')}"
+    return str(item.get(DIFF_LABELS.get(kind, 'name'), ''))
+
+def _diff_fields(before: Dict, after: Dict, path: str, changes: List[Dict], skip=()) -> None:
+    """Field-level changes between two dicts (metadata and ``skip`` keys ignored)"""
+    for key in list(before) + [k for k in after if k not in before]:
+        if key.startswith('_') or key in skip:
+            continue
+        if before.get(key) != after.get(key):
+            changes.append({'op': 'changed', 'path': path, 'field': key, 'old': before.get(key), 'new': after.get(key)})
+
+def _diff_items(kind: str, old_items: list, new_items: list, path: str, changes: List[Dict]) -> None:
+    """Match two lists by _dyb_id then label, and record added/removed/changed items"""
+    by_id, by_label = {}, {}
+    for idx, item in enumerate(old_items):
+        if isinstance(item, dict) and item.get('_dyb_id') is not None:
+            by_id[item['_dyb_id']] = idx
+        by_label.setdefault(diff_label(kind, item).strip().lower(), deque()).append(idx)
+    
+    matched = [None] * len(new_items)
+    used = set()
+    for n, item in enumerate(new_items):
+        idx = by_id.get(item.get('_dyb_id')) if isinstance(item, dict) else None
+        if idx is not None and idx not in used:
+            matched[n] = idx
+            used.add(idx)
+    for n, item in enumerate(new_items):
+        if matched[n] is not None:
+            continue
+        candidates = by_label.get(diff_label(kind, item).strip().lower(), ())
+        while candidates and candidates[0] in used:
+            candidates.popleft()
+        if candidates:
+            matched[n] = candidates.popleft()
+            used.add(matched[n])
+    
+    label_key = DIFF_LABELS.get(kind)
+    children = DIFF_CHILDREN.get(kind, ())
+    for n, item in enumerate(new_items):
+        if matched[n] is None:
+            changes.append({'op': 'added', 'path': path, 'field': None, 'old': None, 'new': diff_label(kind, item)})
+            continue
+        before = old_items[matched[n]]
+        if before == item:
+            continue
+        item_path = f"{path} › {diff_label(kind, item)}"
+        # Bare strings (legacy entries) compare as their label field
+        before_dict = before if isinstance(before, dict) else {label_key or 'value': before}
+        after_dict = item if isinstance(item, dict) else {label_key or 'value': item}
+        _diff_fields(before_dict, after_dict, item_path, changes, skip=children)
+        for child in children:
+            _diff_items(child, before_dict.get(child) or [], after_dict.get(child) or [], f"{item_path} › {child}", changes)
+    for idx, item in enumerate(old_items):
+        if idx not in used:
+            changes.append({'op': 'removed', 'path': path, 'field': None, 'old': diff_label(kind, item), 'new': None})
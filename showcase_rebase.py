@@ -0,0 +1,263 @@
+"""
+Showcase Rebase - Carry variants over to an updated parent showcase
+
+A variant records its parent (``_variant_info.created_from``) and a
+snapshot of the parent as it was copied (``_variant_info.base``, see
+showcase_manager.create_variant). Rebasing three-way merges
+(old parent, new parent, variant): whatever only one side changed is
+taken from that side, list items are matched by ``_dyb_id`` (or label),
+and when both sides changed the same value the variant's value is kept
+and a conflict is reported. Variants are rebased across a process pool.
+
+Usage: python showcase_rebase.py <parent> [old_parent.yaml] [--dry-run] [--workers N]
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import showcase_manager as sm
+import yaml_backend
+from instrumentation import timed
+
+log = logging.getLogger('dc.rebase')
+
+MISSING = object()  # key or list item absent on one side of the merge
+
+
+def merge_showcases(base: Dict, parent: Dict, variant: Dict) -> Tuple[Dict, List[Dict]]:
+    """Three-way merge of a variant with its updated parent
+
+    Returns the merged showcase (with the variant's own _variant_info) and
+    the conflicts, each ``{'path', 'base', 'parent', 'variant'}``; a
+    conflict always resolves to the variant's value.
+    """
+    conflicts: List[Dict] = []
+    content = {k: v for k, v in variant.items() if k != '_variant_info'}
+    merged = _merge(base, {k: v for k, v in parent.items() if k != '_variant_info'}, content, '', conflicts)
+    if '_variant_info' in variant:
+        merged = {'_variant_info': variant['_variant_info'], **merged}
+    return merged, conflicts
+
+
+def _merge(base, parent, variant, path: str, conflicts: List[Dict]):
+    """Merge one value; MISSING means absent on that side"""
+    if _same(variant, base):
+        return parent
+    if _same(parent, base) or _same(parent, variant):
+        return variant
+    if isinstance(parent, dict) and isinstance(variant, dict):
+        base = base if isinstance(base, dict) else {}
+        merged = {}
+        for key in list(parent) + [k for k in variant if k not in parent]:
+            value = _merge(base.get(key, MISSING), parent.get(key, MISSING), variant.get(key, MISSING),
+                           f"{path}.{key}" if path else key, conflicts)
+            if value is not MISSING:
+                merged[key] = value
+        return merged
+    if isinstance(parent, list) and isinstance(variant, list):
+        return _merge_list(base if isinstance(base, list) else [], parent, variant, path, conflicts)
+    conflicts.append({'path': path, 'base': _plain(base), 'parent': _plain(parent), 'variant': _plain(variant)})
+    return variant
+
+
+def _merge_list(base: list, parent: list, variant: list, path: str, conflicts: List[Dict]) -> list:
+    """Merge lists item by item, keeping the variant's order and placing the parent's new items after their predecessor"""
+    kind = path.rsplit('.', 1)[-1]
+    base_items, parent_items, variant_items = _keyed(kind, base), _keyed(kind, parent), _keyed(kind, variant)
+
+    merged: Dict[Any, Any] = {}
+    for key, item in variant_items.items():
+        label = f"{path}[{sm.diff_label(kind, item)}]"
+        value = _merge(base_items.get(key, MISSING), parent_items.get(key, MISSING), item, label, conflicts)
+        if value is not MISSING:
+            merged[key] = value
+
+    # Items only the parent has: new in the parent, or deleted by the variant
+    inserted_after: Dict[Any, list] = {}
+    anchor = None
+    for key, item in parent_items.items():
+        if key in merged:
+            anchor = key
+            continue
+        if key in variant_items:
+            continue  # both sides handled above (merged away)
+        if key in base_items:
+            if not _same(item, base_items[key]):
+                label = f"{path}[{sm.diff_label(kind, item)}]"
+                conflicts.append({'path': label, 'base': _plain(base_items[key]), 'parent': _plain(item), 'variant': None})
+            continue  # deleted by the variant
+        inserted_after.setdefault(anchor, []).append(item)
+
+    result = list(inserted_after.get(None, []))
+    for key, item in merged.items():
+        result.append(item)
+        result.extend(inserted_after.get(key, []))
+    return result
+
+
+def _keyed(kind: str, items: list) -> Dict[Any, Any]:
+    """Items by identity: _dyb_id if any, else label; repeated keys get an occurrence number"""
+    keyed: Dict[Any, Any] = {}
+    seen: Dict[Any, int] = {}
+    for item in items:
+        if isinstance(item, dict) and item.get('_dyb_id') is not None:
+            key = ('id', item['_dyb_id'])
+        else:
+            key = ('label', sm.diff_label(kind, item).strip().lower())
+        seen[key] = seen.get(key, 0) + 1
+        keyed[key + (seen[key],)] = item
+    return keyed
+
+
+def _same(a, b) -> bool:
+    return a is b or (a is not MISSING and b is not MISSING and a == b)
+
+
+def _plain(value):
+    """Value for a conflict report (MISSING becomes None)"""
+    return None if value is MISSING else value
+
+
+# --- Batch rebase ---------------------------------------------------------------
+
+_worker_parent: Optional[Dict] = None
+_worker_base_sha: Optional[str] = None
+
+
+def _init_worker(parent: Dict, base_sha: str) -> None:
+    """Keep the new parent in each worker process instead of sending it with every task"""
+    global _worker_parent, _worker_base_sha
+    _worker_parent, _worker_base_sha = parent, base_sha
+
+
+def rebase_variant(name: str, parent: Dict, new_base_sha: str, old_parent: Optional[Dict] = None,
+                   dry_run: bool = False) -> Dict[str, Any]:
+    """Rebase one variant onto ``parent`` and save it (unless ``dry_run``); never raises
+
+    The old parent is the variant's base snapshot, or ``old_parent`` for
+    variants created before snapshots were recorded.
+    """
+    started = time.perf_counter()
+    report = {'name': name, 'ok': False, 'changed': False, 'conflicts': [], 'error': None}
+    try:
+        with timed('rebase_variant', 'total', name=name):
+            variant = sm.load_showcase(name)
+            if variant is None:
+                raise FileNotFoundError(f"Showcase {name} not found")
+            info = variant.get('_variant_info') or {}
+            if info.get('base'):
+                base = sm.load_base(info['base'])
+            elif old_parent is not None:
+                base = old_parent
+            else:
+                raise ValueError("no base snapshot recorded; pass the old parent explicitly")
+
+            merged, conflicts = merge_showcases(base, parent, variant)
+            merged['_variant_info'] = dict(info, base=new_base_sha, rebased_at=datetime.now().isoformat())
+            report['conflicts'] = conflicts
+            report['changed'] = sm.diff_showcases(variant, merged) != []
+            if not dry_run and (report['changed'] or info.get('base') != new_base_sha):
+                if not sm.save_showcase(name, merged):
+                    raise OSError(f"Could not save {name}")
+        report['ok'] = True
+    except Exception as e:
+        report['error'] = {'type': type(e).__name__, 'message': str(e)}
+    report['seconds'] = round(time.perf_counter() - started, 4)
+    return report
+
+
+def _rebase_in_worker(name: str, old_parent: Optional[Dict], dry_run: bool) -> Dict[str, Any]:
+    return rebase_variant(name, _worker_parent, _worker_base_sha, old_parent, dry_run)
+
+
+def children_of(parent_name: str) -> List[str]:
+    """Variants created from ``parent_name`` (from the sidecar index)"""
+    return sorted(info['name'] for info in sm.list_showcase_infos() if info.get('created_from') == parent_name)
+
+
+def rebase_children(parent_name: str, old_parent: Optional[Dict] = None, names: Optional[List[str]] = None,
+                    workers: Optional[int] = None, dry_run: bool = False) -> Dict[str, Any]:
+    """Rebase every variant of ``parent_name`` (or ``names``) onto its current content, in parallel
+
+    Returns a summary with one report per variant; failures and conflicts
+    are reported, never raised.
+    """
+    started = time.perf_counter()
+    parent_path = sm.get_showcase_path(parent_name)
+    origin = (parent_path, sm.file_stamp(parent_path))
+    parent = sm.load_showcase(parent_name)
+    if parent is None:
+        raise FileNotFoundError(f"Showcase {parent_name} not found")
+    parent = {k: v for k, v in parent.items() if k != '_variant_info'}
+    base_sha = sm.store_base(parent, origin, write=not dry_run)
+    names = children_of(parent_name) if names is None else names
+    workers = min(workers or os.cpu_count() or 1, max(len(names), 1))
+
+    reports = []
+    if workers == 1:
+        reports = [rebase_variant(name, parent, base_sha, old_parent, dry_run) for name in names]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(parent, base_sha)) as executor:
+            futures = [executor.submit(_rebase_in_worker, name, old_parent, dry_run) for name in names]
+            for future in as_completed(futures):
+                reports.append(future.result())
+        # Workers wrote the files and the index; drop what this process had cached
+        sm.invalidate_cache()
+
+    for report in sorted(reports, key=lambda r: r['name']):
+        if not report['ok']:
+            log.warning(f"[FAIL] {report['name']}: {report['error']['type']}: {report['error']['message']}")
+        else:
+            status = "rebased" if report['changed'] else "up to date"
+            log.info(f"[OK] {report['name']}: {status}, {len(report['conflicts'])} conflicts")
+            for conflict in report['conflicts']:
+                log.info(f"     conflict at {conflict['path']} (kept the variant's value)")
+
+    summary = {
+        'parent': parent_name,
+        'base': base_sha,
+        'dry_run': dry_run,
+        'total': len(reports),
+        'changed': sum(1 for r in reports if r['changed']),
+        'conflicts': sum(len(r['conflicts']) for r in reports),
+        'failed': sum(1 for r in reports if not r['ok']),
+        'seconds': round(time.perf_counter() - started, 3),
+        'variants': sorted(reports, key=lambda r: r['name'])
+    }
+    sm.prune_bases()
+    log.info(f"[OK] Rebased {summary['total']} variants of {parent_name} in {summary['seconds']}s "
+             f"({summary['changed']} changed, {summary['conflicts']} conflicts, {summary['failed']} failed)")
+    return summary
+
+
+if __name__ == "__main__":
+    import sys
+    from instrumentation import configure_logging
+
+    configure_logging()
+    # --workers N and --workers=N are both accepted
+    args, workers, dry_run = [], None, False
+    argv = iter(sys.argv[1:])
+    for arg in argv:
+        if arg == '--dry-run':
+            dry_run = True
+        elif arg == '--workers':
+            workers = int(next(argv, '0')) or None
+        elif arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1]) or None
+        else:
+            args.append(arg)
+    if not args:
+        print("Usage: python showcase_rebase.py <parent> [old_parent.yaml] [--dry-run] [--workers N]")
+        sys.exit(1)
+
+    old = None
+    if len(args) > 1:
+        with open(args[1], 'r', encoding='utf-8') as f:
+            old = yaml_backend.load(f)
+    result = rebase_children(args[0], old, workers=workers, dry_run=dry_run)
+    sys.exit(1 if result['failed'] else 0)
@@ -0,0 +1,257 @@
+"""
+Showcase Search - Full-text inverted index across all showcases
+
+Maps each token to where it appears: showcase, experience index, field
+(``missions``, ``environments``, ``summary``...) and position in that
+field. Each showcase has its own segment in ``showcases/.search/`` (next
+to the database with the SQLite store) holding its postings and the
+stamp (mtime_ns, size) they were built from: a save only re-tokenises
+and rewrites that showcase's segment, and queries never parse YAML.
+
+Segments stay in memory between queries, and a refresh does nothing
+while the store's generation (the showcases directory mtime for YAML
+files) is unchanged, so a query usually costs one stat. A rebuild of
+many YAML showcases is spread over a process pool.
+"""
+
+import contextlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+import atomic_io
+import showcase_manager as sm
+import storage
+from instrumentation import timed
+
+log = logging.getLogger('dc.search')
+
+SEARCH_INDEX_DIRNAME = '.search'
+SEARCH_INDEX_VERSION = 2
+LEGACY_INDEX_NAME = '.search.json'  # single-file index of version 1
+PARALLEL_MIN = 16  # stale YAML showcases worth starting a process pool for
+
+EXPERIENCE_FIELDS = ('title', 'company', 'location', 'context')
+ENTRY_FIELDS = ('missions', 'results', 'environments')
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# In-memory state: showcase -> segment as persisted, with postings
+# token -> "<experience>:<field>:<position> ..." (one string per token:
+# compact in JSON, split only for the showcases a query matches)
+_lock = threading.Lock()
+_entries: Optional[Dict[str, Dict]] = None
+_index_dir: Optional[Path] = None  # where _entries were loaded from (follows the storage backend)
+_generation: Optional[tuple] = None  # store generation _entries were last checked against
+
+
+def tokenize(text) -> List[str]:
+    """Lower-cased, accent-free word tokens of ``text``"""
+    if not text:
+        return []
+    folded = unicodedata.normalize('NFKD', str(text).lower())
+    folded = ''.join(c for c in folded if not unicodedata.combining(c))
+    return _TOKEN_RE.findall(folded)
+
+
+def _entry_text(entry) -> str:
+    """Text of a mission/result/environment (dict or legacy string)"""
+    return entry.get('description', '') if isinstance(entry, dict) else str(entry)
+
+
+def _locations(data: Dict) -> Iterable[Tuple[Optional[int], str, int, str]]:
+    """Every searchable text of a showcase as (experience, field, position, text)"""
+    yield None, 'summary', 0, data.get('summary')
+    for pos, cat in enumerate(data.get('skills') or []):
+        names = [i.get('name', '') if isinstance(i, dict) else str(i) for i in cat.get('items') or []]
+        yield None, 'skills', pos, ' '.join([cat.get('category', '')] + names)
+    for pos, cert in enumerate(data.get('certifications') or []):
+        yield None, 'certifications', pos, f"{cert.get('name', '')} {cert.get('issuer', '')}"
+    for idx, exp in enumerate(data.get('experience') or []):
+        for field in EXPERIENCE_FIELDS:
+            yield idx, field, 0, exp.get(field)
+        for field in ENTRY_FIELDS:
+            for pos, entry in enumerate(exp.get(field) or []):
+                yield idx, field, pos, _entry_text(entry)
+
+
+def _index_showcase(data: Dict) -> Dict:
+    """Postings (token -> space-separated locations) and experience labels of one showcase"""
+    tokens: Dict[str, List[str]] = {}
+    for exp_idx, field, pos, text in _locations(data):
+        location = f"{'' if exp_idx is None else exp_idx}:{field}:{pos}"
+        for token in set(tokenize(text)):
+            tokens.setdefault(token, []).append(location)
+    labels = [f"{exp.get('title', 'Untitled')} @ {exp.get('company', 'Unknown')}" for exp in data.get('experience') or []]
+    return {'tokens': {token: ' '.join(locations) for token, locations in tokens.items()}, 'labels': labels}
+
+
+def _segment_path(directory: Path, name: str) -> Path:
+    return directory / f"{quote(name, safe='')}.json"
+
+
+def _load_entries(directory: Path) -> Dict[str, Dict]:
+    """Persisted segments by showcase (outdated or unreadable ones are left out, and get rebuilt)"""
+    entries = {}
+    for path in directory.glob('*.json'):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            continue
+        except (OSError, ValueError) as e:
+            log.warning(f"Error reading search segment {path.name}: {e}")
+            continue
+        if entry.get('version') == SEARCH_INDEX_VERSION:
+            entries[entry['name']] = entry
+    return entries
+
+
+def _write_segment(directory: Path, entry: Dict) -> None:
+    """Store one showcase's segment (best effort: a lost segment is rebuilt on next load)"""
+    try:
+        atomic_io.atomic_write(_segment_path(directory, entry['name']),
+                               json.dumps(entry, ensure_ascii=False), fsync=False)
+    except OSError as e:
+        log.warning(f"Error writing search segment of {entry['name']}: {e}")
+
+
+def _build_entry(store: 'storage.ShowcaseStore', name: str) -> Optional[Dict]:
+    """Segment of one showcase, stamped before it is read (None if it is gone or unreadable)"""
+    stamp = store.stamp(name)
+    data = store.load(name) if stamp is not None else None
+    if data is None:
+        return None
+    return {'version': SEARCH_INDEX_VERSION, 'name': name, 'mtime_ns': stamp[0], 'size': stamp[1],
+            **_index_showcase(data)}
+
+
+def _init_worker(showcases_dir: str) -> None:
+    sm.SHOWCASES_DIR = Path(showcases_dir)
+
+
+def _build_in_worker(name: str) -> Optional[Dict]:
+    return _build_entry(storage.YamlStore(), name)
+
+
+def _build_entries(store: 'storage.ShowcaseStore', names: List[str]) -> Iterable[Optional[Dict]]:
+    """Segments of ``names``; parsing many YAML files is spread over a process pool"""
+    workers = min(os.cpu_count() or 1, len(names) // (PARALLEL_MIN // 2))
+    if not isinstance(store, storage.YamlStore) or len(names) < PARALLEL_MIN or workers < 2:
+        return [_build_entry(store, name) for name in names]
+    # spawn: forking a threaded process (e.g. the Streamlit server) is unsafe
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_worker, initargs=(str(sm.SHOWCASES_DIR),)) as executor:
+        return list(executor.map(_build_in_worker, names, chunksize=max(1, len(names) // (workers * 4))))
+
+
+def invalidate() -> None:
+    """Forget the in-memory index (re-read from disk on next use)"""
+    global _entries, _generation
+    with _lock:
+        _entries = None
+        _generation = None
+
+
+@timed('search_index', 'refresh')
+def refresh() -> int:
+    """Bring the index up to date with the stored showcases; returns how many were re-indexed
+
+    Only checks the showcases' stamps when the store's generation changed
+    since the last refresh.
+    """
+    global _entries, _index_dir, _generation
+    store = storage.default_store()
+    directory = store.sidecar_path(SEARCH_INDEX_DIRNAME)
+    with _lock:
+        # Created before reading the generation: making it bumps the showcases directory mtime
+        with contextlib.suppress(OSError):
+            directory.mkdir(parents=True, exist_ok=True)
+        generation = store.generation()
+        if _entries is None or _index_dir != directory:
+            _entries = _load_entries(directory)
+            _index_dir = directory
+            _generation = None
+            with contextlib.suppress(OSError):
+                store.sidecar_path(LEGACY_INDEX_NAME).unlink()
+        if generation == _generation:
+            return 0
+
+        changed = 0
+        names = store.list()
+        for name in set(_entries) - set(names):
+            del _entries[name]
+            with contextlib.suppress(OSError):
+                _segment_path(directory, name).unlink()
+            changed += 1
+        stale = []
+        for name in names:
+            old = _entries.get(name)
+            if old is None or (old['mtime_ns'], old['size']) != store.stamp(name):
+                stale.append(name)
+        for entry in _build_entries(store, stale):
+            if entry is not None:
+                _entries[entry['name']] = entry
+                _write_segment(directory, entry)
+                changed += 1
+        _generation = generation
+        return changed
+
+
+def search(query: str, fields: Optional[Iterable[str]] = None, limit: Optional[int] = None,
+           update: bool = True) -> List[Dict]:
+    """Find the places where every word of ``query`` appears together
+
+    Matches are per location (one mission, one environment, an experience
+    title...), optionally restricted to some ``fields``. Each hit is
+    ``{'showcase', 'experience', 'label', 'field', 'position'}``; hits are
+    sorted by showcase, experience, field and position.
+    """
+    tokens = set(tokenize(query))
+    if not tokens:
+        return []
+    if update or _entries is None:
+        refresh()
+
+    with timed('search_index', 'query', tokens=len(tokens)) as t, _lock:
+        hits = []
+        for name, entry in _entries.items():
+            postings = [entry['tokens'].get(token) for token in tokens]
+            if None in postings:
+                continue
+            # Start from the rarest token, intersect the others into it
+            postings.sort(key=len)
+            matches = set(postings[0].split())
+            for other in postings[1:]:
+                matches.intersection_update(other.split())
+                if not matches:
+                    break
+            labels = entry['labels']
+            for location in matches:
+                exp_idx, field, pos = location.split(':')
+                if fields is not None and field not in fields:
+                    continue
+                exp_idx = int(exp_idx) if exp_idx else None
+                hits.append({
+                    'showcase': name,
+                    'experience': exp_idx,
+                    'label': labels[exp_idx] if exp_idx is not None and exp_idx < len(labels) else None,
+                    'field': field,
+                    'position': int(pos)
+                })
+        hits.sort(key=lambda h: (h['showcase'], -1 if h['experience'] is None else h['experience'], h['field'], h['position']))
+        t.add(hits=len(hits))
+    return hits[:limit] if limit else hits
+
+
+def showcases_mentioning(query: str, fields: Optional[Iterable[str]] = None) -> List[str]:
+    """Names of the showcases where ``query`` matches"""
+    return sorted({hit['showcase'] for hit in search(query, fields)})
@@ -0,0 +1,260 @@
+"""
+Skills Matrix - Showcase x skill level matrix across all showcases
+
+Each showcase contributes one row: the level of every skill it lists
+(``skills[*].items[*]``), under a normalised skill key so that "Apache
+Spark", "spark" and "SPARK " share a column. Levels form a float32 NumPy
+array with NaN where a showcase does not list the skill (0 means listed
+without a level). Per-showcase rows are persisted in
+``showcases/.skills.json`` (next to the database with the SQLite store)
+with the stamp they were read from, so a refresh only re-reads showcases
+saved since, and queries are array operations over the whole matrix.
+"""
+
+import json
+import logging
+import re
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+import atomic_io
+import showcase_manager as sm
+import storage
+from instrumentation import timed
+
+log = logging.getLogger('dc.skills')
+
+SKILLS_INDEX_NAME = '.skills.json'
+SKILLS_INDEX_VERSION = 1
+
+# Spellings that name the same skill, by normalised form
+ALIASES = {
+    'apache spark': 'spark',
+    'apache kafka': 'kafka',
+    'apache hadoop': 'hadoop',
+    'k8s': 'kubernetes',
+    'postgres': 'postgresql',
+    'js': 'javascript',
+    'golang': 'go',
+    'sci kit': 'scikit learn',
+    'sklearn': 'scikit learn',
+}
+
+_NON_WORD_RE = re.compile(r"[^0-9a-z+#]+")
+
+
+class SkillMatrix(NamedTuple):
+    """Showcases (rows) x skills (columns); ``levels`` is NaN where a skill is not listed"""
+    names: List[str]
+    skills: List[str]         # normalised keys
+    labels: List[str]         # display name of each skill (most common spelling)
+    categories: List[str]     # most common category of each skill
+    levels: np.ndarray        # float32, shape (len(names), len(skills))
+
+    def column(self, skill: str) -> Optional[int]:
+        try:
+            return self.skills.index(normalize_skill(skill))
+        except ValueError:
+            return None
+
+
+_lock = threading.Lock()
+_entries: Optional[Dict[str, Dict]] = None
+_matrix: Optional[SkillMatrix] = None
+_index_file: Optional[Path] = None  # where _entries were loaded from (follows the storage backend)
+
+
+def normalize_skill(name) -> str:
+    """Case-, accent- and punctuation-insensitive key of a skill name"""
+    folded = unicodedata.normalize('NFKD', str(name or '').lower())
+    folded = ''.join(c for c in folded if not unicodedata.combining(c))
+    key = _NON_WORD_RE.sub(' ', folded).strip()
+    return ALIASES.get(key, key)
+
+
+def _skill_rows(data: Dict) -> Dict[str, List]:
+    """normalised key -> [level, label, category] of one showcase (highest level wins on duplicates)"""
+    rows: Dict[str, List] = {}
+    for cat in data.get('skills') or []:
+        category = cat.get('category', '') if isinstance(cat, dict) else ''
+        for item in (cat.get('items') or []) if isinstance(cat, dict) else []:
+            name = item.get('name', '') if isinstance(item, dict) else str(item)
+            key = normalize_skill(name)
+            if not key:
+                continue
+            level = item.get('level') if isinstance(item, dict) else None
+            level = float(level) if isinstance(level, (int, float)) else 0.0
+            if key not in rows or level > rows[key][0]:
+                rows[key] = [level, str(name).strip(), category]
+    return rows
+
+
+def _load_entries(path: Path) -> Dict[str, Dict]:
+    """Persisted per-showcase rows (empty if missing or outdated)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            doc = json.load(f)
+        if doc.get('version') == SKILLS_INDEX_VERSION:
+            return doc.get('showcases', {})
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        log.warning(f"Error reading skills index: {e}")
+    return {}
+
+
+def _most_common(counts: Dict[str, int]) -> str:
+    return max(counts.items(), key=lambda kv: (kv[1], kv[0]))[0]
+
+
+def _build(entries: Dict[str, Dict]) -> SkillMatrix:
+    """Matrix of every entry"""
+    names = sorted(entries, key=lambda x: (x != sm.BASELINE_NAME, x))
+    label_counts: Dict[str, Dict[str, int]] = {}
+    category_counts: Dict[str, Dict[str, int]] = {}
+    for name in names:
+        for key, (_, label, category) in entries[name]['skills'].items():
+            for counts, value in ((label_counts.setdefault(key, {}), label), (category_counts.setdefault(key, {}), category)):
+                counts[value] = counts.get(value, 0) + 1
+    skills = sorted(label_counts)
+    column = {key: col for col, key in enumerate(skills)}
+
+    rows, cols, values = [], [], []
+    for row, name in enumerate(names):
+        for key, (level, _, _) in entries[name]['skills'].items():
+            rows.append(row)
+            cols.append(column[key])
+            values.append(level)
+    levels = np.full((len(names), len(skills)), np.nan, dtype=np.float32)
+    levels[np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)] = values
+    return SkillMatrix(
+        names=names,
+        skills=skills,
+        labels=[_most_common(label_counts[key]) for key in skills],
+        categories=[_most_common(category_counts[key]) for key in skills],
+        levels=levels
+    )
+
+
+def invalidate() -> None:
+    """Forget the in-memory matrix (re-read from disk on next use)"""
+    global _entries, _matrix
+    with _lock:
+        _entries = None
+        _matrix = None
+
+
+@timed('skills_matrix', 'refresh')
+def refresh() -> int:
+    """Bring the matrix up to date with the stored showcases; returns how many showcases were re-read"""
+    global _entries, _matrix, _index_file
+    store = storage.default_store()
+    index_path = store.sidecar_path(SKILLS_INDEX_NAME)
+    with _lock:
+        if _entries is None or _index_file != index_path:
+            _entries = _load_entries(index_path)
+            _index_file = index_path
+            _matrix = None
+
+        changed = 0
+        names = set(store.list())
+        for name in [n for n in _entries if n not in names]:
+            del _entries[name]
+            changed += 1
+        for name in names:
+            stamp = store.stamp(name)
+            old = _entries.get(name)
+            if stamp is None or (old is not None and (old['mtime_ns'], old['size']) == stamp):
+                continue
+            data = store.load(name)  # YAML store: just saved, served from the parse cache
+            if data is None:
+                continue
+            _entries[name] = {'mtime_ns': stamp[0], 'size': stamp[1], 'skills': _skill_rows(data)}
+            changed += 1
+
+        if changed:
+            try:
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_io.atomic_write(index_path, json.dumps(
+                    {'version': SKILLS_INDEX_VERSION, 'showcases': _entries}, ensure_ascii=False))
+            except OSError as e:
+                log.warning(f"Error writing skills index: {e}")
+        if changed or _matrix is None:
+            _matrix = _build(_entries)
+        return changed
+
+
+def matrix(update: bool = True) -> SkillMatrix:
+    """The current showcase x skill matrix"""
+    if update or _matrix is None:
+        refresh()
+    return _matrix
+
+
+def showcases_with(requirements: Dict[str, float], update: bool = True) -> List[Tuple[str, Dict[str, float]]]:
+    """Showcases meeting every ``{skill: minimum level}``, with their levels of those skills
+
+    e.g. ``showcases_with({'Spark': 80, 'Kubernetes': 60})``
+    """
+    m = matrix(update)
+    cols = [m.column(skill) for skill in requirements]
+    if not requirements or None in cols:
+        return []
+    minimums = np.asarray(list(requirements.values()), dtype=np.float32)
+    selected = m.levels[:, cols]
+    # NaN (skill not listed) compares False, so it never qualifies
+    mask = np.all(selected >= minimums, axis=1)
+    return [(m.names[row], {m.labels[col]: float(m.levels[row, col]) for col in cols})
+            for row in np.flatnonzero(mask)]
+
+
+def skill_stats(skill: str, names: Optional[List[str]] = None, update: bool = True) -> Optional[Dict]:
+    """How many showcases list ``skill`` and its level distribution (over ``names`` if given)
+
+    Levels of 0 (listed without a level) count in ``showcases`` but not in
+    the level statistics.
+    """
+    m = matrix(update)
+    col = m.column(skill)
+    if col is None:
+        return None
+    values = m.levels[:, col]
+    if names is not None:
+        values = values[[m.names.index(n) for n in names if n in m.names]]
+    listed = values[~np.isnan(values)]
+    rated = listed[listed > 0]
+    stats = {'skill': m.labels[col], 'category': m.categories[col], 'showcases': int(listed.size),
+             'rated': int(rated.size), 'mean': None, 'median': None, 'min': None, 'max': None}
+    if rated.size:
+        stats.update(mean=round(float(rated.mean()), 1), median=float(np.median(rated)),
+                     min=float(rated.min()), max=float(rated.max()))
+    return stats
+
+
+def top_skills(limit: int = 20, update: bool = True) -> List[Dict]:
+    """Most widespread skills with their mean rated level, most listed first"""
+    m = matrix(update)
+    if not m.skills:
+        return []
+    listed = ~np.isnan(m.levels)
+    rated = np.where(m.levels > 0, m.levels, np.nan)
+    counts = listed.sum(axis=0)
+    rated_counts = (~np.isnan(rated)).sum(axis=0)
+    means = np.divide(np.nansum(rated, axis=0), rated_counts,
+                      out=np.full(len(m.skills), np.nan, dtype=np.float32), where=rated_counts > 0)
+    order = np.lexsort((-np.nan_to_num(means), -counts))[:limit]
+    return [{'skill': m.labels[col], 'category': m.categories[col], 'showcases': int(counts[col]),
+             'mean': None if np.isnan(means[col]) else round(float(means[col]), 1)} for col in order]
+
+
+def records(skills: List[str], update: bool = True) -> List[Dict]:
+    """Long-form ``{'showcase', 'skill', 'category', 'level'}`` rows of listed levels (for charts)"""
+    m = matrix(update)
+    cols = [col for col in (m.column(skill) for skill in skills) if col is not None]
+    rows, picked = np.nonzero(~np.isnan(m.levels[:, cols]))
+    return [{'showcase': m.names[row], 'skill': m.labels[cols[i]], 'category': m.categories[cols[i]],
+             'level': float(m.levels[row, cols[i]])} for row, i in zip(rows.tolist(), picked.tolist())]
@@ -0,0 +1,385 @@
+"""
+Storage - Pluggable showcase storage backends
+
+``YamlStore`` is the historical layout (one YAML file per showcase, see
+showcase_manager). ``SqliteStore`` keeps each showcase as rows of one
+SQLite database: one row per top-level section and one per experience,
+each with a content hash, so saving only rewrites the rows that changed
+(editing one mission updates one experience row). The database runs in
+WAL mode: readers never block on a writer, and every save is one
+transaction.
+
+Pick the backend with DC_STORAGE: ``yaml`` (default) or
+``sqlite:<path/to/showcases.db>``; ``default_store()`` returns it (one
+instance per process, used by the app, search and the skills matrix).
+
+Usage: python storage.py migrate <showcases.db>   (copy every YAML showcase into SQLite)
+"""
+
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import showcase_manager as sm
+from instrumentation import timed
+
+log = logging.getLogger('dc.storage')
+
+# Top-level lists stored one row per item
+SPLIT_KEYS = ('experience',)
+
+
+def _encode(value) -> str:
+    """JSON text of a showcase value; dates (which YAML parses as such) are stored as ISO strings"""
+    return json.dumps(value, ensure_ascii=False, default=_iso_date)
+
+
+def _iso_date(value) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serialisable")
+
+
+class ShowcaseStore:
+    """Interface shared by the storage backends"""
+
+    def list(self) -> List[str]:
+        """Showcase names, baseline first"""
+        raise NotImplementedError
+
+    def exists(self, name: str) -> bool:
+        return name in self.list()
+
+    def load(self, name: str) -> Optional[Dict]:
+        """Showcase data, or None if missing or unreadable"""
+        raise NotImplementedError
+
+    def save(self, name: str, data: Dict) -> bool:
+        """Store the whole showcase (backends may only write what changed)"""
+        raise NotImplementedError
+
+    def info(self, name: str) -> Dict:
+        """Metadata (size, lineage...) without loading the showcase"""
+        raise NotImplementedError
+
+    def stamp(self, name: str) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a showcase, changed by every write; None if it does not exist"""
+        raise NotImplementedError
+
+    def sidecar_path(self, filename: str) -> Path:
+        """Where files kept alongside the showcases go (indexes, original JSON exports)"""
+        raise NotImplementedError
+
+    def generation(self) -> tuple:
+        """Opaque stamp of the whole store, changed when any showcase is created, saved, renamed or deleted"""
+        raise NotImplementedError
+
+    def rename(self, old_name: str, new_name: str) -> bool:
+        raise NotImplementedError
+
+    def delete(self, name: str) -> bool:
+        """Delete a showcase (never the baseline)"""
+        raise NotImplementedError
+
+    def create_variant(self, source_name: str, variant_name: str, description: str = "", delta: bool = False) -> bool:
+        raise NotImplementedError
+
+    def variant_source(self, data: Optional[Dict]) -> Optional[Dict]:
+        """The showcase ``data`` was created from, if it still exists"""
+        info = (data or {}).get('_variant_info') or {}
+        return self.load(info['created_from']) if info.get('created_from') else None
+
+
+class YamlStore(ShowcaseStore):
+    """One YAML file per showcase in showcase_manager.SHOWCASES_DIR"""
+
+    def list(self) -> List[str]:
+        return sm.list_showcases()
+
+    def exists(self, name: str) -> bool:
+        return sm.showcase_exists(name)
+
+    def load(self, name: str) -> Optional[Dict]:
+        return sm.load_showcase(name)
+
+    def save(self, name: str, data: Dict) -> bool:
+        return sm.save_showcase(name, data)
+
+    def info(self, name: str) -> Dict:
+        return sm.get_showcase_info(name)
+
+    def stamp(self, name: str) -> Optional[Tuple[int, int]]:
+        return sm.file_stamp(sm.get_showcase_path(name))
+
+    def sidecar_path(self, filename: str) -> Path:
+        return sm.SHOWCASES_DIR / filename
+
+    def generation(self) -> tuple:
+        # Saves replace the file (temp file + rename), so they bump the directory mtime too
+        try:
+            return sm.SHOWCASES_DIR, sm.SHOWCASES_DIR.stat().st_mtime_ns
+        except FileNotFoundError:
+            return sm.SHOWCASES_DIR, None
+
+    def rename(self, old_name: str, new_name: str) -> bool:
+        return sm.rename_showcase(old_name, new_name)
+
+    def delete(self, name: str) -> bool:
+        return sm.delete_showcase(name)
+
+    def create_variant(self, source_name: str, variant_name: str, description: str = "", delta: bool = False) -> bool:
+        return sm.create_variant(source_name, variant_name, description, delta)
+
+    def variant_source(self, data: Optional[Dict]) -> Optional[Dict]:
+        return sm.variant_source(data)
+
+
+class SqliteStore(ShowcaseStore):
+    """Showcases as section rows of one SQLite database (WAL mode)
+
+    Delta storage does not apply here: variants are plain row copies, made
+    inside the database without serialising anything.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS showcases (
+            name TEXT PRIMARY KEY,
+            variant_info TEXT,
+            size INTEGER NOT NULL DEFAULT 0,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS sections (
+            showcase TEXT NOT NULL REFERENCES showcases(name) ON UPDATE CASCADE ON DELETE CASCADE,
+            key TEXT NOT NULL,
+            idx INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            value TEXT NOT NULL,
+            hash TEXT NOT NULL,
+            PRIMARY KEY (showcase, key, idx)
+        );
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """This thread's connection (sqlite3 connections are not shared across threads)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _rows(data: Dict) -> Dict[tuple, tuple]:
+        """(key, idx) -> (position, value, hash) rows of a showcase
+
+        Split lists get a header row at idx -1 with an empty hash; any other
+        value of a split key (e.g. ``experience: null``) is its header row.
+        """
+        rows = {}
+        for position, (key, value) in enumerate(data.items()):
+            if key in SPLIT_KEYS and isinstance(value, list):
+                rows[(key, -1)] = (position, 'null', '')
+                for idx, item in enumerate(value):
+                    rows[(key, idx)] = (position, _encode(item), sm.content_hash(item))
+            else:
+                rows[(key, -1)] = (position, _encode(value), sm.content_hash(value))
+        return rows
+
+    def list(self) -> List[str]:
+        names = [row[0] for row in self._connect().execute("SELECT name FROM showcases")]
+        return sorted(names, key=lambda x: (x != sm.BASELINE_NAME, x))
+
+    def exists(self, name: str) -> bool:
+        return self._connect().execute("SELECT 1 FROM showcases WHERE name = ?", (name,)).fetchone() is not None
+
+    def load(self, name: str) -> Optional[Dict]:
+        with timed('sqlite_load', 'read', name=name):
+            rows = self._connect().execute(
+                "SELECT key, idx, value, hash FROM sections WHERE showcase = ? ORDER BY position, idx", (name,)
+            ).fetchall()
+        if not rows:
+            return None
+        data = {}
+        for key, idx, value, digest in rows:
+            if key in SPLIT_KEYS and idx == -1 and not digest:
+                data[key] = []
+            elif idx >= 0:
+                data[key].append(json.loads(value))
+            else:
+                data[key] = json.loads(value)
+        return data
+
+    def save(self, name: str, data: Dict) -> bool:
+        """Write only the rows whose content hash changed, in one transaction"""
+        try:
+            rows = self._rows(data)
+            variant_info = _encode(data.get('_variant_info'))
+        except (TypeError, ValueError) as e:
+            log.exception(f"Error serialising showcase {name}: {e}")
+            return False
+        conn = self._connect()
+        try:
+            with timed('sqlite_save', 'write', name=name) as t, conn:
+                conn.execute("BEGIN IMMEDIATE")
+                current = {(key, idx): (position, digest) for key, idx, position, digest in conn.execute(
+                    "SELECT key, idx, position, hash FROM sections WHERE showcase = ?", (name,))}
+                changed = [(name, key, idx, position, value, digest)
+                           for (key, idx), (position, value, digest) in rows.items()
+                           if current.get((key, idx)) != (position, digest)]
+                removed = [(name, key, idx) for (key, idx) in current if (key, idx) not in rows]
+                size = sum(len(value) for _, value, _ in rows.values())
+                conn.execute(
+                    "INSERT INTO showcases (name, variant_info, size, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET variant_info = excluded.variant_info, "
+                    "size = excluded.size, updated_at = excluded.updated_at",
+                    (name, variant_info, size, time.time()))
+                conn.executemany("DELETE FROM sections WHERE showcase = ? AND key = ? AND idx = ?", removed)
+                conn.executemany("INSERT OR REPLACE INTO sections VALUES (?, ?, ?, ?, ?, ?)", changed)
+                t.add(rows=len(changed) + len(removed), bytes=sum(len(row[4]) for row in changed))
+            return True
+        except sqlite3.Error as e:
+            log.exception(f"Error saving showcase {name}: {e}")
+            return False
+
+    def info(self, name: str) -> Dict:
+        row = self._connect().execute(
+            "SELECT variant_info, size, updated_at FROM showcases WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return {}
+        info = {
+            'name': name,
+            'is_baseline': name == sm.BASELINE_NAME,
+            'size_kb': row[1] / 1024,
+            'modified': datetime.fromtimestamp(row[2]).isoformat()
+        }
+        info.update(json.loads(row[0]) or {})
+        return info
+
+    def stamp(self, name: str) -> Optional[Tuple[int, int]]:
+        row = self._connect().execute("SELECT updated_at, size FROM showcases WHERE name = ?", (name,)).fetchone()
+        return (int(row[0] * 1e9), row[1]) if row is not None else None
+
+    def sidecar_path(self, filename: str) -> Path:
+        # showcases.db -> showcases.db.search/, showcases.db.baseline.original.json...
+        return self.path.with_name(f"{self.path.name}.{filename.lstrip('.')}")
+
+    def generation(self) -> tuple:
+        # Saves and renames bump updated_at, deletes lower the count
+        return tuple(self._connect().execute("SELECT COUNT(*), MAX(updated_at) FROM showcases").fetchone())
+
+    def rename(self, old_name: str, new_name: str) -> bool:
+        if old_name == sm.BASELINE_NAME or self.exists(new_name):
+            return False
+        try:
+            with self._connect() as conn:
+                # sections follow through ON UPDATE CASCADE
+                return conn.execute("UPDATE showcases SET name = ?, updated_at = ? WHERE name = ?",
+                                    (new_name, time.time(), old_name)).rowcount == 1
+        except sqlite3.Error as e:
+            log.exception(f"Error renaming showcase: {e}")
+            return False
+
+    def delete(self, name: str) -> bool:
+        if name == sm.BASELINE_NAME:
+            return False  # Protect baseline
+        try:
+            with self._connect() as conn:
+                return conn.execute("DELETE FROM showcases WHERE name = ?", (name,)).rowcount == 1
+        except sqlite3.Error as e:
+            log.exception(f"Error deleting showcase {name}: {e}")
+            return False
+
+    def create_variant(self, source_name: str, variant_name: str, description: str = "", delta: bool = False) -> bool:
+        if not source_name or not variant_name or not self.exists(source_name) or self.exists(variant_name):
+            return False
+        source_info = self.info(source_name)
+        variant_info = {k: v for k, v in source_info.items()
+                        if k not in ('name', 'is_baseline', 'size_kb', 'modified', 'storage', 'base')}
+        variant_info.update({
+            'created_from': source_name,
+            'created_at': datetime.now().isoformat(),
+            'description': description
+        })
+        encoded = _encode(variant_info)
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO showcases (name, variant_info, size, updated_at) "
+                    "SELECT ?, ?, size, ? FROM showcases WHERE name = ?",
+                    (variant_name, encoded, time.time(), source_name))
+                conn.execute(
+                    "INSERT INTO sections SELECT ?, key, idx, position, value, hash FROM sections "
+                    "WHERE showcase = ? AND key != '_variant_info'", (variant_name, source_name))
+                # _variant_info goes last, like a full copy made by showcase_manager
+                position = conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM sections WHERE showcase = ?",
+                                        (variant_name,)).fetchone()[0]
+                conn.execute("INSERT INTO sections VALUES (?, '_variant_info', -1, ?, ?, ?)",
+                             (variant_name, position, encoded, sm.content_hash(variant_info)))
+            return True
+        except sqlite3.Error as e:
+            log.exception(f"Error creating variant: {e}")
+            return False
+
+
+def get_store(spec: Optional[str] = None) -> ShowcaseStore:
+    """Backend named by ``spec`` or DC_STORAGE (``yaml`` or ``sqlite:<path>``)"""
+    spec = spec or os.environ.get('DC_STORAGE', 'yaml')
+    if spec.startswith('sqlite:'):
+        return SqliteStore(spec.split(':', 1)[1])
+    if spec != 'yaml':
+        raise ValueError(f"Unknown storage backend: {spec}")
+    return YamlStore()
+
+
+_default_stores: Dict[str, ShowcaseStore] = {}
+_default_lock = threading.Lock()
+
+
+def default_store() -> ShowcaseStore:
+    """The process-wide backend named by DC_STORAGE (shared by the app, search and skills matrix)"""
+    spec = os.environ.get('DC_STORAGE', 'yaml')
+    with _default_lock:
+        if spec not in _default_stores:
+            _default_stores[spec] = get_store(spec)
+        return _default_stores[spec]
+
+
+def migrate(source: ShowcaseStore, target: ShowcaseStore) -> int:
+    """Copy every showcase of ``source`` (and its original JSON) into ``target``; returns how many were copied"""
+    copied = 0
+    for name in source.list():
+        data = source.load(name)
+        if data is not None and target.save(name, data):
+            copied += 1
+            original = source.sidecar_path(f"{name}.original.json")
+            if original.exists():
+                shutil.copyfile(original, target.sidecar_path(f"{name}.original.json"))
+    return copied
+
+
+if __name__ == "__main__":
+    import sys
+    from instrumentation import configure_logging
+
+    configure_logging()
+    if len(sys.argv) < 3 or sys.argv[1] != 'migrate':
+        print("Usage: python storage.py migrate <showcases.db>")
+        sys.exit(1)
+    count = migrate(YamlStore(), SqliteStore(sys.argv[2]))
+    log.info(f"[OK] Copied {count} showcases from {sm.SHOWCASES_DIR} to {sys.argv[2]}")
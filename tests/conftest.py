@@ -0,0 +1,22 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+import showcase_manager as sm
+
+REPO_SHOWCASES = Path(__file__).resolve().parent.parent / "showcases"
+
+
+@pytest.fixture
+def showcases_dir(tmp_path, monkeypatch):
+    """Scratch showcases directory holding a copy of the baseline, with cold caches"""
+    directory = tmp_path / "showcases"
+    directory.mkdir()
+    shutil.copy(REPO_SHOWCASES / f"{sm.BASELINE_NAME}.yaml", directory)
+    monkeypatch.setattr(sm, 'SHOWCASES_DIR', directory)
+    monkeypatch.setattr(sm, 'BASE_PRUNE_GRACE', 0.0)
+    monkeypatch.setattr(sm, '_index_memo', None)
+    sm.invalidate_cache()
+    yield directory
+    sm.invalidate_cache()
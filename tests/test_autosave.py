@@ -0,0 +1,111 @@
+import autosave
+import storage
+
+DELAY = 0.05
+
+
+def _showcase():
+    return {
+        'personal_info': {'name': "Ada Lovelace"},
+        'summary': "Engineer",
+        'experience': [{'title': "Analyst", 'missions': []}, {'title': "Engineer", 'missions': []}]
+    }
+
+
+class Recorder:
+    """save callable recording what gets written, optionally failing"""
+
+    def __init__(self, ok=True):
+        self.ok = ok
+        self.writes = []
+
+    def __call__(self, name, data):
+        self.writes.append((name, data))
+        return self.ok
+
+
+def _saver(ok=True):
+    recorder = Recorder(ok)
+    saver = autosave.Autosaver(delay=DELAY, save=recorder)
+    saver.track('lead', _showcase())
+    return saver, recorder
+
+
+def test_clean_state_is_not_written():
+    saver, recorder = _saver()
+    data = _showcase()
+    assert saver.dirty(data) == []
+    assert saver.save(data)
+    saver.schedule(data)
+    assert not saver.pending
+    assert recorder.writes == []
+
+
+def test_only_dirty_sections_are_written(tmp_path):
+    store = storage.SqliteStore(tmp_path / "showcases.db")
+    data = _showcase()
+    assert store.save('lead', data)
+    saver = autosave.Autosaver(delay=DELAY, save=store.save)
+    saver.track('lead', data)
+
+    data['experience'][1]['title'] = "Lead engineer"
+    assert saver.dirty(data) == ['experience/1']
+    conn = store._connect()
+    before = conn.total_changes
+    assert saver.save(data)
+    # The showcase row and the one experience row
+    assert conn.total_changes - before == 2
+    assert saver.dirty(data) == []
+    assert store.load('lead') == data
+
+
+def test_debounced_save_writes_a_snapshot():
+    saver, recorder = _saver()
+    data = _showcase()
+    data['summary'] = "Lead engineer"
+    saver.schedule(data)
+    assert saver.pending
+    timer = saver._timer
+    data['summary'] = "Edited after scheduling"
+    timer.join(1)
+    assert not saver.pending
+    assert recorder.writes[0][1]['summary'] == "Lead engineer"
+    assert saver.last_saved_at is not None
+
+
+def test_reschedule_replaces_the_pending_timer():
+    saver, recorder = _saver()
+    data = _showcase()
+    data['summary'] = "First"
+    saver.schedule(data)
+    first = saver._timer
+    data['summary'] = "Second"
+    saver.schedule(data)
+    second = saver._timer
+    assert second is not first
+    first.join(1)
+    second.join(1)
+    assert [written['summary'] for _, written in recorder.writes] == ["Second"]
+
+
+def test_cancel_prevents_the_write():
+    saver, recorder = _saver()
+    data = _showcase()
+    data['summary'] = "Never saved"
+    saver.schedule(data)
+    timer = saver._timer
+    saver.cancel()
+    timer.join()
+    assert not saver.pending
+    assert recorder.writes == []
+
+
+def test_failed_save_sets_last_error():
+    saver, recorder = _saver(ok=False)
+    data = _showcase()
+    data['summary'] = "Lost"
+    saver.schedule(data)
+    saver._timer.join(1)
+    assert saver.last_error == "Could not save lead"
+    assert saver.dirty(data) == ['summary']
+    assert not saver.save(data)
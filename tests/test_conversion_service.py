@@ -0,0 +1,37 @@
+import asyncio
+import json
+
+from conversion_service import ConversionService
+from tests.conftest import REPO_SHOWCASES
+
+
+async def _post(port: int, path: str, body: bytes):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), payload
+
+
+def test_service_warms_every_worker_and_writes_no_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pids = []
+
+    async def scenario():
+        service = ConversionService(workers=2)
+        await service.start('127.0.0.1', 0)
+        try:
+            pids.extend(proc.pid for proc in service.executor._processes.values())
+            port = service.server.sockets[0].getsockname()[1]
+            status, payload = await _post(port, '/yaml2json', (REPO_SHOWCASES / "baseline.yaml").read_bytes())
+            assert status == 200 and json.loads(payload)
+            status, _ = await _post(port, '/json2yaml', b'{"not": "a cv"}')
+            assert status == 422
+        finally:
+            await service.close()
+
+    asyncio.run(scenario())
+    assert len(set(pids)) == 2
+    assert list(tmp_path.iterdir()) == []
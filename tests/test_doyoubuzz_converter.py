@@ -0,0 +1,192 @@
+import copy
+import gzip
+import importlib.util
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+import doyoubuzz_converter as dyb
+import showcase_manager as sm
+from tests.conftest import REPO_SHOWCASES
+
+BASELINE_COMMIT = '02e3f3f'  # converter as it was before the backlog series
+
+
+@pytest.fixture(scope='module')
+def original_converter(tmp_path_factory):
+    """doyoubuzz_converter as of BASELINE_COMMIT, loaded from git"""
+    try:
+        source = subprocess.run(['git', 'show', f"{BASELINE_COMMIT}:doyoubuzz_converter.py"], cwd=REPO_SHOWCASES.parent,
+                                capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip(f"converter of {BASELINE_COMMIT} not available")
+    path = tmp_path_factory.mktemp('original') / 'original_converter.py'
+    path.write_bytes(source)
+    spec = importlib.util.spec_from_file_location('original_converter', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _baseline():
+    return yaml.safe_load((REPO_SHOWCASES / f"{sm.BASELINE_NAME}.yaml").read_text(encoding='utf-8'))
+
+
+def _export(converter, showcase, tmp_path) -> bytes:
+    """JSON written by ``converter``'s yaml_to_json for ``showcase``"""
+    src, dst = tmp_path / 'showcase.yaml', tmp_path / 'showcase.json'
+    src.write_text(yaml.safe_dump(showcase, allow_unicode=True, sort_keys=False), encoding='utf-8')
+    converter.yaml_to_json(str(src), str(dst))
+    return dst.read_bytes()
+
+
+def _edit(showcase):
+    """Date, certificate name and skill level edits as the app makes them"""
+    showcase['experience'][0]['start_date'] = '2023-05'
+    showcase['experience'][0]['end_date'] = ''
+    showcase['certifications'][0].update(name='Spark Developer', issuer='Databricks')
+    showcase['skills'][0]['items'][0]['level'] = 40
+    return showcase
+
+
+def _check_edits(exported):
+    assert exported['experiences'][0]['range']['start'] == {'year': '2023', 'month': '05'}
+    assert exported['experiences'][0]['range']['end'] == {'year': '', 'month': ''}
+    assert exported['certificates'][0]['name'] == 'Spark Developer - Databricks'
+    assert exported['skills'][0]['children'][0]['level'] == 40
+
+
+def test_baseline_export_is_byte_identical_to_the_original_converter(original_converter, tmp_path):
+    src = REPO_SHOWCASES / f"{sm.BASELINE_NAME}.yaml"
+    expected, current = tmp_path / 'expected.json', tmp_path / 'current.json'
+    original_converter.yaml_to_json(str(src), str(expected))
+    dyb.yaml_to_json(str(src), str(current))
+    assert current.read_bytes() == expected.read_bytes()
+
+
+def test_edits_export_like_the_original_converter(original_converter, tmp_path):
+    edited = _edit(_baseline())
+    # Inline _dyb_start/_dyb_full still win over edited dates and names, as they always did
+    assert _export(dyb, edited, tmp_path) == _export(original_converter, edited, tmp_path)
+
+
+def test_compact_showcase_exports_edits():
+    compact = dyb.compact_showcase(_baseline())
+    exported = dyb.showcase_to_dyb(_edit(compact))
+    _check_edits(exported)
+    assert exported['certificates'][0]['obtainedAt'] == 'Mai 2024'
+
+
+def test_compact_showcase_imported_from_json_exports_the_same():
+    legacy = _baseline()
+    compact = dyb.compact_showcase(legacy)
+    imported = json.loads(json.dumps(compact))
+    assert all(isinstance(key, str) for table in imported['_doyoubuzz_metadata']['objects'].values() for key in table)
+    assert dyb.validate_showcase(imported) == []
+
+    # Same content as the legacy form; the compact form only moves a few keys within their objects
+    assert dyb.showcase_to_dyb(imported) == dyb.showcase_to_dyb(legacy)
+    assert dyb.showcase_to_dyb(_edit(imported)) == dyb.showcase_to_dyb(_edit(copy.deepcopy(compact)))
+
+
+def test_export_without_cache_dir_writes_nothing(showcases_dir, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    showcase = sm.load_showcase(sm.BASELINE_NAME)
+    result = dyb.export_showcase(showcase, compress=True)
+    assert result['ok'] and not result['cached'] and result['key'] == ''
+    assert gzip.decompress(result['gzip']) == result['json']
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['showcases']
+    assert not (showcases_dir / '.exports').exists()
+
+
+def test_export_served_from_cache_dir(showcases_dir, tmp_path):
+    showcase = sm.load_showcase(sm.BASELINE_NAME)
+    cache_dir = tmp_path / "exports"
+    first = dyb.export_showcase(showcase, cache_dir=cache_dir, compress=True)
+    second = dyb.export_showcase(showcase, cache_dir=cache_dir, compress=True)
+    assert (first['cached'], second['cached']) == (False, True)
+    assert first['json'] == second['json'] and first['gzip'] == second['gzip']
+    assert sorted(p.name for p in cache_dir.iterdir()) == [f"{first['key']}.json", f"{first['key']}.json.gz"]
+
+    showcase['summary'] = "Changed"
+    assert dyb.export_showcase(showcase, cache_dir=cache_dir)['cached'] is False
+    assert dyb.prune_export_cache(cache_dir, max_bytes=0) == 3
+
+
+def _import(obj):
+    return dyb.import_upload(io.BytesIO(json.dumps(obj).encode('utf-8')))
+
+
+def test_import_accepts_showcases_and_doyoubuzz_exports(showcases_dir):
+    showcase = sm.load_showcase(sm.BASELINE_NAME)
+    assert dyb.validate_showcase(showcase) == []
+    assert _import(showcase)['source'] == 'showcase'
+    result = _import(dyb.showcase_to_dyb(showcase))
+    assert result['ok'] and result['source'] == 'doyoubuzz'
+
+
+def test_import_rejects_what_the_editor_cannot_open(showcases_dir):
+    showcase = sm.load_showcase(sm.BASELINE_NAME)
+    showcase['skills'][0].pop('category')
+    showcase['experience'][0]['title'] = 12
+    problems = dyb.validate_showcase(showcase)
+    assert problems == ["skills[0]: missing category", "experience[0].title: expected text, got int"]
+
+    for upload in ({"experience": []}, {"personal_info": {}}, [1, 2]):
+        result = _import(upload)
+        assert not result['ok'] and result['error']['type'] == 'ConversionError'
+
+
+def test_import_reports_incomplete_doyoubuzz_exports():
+    result = _import({"owner": {"firstname": "Ada"}})
+    assert result['error'] == {'type': 'ConversionError', 'message': "Not a DoYouBuzz export (missing field 'lastname')"}
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """A lossless export, one with an explicit zero skill level and one JSON that is not an export"""
+    directory = tmp_path / "corpus"
+    directory.mkdir()
+    export = dyb.showcase_to_dyb(_baseline())
+    (directory / "clean.json").write_text(json.dumps(export), encoding='utf-8')
+    export['skills'][0]['children'][0]['level'] = 0
+    (directory / "zero.json").write_text(json.dumps(export), encoding='utf-8')
+    (directory / "other.json").write_text(json.dumps({"name": "not an export"}), encoding='utf-8')
+    return directory
+
+
+def test_verify_classifies_losses_and_failures(corpus, tmp_path):
+    report = dyb.verify_corpus(str(corpus), str(tmp_path / "report.json"), workers=1, yaml_text=False)
+    assert (report['total'], report['lossless'], report['lossy'], report['failed']) == (3, 1, 1, 1)
+    assert [(c['class'], c['files'], c['count']) for c in report['classes']] == [('missing .skills[*].children[*].level', 1, 1)]
+    by_name = {Path(entry['source']).name: entry for entry in report['files']}
+    assert not by_name['other.json']['ok'] and by_name['other.json']['error'] is not None
+    assert json.loads((tmp_path / "report.json").read_text(encoding='utf-8'))['failed'] == 1
+
+
+def test_verify_without_source_prints_usage():
+    result = subprocess.run([sys.executable, 'doyoubuzz_converter.py', 'verify', '--no-yaml'],
+                            cwd=REPO_SHOWCASES.parent, capture_output=True, text=True)
+    assert result.returncode == 1
+    assert result.stdout.startswith("Usage: python doyoubuzz_converter.py verify")
+    assert 'Traceback' not in result.stderr
+
+
+def test_batch_reports_colliding_outputs(tmp_path):
+    source, out = tmp_path / "in", tmp_path / "out"
+    source.mkdir()
+    baseline = (REPO_SHOWCASES / f"{sm.BASELINE_NAME}.yaml").read_bytes()
+    for name in ("a.yaml", "a.yml", "b.yaml"):
+        (source / name).write_bytes(baseline)
+
+    manifest = dyb.batch_convert(str(source), str(out), workers=1)
+    assert (manifest['total'], manifest['converted'], manifest['failed']) == (3, 1, 2)
+    failed = {Path(e['source']).name: e['error']['message'] for e in manifest['files'] if not e['ok']}
+    assert sorted(failed) == ['a.yaml', 'a.yml']
+    assert failed['a.yaml'].endswith(str(source / "a.yml"))
+    assert sorted(p.name for p in out.iterdir()) == ['b.json', dyb.BATCH_MANIFEST]
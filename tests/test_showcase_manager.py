@@ -0,0 +1,166 @@
+import copy
+
+import showcase_manager as sm
+
+
+def _bases(directory):
+    return sorted(p.stem for p in (directory / sm.BASES_DIRNAME).glob("*.yaml"))
+
+
+def test_delta_variant_round_trip(showcases_dir):
+    assert sm.create_variant(sm.BASELINE_NAME, 'lead', "Lead roles", delta=True)
+    document = sm.yaml_backend.load((showcases_dir / "lead.yaml").read_text(encoding='utf-8'))
+    assert document['_variant_info']['storage'] == 'delta'
+    assert document[sm.DELTA_KEY] == []
+
+    baseline = sm.load_showcase(sm.BASELINE_NAME)
+    variant = sm.load_showcase('lead')
+    assert {k: v for k, v in variant.items() if k != '_variant_info'} == baseline
+
+
+def test_delta_variant_save_stores_only_the_patch(showcases_dir):
+    sm.create_variant(sm.BASELINE_NAME, 'lead', delta=True)
+    variant = sm.load_showcase('lead')
+    variant['experience'][0]['missions'][0]['description'] = "Led the platform team"
+    del variant['certifications']
+    assert sm.save_showcase('lead', variant)
+
+    sm.invalidate_cache()
+    document = sm.yaml_backend.load((showcases_dir / "lead.yaml").read_text(encoding='utf-8'))
+    assert len(document[sm.DELTA_KEY]) == 2
+    assert sm.load_showcase('lead') == variant
+
+
+def test_unchanged_source_reuses_its_snapshot_without_dumping(showcases_dir, monkeypatch):
+    sm.create_variant(sm.BASELINE_NAME, 'lead', delta=True)
+    dumped = []
+    dump = sm.yaml_backend.dump
+    monkeypatch.setattr(sm.yaml_backend, 'dump', lambda data, *args, **kwargs: dumped.append(data) or dump(data, *args, **kwargs))
+    sm.create_variant(sm.BASELINE_NAME, 'architect', delta=True)
+    assert not any('experience' in data for data in dumped)
+    assert sm.load_showcase('architect')['_variant_info']['base'] == sm.load_showcase('lead')['_variant_info']['base']
+
+    baseline = sm.load_showcase(sm.BASELINE_NAME)
+    baseline['summary'] = "Changed"
+    assert sm.save_showcase(sm.BASELINE_NAME, baseline)
+    sm.create_variant(sm.BASELINE_NAME, 'engineer', delta=True)
+    assert any('experience' in data for data in dumped)
+    assert len(_bases(showcases_dir)) == 2
+    assert sm.load_showcase('engineer')['summary'] == "Changed"
+
+
+def test_make_and_apply_delta():
+    old = {'a': [1, 2, 3, 4], 'b': {'c': 1, 'd': 2}}
+    new = {'a': [1, 5, 4], 'b': {'c': 3}, 'e': 'x'}
+    data = copy.deepcopy(old)
+    sm._apply_delta(data, sm._make_delta(old, new))
+    assert data == new
+
+
+def test_prune_keeps_bases_referenced_on_disk_without_index(showcases_dir):
+    sm.create_variant(sm.BASELINE_NAME, 'lead', delta=True)
+    sm.create_variant(sm.BASELINE_NAME, 'copy')
+    in_use = _bases(showcases_dir)
+    assert len(in_use) == 1
+
+    # The index is a gitignored cache: losing it must not lose snapshots
+    (showcases_dir / sm.INDEX_NAME).unlink()
+    sm.invalidate_cache()
+    sm.create_variant('copy', 'throwaway')
+    assert sm.delete_showcase('throwaway')
+
+    assert _bases(showcases_dir) == in_use
+    sm.invalidate_cache()
+    assert sm.load_showcase('lead') is not None
+
+
+def test_prune_keeps_bases_of_variants_written_by_other_processes(showcases_dir):
+    sm.create_variant(sm.BASELINE_NAME, 'lead', delta=True)
+    sm.load_showcase(sm.BASELINE_NAME)
+    # A stale index entry (file rewritten behind this process's back)
+    data = sm.load_showcase('lead')
+    (showcases_dir / "other.yaml").write_bytes((showcases_dir / "lead.yaml").read_bytes())
+    sm._update_index(lambda entries: entries.__setitem__('other', dict(entries['lead'], name='other', variant_info={})))
+    assert sm.delete_showcase('lead')
+    assert _bases(showcases_dir) == [data['_variant_info']['base']]
+    assert sm.load_showcase('other') is not None
+
+
+def test_prune_removes_unreferenced_bases(showcases_dir):
+    sm.create_variant(sm.BASELINE_NAME, 'lead', delta=True)
+    assert len(_bases(showcases_dir)) == 1
+    assert sm.delete_showcase('lead')
+    assert _bases(showcases_dir) == []
+
+
+def test_prune_respects_grace_period(showcases_dir, monkeypatch):
+    monkeypatch.setattr(sm, 'BASE_PRUNE_GRACE', 3600.0)
+    sm.create_variant(sm.BASELINE_NAME, 'lead', delta=True)
+    assert sm.delete_showcase('lead')
+    assert len(_bases(showcases_dir)) == 1
+
+
+def test_prune_skips_when_a_showcase_is_unreadable(showcases_dir):
+    sm.create_variant(sm.BASELINE_NAME, 'lead', delta=True)
+    (showcases_dir / sm.INDEX_NAME).unlink()
+    (showcases_dir / "broken.yaml").write_text("key: [unclosed", encoding='utf-8')
+    sm.invalidate_cache()
+    assert sm.prune_bases() == 0
+    assert len(_bases(showcases_dir)) == 1
+
+
+def test_listing_follows_external_changes(showcases_dir):
+    assert sm.list_showcases() == [sm.BASELINE_NAME]
+    (showcases_dir / "external.yaml").write_bytes((showcases_dir / "baseline.yaml").read_bytes())
+    sm.create_variant(sm.BASELINE_NAME, 'v1')
+    assert sm.list_showcases() == [sm.BASELINE_NAME, 'external', 'v1']
+    sm.rename_showcase('v1', 'v2')
+    sm.delete_showcase('external')
+    assert sm.list_showcases() == [sm.BASELINE_NAME, 'v2']
+
+
+def test_delete_and_rename_remove_their_lock_files(showcases_dir):
+    sm.create_variant(sm.BASELINE_NAME, 'v1')
+    sm.create_variant(sm.BASELINE_NAME, 'gone')
+    assert (showcases_dir / ".v1.yaml.lock").exists()
+    assert sm.rename_showcase('v1', 'v2')
+    assert sm.delete_showcase('gone')
+    assert not sm.rename_showcase('v2', sm.BASELINE_NAME)
+    locks = sorted(p.name for p in showcases_dir.glob(".*.lock"))
+    assert locks == ['..index.json.lock', '.v2.yaml.lock']
+    # Saving after the delete locks a fresh file
+    assert sm.save_showcase('gone', sm.load_showcase('v2'))
+    assert (showcases_dir / ".gone.yaml.lock").exists()
+
+
+def test_diff_matches_items_by_id_then_label():
+    old = {'skills': [{'category': 'Data', 'items': [{'name': 'Spark', 'level': 60}]},
+                      {'category': 'Cloud', 'items': []}],
+           'certifications': [{'name': 'CKA', '_dyb_id': 1}, {'name': 'AWS'}]}
+    new = {'skills': [{'category': 'Cloud', 'items': []},
+                      {'category': 'Data', 'items': [{'name': 'Spark', 'level': 80}]}],
+           'certifications': [{'name': 'CKAD', '_dyb_id': 1}, {'name': 'GCP'}]}
+    changes = [(c['op'], c['path'], c['field'], c['old'], c['new']) for c in sm.diff_showcases(old, new)]
+    assert changes == [
+        ('changed', 'skills › Data › items › Spark', 'level', 60, 80),
+        ('changed', 'certifications › CKAD', 'name', 'CKA', 'CKAD'),
+        ('added', 'certifications', None, None, 'GCP'),
+        ('removed', 'certifications', None, 'AWS', None),
+    ]
+
+
+def test_diff_with_many_repeated_labels():
+    old = {'languages': [{'language': 'x', 'level': i} for i in range(20000)]}
+    new = {'languages': [{'language': 'x', 'level': i} for i in range(1, 20001)]}
+    changes = sm.diff_showcases(old, new)
+    assert len(changes) == 20000 and all(c['field'] == 'level' for c in changes)
+
+
+def test_create_variant_reports_unreadable_source_and_failed_write(showcases_dir, monkeypatch):
+    (showcases_dir / "broken.yaml").write_text("key: [unclosed", encoding='utf-8')
+    assert sm.create_variant('broken', 'copy') is False
+    assert not sm.showcase_exists('copy')
+
+    monkeypatch.setattr(sm.atomic_io, 'atomic_write', lambda *args, **kwargs: (_ for _ in ()).throw(OSError("disk full")))
+    assert sm.create_variant(sm.BASELINE_NAME, 'copy') is False
+    assert not sm.showcase_exists('copy')
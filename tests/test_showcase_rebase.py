@@ -0,0 +1,55 @@
+import showcase_manager as sm
+import showcase_rebase
+
+
+def test_merge_takes_each_sides_changes():
+    base = {'summary': 'old', 'skills': [{'category': 'Data', 'items': [{'name': 'Spark', 'level': 60}]}]}
+    parent = {'summary': 'new', 'skills': [{'category': 'Data', 'items': [{'name': 'Spark', 'level': 60}]},
+                                           {'category': 'Cloud', 'items': []}]}
+    variant = {'summary': 'old', 'skills': [{'category': 'Data', 'items': [{'name': 'Spark', 'level': 90}]}]}
+    merged, conflicts = showcase_rebase.merge_showcases(base, parent, variant)
+    assert conflicts == []
+    assert merged == {'summary': 'new', 'skills': [{'category': 'Data', 'items': [{'name': 'Spark', 'level': 90}]},
+                                                   {'category': 'Cloud', 'items': []}]}
+
+
+def test_merge_conflict_keeps_variant_value():
+    merged, conflicts = showcase_rebase.merge_showcases({'summary': 'a'}, {'summary': 'b'}, {'summary': 'c'})
+    assert merged == {'summary': 'c'}
+    assert conflicts == [{'path': 'summary', 'base': 'a', 'parent': 'b', 'variant': 'c'}]
+
+
+def test_rebase_children_carries_variants_over(showcases_dir):
+    sm.create_variant(sm.BASELINE_NAME, 'lead', delta=True)
+    sm.create_variant(sm.BASELINE_NAME, 'copy')
+    variant = sm.load_showcase('lead')
+    variant['languages'] = []
+    sm.save_showcase('lead', variant)
+
+    parent = sm.load_showcase(sm.BASELINE_NAME)
+    parent['summary'] = "Updated summary"
+    sm.save_showcase(sm.BASELINE_NAME, parent)
+
+    summary = showcase_rebase.rebase_children(sm.BASELINE_NAME, workers=1)
+    assert (summary['total'], summary['changed'], summary['failed'], summary['conflicts']) == (2, 2, 0, 0)
+    sm.invalidate_cache()
+    lead, copy = sm.load_showcase('lead'), sm.load_showcase('copy')
+    assert lead['summary'] == copy['summary'] == "Updated summary"
+    assert lead['languages'] == []
+    # The old snapshot is pruned, the new one is kept
+    bases = [p.stem for p in (showcases_dir / sm.BASES_DIRNAME).glob("*.yaml")]
+    assert bases == [summary['base']]
+
+
+def test_dry_run_stores_nothing(showcases_dir):
+    sm.create_variant(sm.BASELINE_NAME, 'lead', delta=True)
+    parent = sm.load_showcase(sm.BASELINE_NAME)
+    parent['summary'] = "Updated summary"
+    sm.save_showcase(sm.BASELINE_NAME, parent)
+    before = {p.name: p.read_bytes() for p in showcases_dir.rglob("*.yaml")}
+
+    summary = showcase_rebase.rebase_children(sm.BASELINE_NAME, workers=1, dry_run=True)
+    assert (summary['total'], summary['changed']) == (1, 1)
+    assert {p.name: p.read_bytes() for p in showcases_dir.rglob("*.yaml")} == before
+    assert f"{summary['base']}.yaml" not in before
+    assert showcase_rebase.rebase_children(sm.BASELINE_NAME, workers=1)['base'] == summary['base']
@@ -0,0 +1,62 @@
+import showcase_manager as sm
+import showcase_search
+import storage
+
+
+def _segments(directory):
+    return {path.name: path.stat().st_mtime_ns for path in (directory / showcase_search.SEARCH_INDEX_DIRNAME).glob('*.json')}
+
+
+def _with_summary(name, summary):
+    data = sm.load_showcase(sm.BASELINE_NAME)
+    data['summary'] = summary
+    assert sm.save_showcase(name, data)
+
+
+def test_save_rewrites_only_its_segment(showcases_dir):
+    _with_summary('lead', "Zanzibarquux lead")
+    _with_summary('architect', "Data architect")
+    assert showcase_search.showcases_mentioning("zanzibarquux") == ['lead']
+    before = _segments(showcases_dir)
+    assert set(before) == {f"{sm.BASELINE_NAME}.json", 'lead.json', 'architect.json'}
+
+    _with_summary('architect', "Zanzibarquux architect")
+    assert showcase_search.showcases_mentioning("zanzibarquux") == ['architect', 'lead']
+    after = _segments(showcases_dir)
+    assert [name for name in after if after[name] != before[name]] == ['architect.json']
+
+
+def test_unchanged_store_skips_the_scan(showcases_dir, monkeypatch):
+    showcase_search.search("data")
+    monkeypatch.setattr(storage.YamlStore, 'stamp', lambda self, name: 1 / 0)
+    assert showcase_search.refresh() == 0
+
+
+def test_index_is_reloaded_from_segments(showcases_dir, monkeypatch):
+    _with_summary('lead', "Zanzibarquux lead")
+    showcase_search.search("zanzibarquux")
+    showcase_search.invalidate()
+    monkeypatch.setattr(storage.YamlStore, 'load', lambda self, name: 1 / 0)
+    assert showcase_search.showcases_mentioning("zanzibarquux") == ['lead']
+
+
+def test_delete_drops_the_segment(showcases_dir):
+    _with_summary('lead', "Zanzibarquux lead")
+    showcase_search.search("zanzibarquux")
+    assert sm.delete_showcase('lead')
+    assert showcase_search.search("zanzibarquux") == []
+    assert 'lead.json' not in _segments(showcases_dir)
+
+
+def test_parallel_build_matches_sequential(showcases_dir, monkeypatch):
+    for i in range(4):
+        _with_summary(f"copy{i}", f"Zanzibarquux {i}")
+    sequential = showcase_search.search("zanzibarquux data")
+
+    monkeypatch.setattr(showcase_search, 'PARALLEL_MIN', 2)
+    monkeypatch.setattr(showcase_search.os, 'cpu_count', lambda: 2)
+    for path in (showcases_dir / showcase_search.SEARCH_INDEX_DIRNAME).iterdir():
+        path.unlink()
+    showcase_search.invalidate()
+    assert showcase_search.search("zanzibarquux data") == sequential
+    assert len(_segments(showcases_dir)) == 5
@@ -0,0 +1,70 @@
+import showcase_manager as sm
+import skills_matrix
+
+
+def _save(name, category, items):
+    assert sm.save_showcase(name, {'personal_info': {'name': name}, 'skills': [{'category': category, 'items': items}]})
+
+
+def _corpus():
+    _save(sm.BASELINE_NAME, 'Data', [{'name': "Apache Spark", 'level': 80}, {'name': "Python", 'level': 60}])
+    _save('lead', 'Data', [{'name': "spark", 'level': 90}, {'name': "K8s", 'level': 70}, {'name': "Python"}])
+    _save('junior', 'Big Data', [{'name': "SPARK ", 'level': 40}])
+
+
+def test_normalize_skill():
+    assert skills_matrix.normalize_skill("  Apache Spark ") == 'spark'
+    assert skills_matrix.normalize_skill("Scikit-Learn") == skills_matrix.normalize_skill("sklearn") == 'scikit learn'
+    assert skills_matrix.normalize_skill("Sci-Kit") == 'scikit learn'
+    assert skills_matrix.normalize_skill("K8S") == 'kubernetes'
+    assert skills_matrix.normalize_skill("Élasticsearch") == 'elasticsearch'
+    assert skills_matrix.normalize_skill("C++") == 'c++'
+    assert skills_matrix.normalize_skill(None) == ''
+
+
+def test_showcases_with(showcases_dir):
+    _corpus()
+    assert skills_matrix.showcases_with({'Spark': 80}) == [(sm.BASELINE_NAME, {'spark': 80.0}), ('lead', {'spark': 90.0})]
+    assert skills_matrix.showcases_with({'spark': 50, 'python': 1}) == [(sm.BASELINE_NAME, {'spark': 80.0, 'Python': 60.0})]
+    # Not listing a skill (NaN) never qualifies, even for a minimum of 0
+    assert [name for name, _ in skills_matrix.showcases_with({'Kubernetes': 0})] == ['lead']
+    assert skills_matrix.showcases_with({'Cobol': 0}) == []
+    assert skills_matrix.showcases_with({}) == []
+
+
+def test_skill_stats(showcases_dir):
+    _corpus()
+    assert skills_matrix.skill_stats('Apache Spark') == {
+        'skill': 'spark', 'category': 'Data', 'showcases': 3, 'rated': 3,
+        'mean': 70.0, 'median': 80.0, 'min': 40.0, 'max': 90.0
+    }
+    # Listed without a level: counted, but not in the level statistics
+    python = skills_matrix.skill_stats('python')
+    assert (python['showcases'], python['rated'], python['mean']) == (2, 1, 60.0)
+    assert skills_matrix.skill_stats('spark', names=['junior', 'missing'])['max'] == 40.0
+    assert skills_matrix.skill_stats('Cobol') is None
+
+
+def test_top_skills(showcases_dir):
+    _corpus()
+    assert skills_matrix.top_skills() == [
+        {'skill': 'spark', 'category': 'Data', 'showcases': 3, 'mean': 70.0},
+        {'skill': 'Python', 'category': 'Data', 'showcases': 2, 'mean': 60.0},
+        {'skill': 'K8s', 'category': 'Data', 'showcases': 1, 'mean': 70.0},
+    ]
+    assert len(skills_matrix.top_skills(limit=1)) == 1
+
+
+def test_refresh_picks_up_saved_showcases(showcases_dir):
+    _corpus()
+    assert skills_matrix.matrix().names == [sm.BASELINE_NAME, 'junior', 'lead']
+    assert skills_matrix.refresh() == 0
+
+    _save('architect', 'Streaming', [{'name': "Apache Kafka", 'level': 75}])
+    assert skills_matrix.refresh() == 1
+    assert skills_matrix.showcases_with({'kafka': 70}) == [('architect', {'Apache Kafka': 75.0})]
+    assert (showcases_dir / skills_matrix.SKILLS_INDEX_NAME).exists()
+
+    assert sm.delete_showcase('junior')
+    assert skills_matrix.refresh() == 1
+    assert skills_matrix.skill_stats('spark')['showcases'] == 2
@@ -0,0 +1,58 @@
+import datetime
+
+import showcase_manager as sm
+import showcase_search
+import storage
+
+
+def test_sqlite_store_round_trip(showcases_dir, tmp_path):
+    store = storage.SqliteStore(tmp_path / "showcases.db")
+    assert storage.migrate(storage.YamlStore(), store) == 1
+    baseline = sm.load_showcase(sm.BASELINE_NAME)
+    assert store.load(sm.BASELINE_NAME) == baseline
+
+    assert store.create_variant(sm.BASELINE_NAME, 'lead', "Lead roles")
+    variant = store.load('lead')
+    assert variant['_variant_info']['created_from'] == sm.BASELINE_NAME
+    stamp = store.stamp('lead')
+    variant['summary'] = "Updated"
+    assert store.save('lead', variant)
+    assert store.load('lead') == variant
+    assert store.stamp('lead') != stamp
+    assert store.list() == [sm.BASELINE_NAME, 'lead']
+
+
+def test_search_follows_the_configured_store(showcases_dir, tmp_path, monkeypatch):
+    database = tmp_path / "db" / "showcases.db"
+    monkeypatch.setenv('DC_STORAGE', f"sqlite:{database}")
+    store = storage.default_store()
+    storage.migrate(storage.YamlStore(), store)
+    data = store.load(sm.BASELINE_NAME)
+    data['summary'] = "Zanzibarquux specialist"
+    store.save(sm.BASELINE_NAME, data)
+
+    assert [hit['showcase'] for hit in showcase_search.search("zanzibarquux")] == [sm.BASELINE_NAME]
+    assert store.sidecar_path(showcase_search.SEARCH_INDEX_DIRNAME).exists()
+    assert not (showcases_dir / showcase_search.SEARCH_INDEX_DIRNAME).exists()
+    monkeypatch.delenv('DC_STORAGE')
+    assert showcase_search.search("zanzibarquux") == []
+
+
+def test_sqlite_save_serialises_dates_and_reports_failures(showcases_dir, tmp_path):
+    store = storage.SqliteStore(tmp_path / "showcases.db")
+    data = sm.load_showcase(sm.BASELINE_NAME)
+    data['experience'][0]['start_date'] = datetime.date(2020, 3, 1)
+    assert store.save(sm.BASELINE_NAME, data)
+    assert store.load(sm.BASELINE_NAME)['experience'][0]['start_date'] == "2020-03-01"
+
+    data['summary'] = object()
+    assert store.save(sm.BASELINE_NAME, data) is False
+    assert store.load(sm.BASELINE_NAME)['summary'] != data['summary']
+
+
+def test_sqlite_split_key_keeps_non_list_values(tmp_path):
+    store = storage.SqliteStore(tmp_path / "showcases.db")
+    for experience in (None, "see LinkedIn", [], [{'title': "Analyst"}], None):
+        data = {'summary': "Engineer", 'experience': experience}
+        assert store.save('lead', data)
+        assert store.load('lead') == data
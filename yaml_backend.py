@@ -0,0 +1,31 @@
+"""
+YAML Backend - Single entry point for reading and writing showcase YAML
+
+Uses the libyaml C loader/dumper when PyYAML was built with it, and falls
+back to the pure-Python implementation otherwise. Output is byte-identical
+between both backends for the dump options used by this project.
+"""
+
+import yaml
+from typing import Any, Optional, TextIO, Union
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    HAS_LIBYAML = False
+
+# libyaml cannot take float('inf') as width; INT_MAX is equivalent for both emitters
+UNLIMITED_WIDTH = 2**31 - 1
+
+
+def load(stream: Union[str, bytes, TextIO]) -> Any:
+    """Parse a YAML document (string, bytes or stream)"""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data: Any, stream: Optional[TextIO] = None, width: int = UNLIMITED_WIDTH) -> Optional[str]:
+    """Serialise data as block-style YAML (returns a string when no stream is given)"""
+    return yaml.dump(data, stream, Dumper=SafeDumper, allow_unicode=True, sort_keys=False,
+                     default_flow_style=False, width=width)